@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import codecs
+import os
+import selectors
+import subprocess
+import sys
+import traceback
+from contextlib import contextmanager, suppress
+from typing import IO, TYPE_CHECKING, NamedTuple, cast
+
+from django.db import close_old_connections, connections
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+    from io import TextIOBase
+    from typing import TextIO
+
+MAX_LINE_LENGTH = 64 * 1024
+
+DATABASE_OPTION = "--database"
+
+PIPE_OPERATOR = "|"
+
+
+class _Pipe(NamedTuple):
+    step: int
+    prefix: str
+    stream: TextIO | TextIOBase
+    decoder: codecs.IncrementalDecoder
+    partial_line: list[str]
+
+
+def _write_lines(pipe: _Pipe, data: bytes, *, final: bool = False) -> None:
+    text = "".join(pipe.partial_line) + pipe.decoder.decode(data, final=final)
+
+    *lines, partial_line = text.split("\n")
+    if final and partial_line:
+        lines.append(partial_line)
+        partial_line = ""
+
+    while len(partial_line) > MAX_LINE_LENGTH:
+        lines.append(partial_line[:MAX_LINE_LENGTH])
+        partial_line = partial_line[MAX_LINE_LENGTH:]
+
+    pipe.partial_line[:] = [partial_line] if partial_line else []
+
+    if lines:
+        pipe.stream.write("".join(f"{pipe.prefix}{line}\n" for line in lines))
+        pipe.stream.flush()
+
+
+def split_pipeline(alias_expr: str) -> list[list[str]]:
+    pipeline: list[list[str]] = [[]]
+    for arg in alias_expr.split():
+        if arg == PIPE_OPERATOR:
+            pipeline.append([])
+        else:
+            pipeline[-1].append(arg)
+
+    return pipeline
+
+
+def _set_pipe_size(file: IO[bytes], size: int) -> None:
+    with suppress(ImportError, AttributeError, OSError):
+        import fcntl  # noqa: PLC0415
+
+        fcntl.fcntl(file.fileno(), fcntl.F_SETPIPE_SZ, size)
+
+
+def _get_exit_code(returncode: int) -> int:
+    return returncode if returncode >= 0 else 128 - returncode
+
+
+def _get_pipeline_exit_code(returncodes: Sequence[int]) -> int:
+    return next(filter(None, map(_get_exit_code, reversed(returncodes))), 0)
+
+
+def _start_pipeline(
+    prefix_argv: Sequence[str],
+    pipeline: Sequence[Sequence[str]],
+    *,
+    env: Mapping[str, str] | None = None,
+    pipe_size: int | None = None,
+) -> list[subprocess.Popen[bytes]]:
+    processes: list[subprocess.Popen[bytes]] = []
+
+    stdin: IO[bytes] | int = subprocess.DEVNULL
+    try:
+        for argv in pipeline:
+            process = subprocess.Popen(  # noqa: S603
+                [*prefix_argv, *argv],
+                stdin=stdin,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=env,
+            )
+
+            if not isinstance(stdin, int):
+                stdin.close()
+
+            stdin = cast("IO[bytes]", process.stdout)
+            if pipe_size is not None:
+                _set_pipe_size(stdin, pipe_size)
+
+            processes.append(process)
+    except BaseException:
+        _stop_processes(processes)
+        raise
+
+    return processes
+
+
+def _stop_processes(processes: Sequence[subprocess.Popen[bytes]]) -> None:
+    for process in processes:
+        process.kill()
+
+    for process in processes:
+        process.wait()
+
+        for file in (process.stdout, process.stderr):
+            if file:
+                file.close()
+
+
+def run_in_subprocesses(  # noqa: PLR0913
+    prefix_argv: Sequence[str],
+    alias_exprs: Sequence[str],
+    *,
+    stdout: TextIO | TextIOBase,
+    stderr: TextIO | TextIOBase,
+    workers: int = 1,
+    order: Sequence[int] | None = None,
+    env: Mapping[str, str] | None = None,
+    pipe_size: int | None = None,
+) -> list[int | None]:
+    pipelines = [split_pipeline(alias_expr) for alias_expr in alias_exprs]
+
+    width = max(len(argv[0]) for pipeline in pipelines for argv in pipeline)
+    exit_codes: list[int | None] = [None] * len(pipelines)
+
+    processes: dict[int, list[subprocess.Popen[bytes]]] = {}
+    open_pipes: dict[int, int] = {}
+
+    pending = list(order) if order is not None else list(range(len(pipelines)))
+    failed = False
+
+    with selectors.DefaultSelector() as selector:
+
+        def register(
+            step: int,
+            file: IO[bytes],
+            name: str,
+            stream: TextIO | TextIOBase,
+        ) -> None:
+            os.set_blocking(file.fileno(), False)
+
+            selector.register(
+                file,
+                selectors.EVENT_READ,
+                _Pipe(
+                    step,
+                    f"[{name:<{width}}] ",
+                    stream,
+                    codecs.getincrementaldecoder("utf-8")(errors="replace"),
+                    [],
+                ),
+            )
+
+        def start(step: int) -> None:
+            pipeline = pipelines[step]
+
+            processes[step] = step_processes = _start_pipeline(
+                prefix_argv,
+                pipeline,
+                env=env,
+                pipe_size=pipe_size,
+            )
+            open_pipes[step] = len(step_processes) + 1
+
+            for argv, process in zip(pipeline, step_processes):
+                register(step, cast("IO[bytes]", process.stderr), argv[0], stderr)
+
+            register(
+                step,
+                cast("IO[bytes]", step_processes[-1].stdout),
+                pipeline[-1][0],
+                stdout,
+            )
+
+        while pending or processes:
+            while pending and not failed and len(processes) < workers:
+                start(pending.pop(0))
+
+            if not processes:
+                break
+
+            for key, _ in selector.select():
+                pipe: _Pipe = key.data
+
+                if data := os.read(key.fd, MAX_LINE_LENGTH):
+                    _write_lines(pipe, data)
+                    continue
+
+                _write_lines(pipe, b"", final=True)
+
+                selector.unregister(key.fileobj)
+                key.fileobj.close()  # type: ignore[union-attr]
+
+                open_pipes[pipe.step] -= 1
+                if not open_pipes[pipe.step]:
+                    exit_code = _get_pipeline_exit_code(
+                        [process.wait() for process in processes.pop(pipe.step)],
+                    )
+
+                    exit_codes[pipe.step] = exit_code
+                    failed = failed or bool(exit_code)
+
+    return exit_codes
+
+
+def _run_forked_step(run_step: Callable[[list[str]], object], argv: list[str]) -> int:
+    try:
+        run_step(argv)
+    except SystemExit as exc:
+        exit_code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    except BaseException:  # noqa: BLE001
+        traceback.print_exc()
+        exit_code = 1
+    else:
+        exit_code = 0
+
+    for stream in (sys.stdout, sys.stderr):
+        with suppress(Exception):
+            stream.flush()
+
+    return exit_code
+
+
+def run_in_forks(
+    run_step: Callable[[list[str]], object],
+    alias_exprs: Sequence[str],
+) -> list[int | None]:
+    exit_codes: list[int | None] = [None] * len(alias_exprs)
+
+    for step, alias_expr in enumerate(alias_exprs):
+        connections.close_all()
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        if not (pid := os.fork()):
+            os._exit(_run_forked_step(run_step, alias_expr.split()))
+
+        _, status = os.waitpid(pid, 0)
+
+        exit_codes[step] = _get_exit_code(os.waitstatus_to_exitcode(status))
+
+        if exit_codes[step]:
+            break
+
+    return exit_codes
+
+
+def get_step_databases(argv: Sequence[str]) -> list[str]:
+    databases = []
+    for index, arg in enumerate(argv):
+        if arg == DATABASE_OPTION and index + 1 < len(argv):
+            databases.append(argv[index + 1])
+        elif arg.startswith(f"{DATABASE_OPTION}="):
+            databases.append(arg.partition("=")[2])
+
+    return [
+        database
+        for database in dict.fromkeys(databases)
+        if database in connections.settings
+    ]
+
+
+@contextmanager
+def manage_step_connections(
+    argv: Sequence[str],
+    *,
+    preconnect: bool = False,
+) -> Iterator[None]:
+    if any(
+        connection.in_atomic_block
+        for connection in connections.all(initialized_only=True)
+    ):
+        yield
+        return
+
+    close_old_connections()
+
+    if preconnect:
+        for database in get_step_databases(argv):
+            connections[database].ensure_connection()
+
+    try:
+        yield
+    finally:
+        close_old_connections()
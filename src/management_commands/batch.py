@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import csv
+import json
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import django
+
+from .conf import settings
+from .core import get_command_class, resolve_command_name
+from .exceptions import CommandArgvSetError
+from .execution import CommandResult, run_command
+from .spooling import hand_over_output
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+
+def _options_to_argv(options: dict[str, Any]) -> list[str]:
+    argv: list[str] = []
+    for key, value in options.items():
+        option = f"--{key.replace('_', '-')}"
+
+        if value is None or value is False:
+            continue
+        if value is True:
+            argv.append(option)
+        elif isinstance(value, list):
+            for item in value:
+                argv.extend([option, str(item)])
+        else:
+            argv.extend([option, str(value)])
+
+    return argv
+
+
+def _iter_json_lines_argv_sets(path: Path) -> Iterator[list[str]]:
+    with path.open(encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise CommandArgvSetError(str(path), line_number) from exc
+
+            if isinstance(item, list):
+                yield [str(arg) for arg in item]
+            elif isinstance(item, dict):
+                yield _options_to_argv(item)
+            else:
+                raise CommandArgvSetError(str(path), line_number)
+
+
+def _iter_csv_argv_sets(path: Path) -> Iterator[list[str]]:
+    with path.open(encoding="utf-8", newline="") as file:
+        for row in csv.DictReader(file):
+            yield _options_to_argv({key: value or None for key, value in row.items()})
+
+
+def read_argv_sets(path: str | Path) -> list[list[str]]:
+    path = Path(path)
+
+    if path.suffix.lower() == ".csv":
+        return list(_iter_csv_argv_sets(path))
+
+    return list(_iter_json_lines_argv_sets(path))
+
+
+def _warm_up_worker(name: str) -> None:
+    django.setup()
+
+    if (name := resolve_command_name(name)) in settings.PATHS or (
+        name not in settings.ALIASES
+    ):
+        get_command_class(name)
+
+
+def _run_command_in_worker(name: str, argv: list[str]) -> CommandResult:
+    result = run_command(name, argv)
+
+    hand_over_output(result.stdout)
+    hand_over_output(result.stderr)
+
+    return result
+
+
+def _create_executor(name: str, workers: int | None) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_warm_up_worker,
+        initargs=(name,),
+    )
+
+
+def map_command(
+    name: str,
+    argv_sets: Sequence[Sequence[str]],
+    *,
+    workers: int | None = None,
+    retries: int = 0,
+    callback: Callable[[int, CommandResult, int], None] | None = None,
+) -> list[CommandResult]:
+    results: dict[int, CommandResult] = {}
+
+    executor = _create_executor(name, workers)
+    try:
+        pending = list(range(len(argv_sets)))
+
+        for attempt in range(retries + 1):
+            futures = {
+                executor.submit(
+                    _run_command_in_worker,
+                    name,
+                    list(argv_sets[index]),
+                ): index
+                for index in pending
+            }
+
+            broken = False
+            pending = []
+            for future in as_completed(futures):
+                index = futures[future]
+
+                try:
+                    result = future.result()
+                except BrokenExecutor as exc:
+                    result = CommandResult(
+                        [name, *argv_sets[index]],
+                        1,
+                        "",
+                        f"{type(exc).__name__}: {exc}\n",
+                        0.0,
+                    )
+                    broken = True
+
+                results[index] = result
+
+                if result.exit_code:
+                    pending.append(index)
+
+                if callback:
+                    callback(index, result, attempt)
+
+            if not pending:
+                break
+
+            pending.sort()
+
+            if broken:
+                executor.shutdown()
+                executor = _create_executor(name, workers)
+    finally:
+        executor.shutdown()
+
+    return [results[index] for index in range(len(argv_sets))]
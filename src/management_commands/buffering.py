@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import os
+import signal
+import sys
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import TYPE_CHECKING, Any, TextIO
+
+from django.core.management.base import OutputWrapper
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import FrameType
+
+    from django.core.management.base import BaseCommand
+
+FLUSH_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGTERM", "SIGHUP") if hasattr(signal, name)
+)
+
+
+def _identity(msg: str) -> str:
+    return msg
+
+
+class BufferedOutputWrapper(OutputWrapper):
+    def __init__(self, out: TextIO, ending: str = "\n", *, buffer_size: int) -> None:
+        self.buffer_size = buffer_size
+
+        self._stream = out
+
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._styled = False
+
+        super().__init__(out, ending)
+
+    @property
+    def style_func(self) -> Callable[[str], str]:
+        return self._style_func
+
+    @style_func.setter
+    def style_func(self, style_func: Callable[[str], str] | None) -> None:
+        self._styled = bool(style_func and self.isatty())
+        self._style_func = style_func if style_func and self._styled else _identity
+
+    def write(  # type: ignore[override]
+        self,
+        msg: str = "",
+        style_func: Callable[[str], str] | None = None,
+        ending: str | None = None,
+    ) -> None:
+        ending = self.ending if ending is None else ending
+        if ending and not msg.endswith(ending):
+            msg += ending
+
+        if style_func is not None:
+            msg = style_func(msg)
+        elif self._styled:
+            msg = self._style_func(msg)
+
+        self._buffer.append(msg)
+        self._buffered += len(msg)
+
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            data = "".join(self._buffer)
+
+            self._buffer.clear()
+            self._buffered = 0
+
+            self._stream.write(data)
+
+        super().flush()
+
+
+@contextmanager
+def _flush_on_signals(stream: BufferedOutputWrapper) -> Iterator[None]:
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def handle_signal(signum: int, frame: FrameType | None) -> None:
+        stream.flush()
+
+        previous_handler = previous_handlers[signum]
+        signal.signal(signum, previous_handler)
+
+        if callable(previous_handler):
+            previous_handler(signum, frame)
+        else:
+            os.kill(os.getpid(), signum)
+
+    previous_handlers = {
+        signum: handler
+        for signum in FLUSH_SIGNALS
+        if (handler := signal.getsignal(signum)) is not signal.SIG_IGN
+    }
+
+    for signum in previous_handlers:
+        signal.signal(signum, handle_signal)
+
+    try:
+        yield
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+
+def buffer_output(command: BaseCommand, buffer_size: int) -> None:
+    stdout = BufferedOutputWrapper(sys.stdout, buffer_size=buffer_size)
+
+    command.stdout = stdout
+
+    execute = command.execute
+
+    @wraps(execute)
+    def execute_buffered(*args: Any, **options: Any) -> Any:
+        with _flush_on_signals(stdout):
+            try:
+                return execute(*args, **options)
+            finally:
+                stdout.flush()
+
+    command.execute = execute_buffered  # type: ignore[method-assign]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import suppress
+from importlib.util import find_spec
+from pathlib import Path
+
+import django
+from django.apps.registry import apps
+from django.core.management.color import supports_color
+
+from . import __version__
+from .conf import settings
+from .core import get_command_packages
+
+
+def _get_package_locations(package: str) -> list[str]:
+    if app_configs := [
+        app_config
+        for app_config in apps.get_app_configs()
+        if package.startswith(f"{app_config.name}.")
+    ]:
+        app_config = max(app_configs, key=lambda app_config: len(app_config.name))
+        submodule = package.removeprefix(f"{app_config.name}.")
+
+        return [str(Path(app_config.path, *submodule.split(".")))]
+
+    try:
+        spec = find_spec(package)
+    except ImportError:
+        return []
+
+    return list(spec.submodule_search_locations or []) if spec else []
+
+
+def get_mtime(path: str | Path) -> int | None:
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_help_fingerprint(prog_name: str, *, commands_only: bool) -> str:
+    locations = [
+        location
+        for package in get_command_packages()
+        for location in _get_package_locations(package)
+    ]
+
+    data = {
+        "versions": [django.get_version(), __version__],
+        "prog_name": prog_name,
+        "commands_only": commands_only,
+        "color": [supports_color(), os.environ.get("DJANGO_COLORS")],
+        "apps": [app_config.name for app_config in apps.get_app_configs()],
+        "settings": [
+            settings.PATHS,
+            settings.MODULES,
+            settings.SUBMODULES,
+            settings.ALIASES,
+        ],
+        "mtimes": {location: get_mtime(location) for location in locations},
+    }
+
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode(),
+    ).hexdigest()
+
+
+def read_cache(cache_dir: str, key: str) -> str | None:
+    try:
+        return (Path(cache_dir) / key).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def write_cache(cache_dir: str, key: str, value: str) -> None:
+    with suppress(OSError):
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=cache_dir,
+            delete=False,
+        ) as file:
+            file.write(value)
+
+        Path(file.name).replace(Path(cache_dir) / key)
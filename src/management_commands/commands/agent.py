@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from management_commands.commands.coordinator import parse_address
+from management_commands.coordination import run_agent
+from management_commands.exceptions import ManagementCommandsException
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+    from management_commands.execution import CommandResult
+
+
+class Command(BaseCommand):
+    help = "Runs argument sets handed out by a coordinator until all are processed."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--connect",
+            type=parse_address,
+            default="127.0.0.1:8765",
+            metavar="HOST:PORT",
+            help="Address of the coordinator (default: 127.0.0.1:8765).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1,
+            help="Number of argument sets fetched at once (default: 1).",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        self.verbosity = options["verbosity"]
+
+        try:
+            processed = run_agent(
+                options["connect"],
+                batch_size=options["batch_size"],
+                stdout=self.stdout,
+                stderr=self.stderr,
+                callback=self.report_progress,
+            )
+        except (OSError, ManagementCommandsException) as exc:
+            raise CommandError(exc) from exc
+
+        if self.verbosity >= 1:
+            self.stderr.write(f"{processed} argument sets processed.")
+
+    def report_progress(self, item: int, result: CommandResult) -> None:
+        if self.verbosity < 1:
+            return
+
+        status = (
+            self.style.ERROR(f"FAILED (exit code {result.exit_code})")
+            if result.exit_code
+            else self.style.SUCCESS("OK")
+        )
+
+        self.stderr.write(
+            f"#{item} {' '.join(result.argv)}: {status} ({result.duration:.2f}s)",
+        )
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import py_compile
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from management_commands.compilation import compile_modules, get_command_module_paths
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+
+class Command(BaseCommand):
+    help = "Precompiles all modules of commands discoverable by the plugin to bytecode."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of worker processes (defaults to the number of CPUs).",
+        )
+        parser.add_argument(
+            "--invalidation-mode",
+            choices=[
+                mode.name.lower().replace("_", "-")
+                for mode in py_compile.PycInvalidationMode
+            ],
+            default="timestamp",
+            help="Invalidation mode of the generated bytecode files.",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        module_paths = get_command_module_paths()
+
+        invalidation_mode = py_compile.PycInvalidationMode[
+            options["invalidation_mode"].upper().replace("-", "_")
+        ]
+
+        failed = 0
+        for result in compile_modules(
+            module_paths,
+            invalidation_mode=invalidation_mode,
+            workers=options["workers"],
+        ):
+            duration = f"{result.duration * 1000:.1f} ms"
+
+            if result.error:
+                failed += 1
+
+                self.stderr.write(
+                    f"{self.style.ERROR('FAILED')} {result.module} ({duration})\n"
+                    f"{result.error}",
+                )
+            elif options["verbosity"] >= 1:
+                self.stdout.write(
+                    f"{self.style.SUCCESS('OK')} {result.module} ({duration})",
+                )
+
+        if failed:
+            msg = f"{failed} of {len(module_paths)} modules failed to compile"
+            raise CommandError(msg)
+
+        if options["verbosity"] >= 1:
+            self.stdout.write(f"{len(module_paths)} modules compiled")
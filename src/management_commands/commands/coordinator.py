@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from management_commands.batch import read_argv_sets
+from management_commands.coordination import Coordinator
+from management_commands.exceptions import CommandArgvSetError
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+    from management_commands.coordination import WorkItemResult
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    host, _, port = address.rpartition(":")
+
+    return host or "127.0.0.1", int(port)
+
+
+class Command(BaseCommand):
+    help = (
+        "Distributes argument sets of a command among agents connecting over TCP "
+        "and collects their results."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "command_name",
+            help="Name of the command or alias to run.",
+        )
+        parser.add_argument(
+            "argv_sets",
+            help=(
+                "Path to a file with argument sets: JSON lines (lists of arguments "
+                "or objects of options) or CSV (columns of options)."
+            ),
+        )
+        parser.add_argument(
+            "--bind",
+            type=parse_address,
+            default="127.0.0.1:8765",
+            metavar="HOST:PORT",
+            help="Address to listen on for agents (default: 127.0.0.1:8765).",
+        )
+        parser.add_argument(
+            "--retries",
+            type=int,
+            default=0,
+            help=(
+                "Number of times failed argument sets are retried, preferably on "
+                "other agents."
+            ),
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        try:
+            argv_sets = read_argv_sets(options["argv_sets"])
+        except (OSError, CommandArgvSetError) as exc:
+            raise CommandError(exc) from exc
+
+        self.total = len(argv_sets)
+        self.completed = 0
+        self.verbosity = options["verbosity"]
+
+        coordinator = Coordinator(
+            options["command_name"],
+            argv_sets,
+            retries=options["retries"],
+            callback=self.report_progress,
+        )
+
+        try:
+            host, port = coordinator.start(options["bind"])
+        except OSError as exc:
+            raise CommandError(exc) from exc
+
+        try:
+            if self.verbosity >= 1:
+                self.stderr.write(
+                    f"Waiting for agents on {host}:{port} "
+                    f"({self.total} argument sets).",
+                )
+
+            results = coordinator.wait()
+        finally:
+            coordinator.stop()
+
+        if failed := sum(bool(result.exit_code) for result in results):
+            msg = f"{failed} of {len(results)} argument sets failed"
+            raise CommandError(msg)
+
+        if self.verbosity >= 1:
+            self.stderr.write(
+                self.style.SUCCESS(f"{len(results)} argument sets succeeded"),
+            )
+
+    def report_progress(self, result: WorkItemResult) -> None:
+        if result.attempt == 1:
+            self.completed += 1
+
+        if self.verbosity < 1:
+            return
+
+        status = (
+            self.style.ERROR(f"FAILED (exit code {result.exit_code})")
+            if result.exit_code
+            else self.style.SUCCESS("OK")
+        )
+        retry_info = f" [retry {result.attempt - 1}]" if result.attempt > 1 else ""
+
+        self.stderr.write(
+            f"[{self.completed}/{self.total}] #{result.item}{retry_info} "
+            f"{' '.join(result.argv)} on {result.agent}: {status} "
+            f"({result.duration:.2f}s)",
+        )
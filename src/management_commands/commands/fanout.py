@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import argparse
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from management_commands.conf import settings
+from management_commands.core import get_command_class
+from management_commands.exceptions import ManagementCommandsException
+from management_commands.fanout import fan_out, match_databases
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+    from management_commands.fanout import DatabaseResult
+
+
+class Command(BaseCommand):
+    help = "Runs a command concurrently against multiple databases."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--databases",
+            action="append",
+            metavar="PATTERN",
+            help=(
+                "Glob pattern of database aliases to run the command against; "
+                "may be repeated (defaults to all databases)."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Maximum number of databases processed concurrently.",
+        )
+        parser.add_argument(
+            "command_name",
+            help="Name of the command to run; it must accept the --database option.",
+        )
+        parser.add_argument(
+            "command_args",
+            nargs=argparse.REMAINDER,
+            help="Arguments and options passed to the command.",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        name: str = options["command_name"]
+
+        if name not in settings.ALIASES:
+            try:
+                get_command_class(name)
+            except ManagementCommandsException as exc:
+                raise CommandError(exc) from exc
+
+        if not (databases := match_databases(options["databases"] or ["*"])):
+            msg = "no databases match the given patterns"
+            raise CommandError(msg)
+
+        results = fan_out(
+            name,
+            options["command_args"],
+            databases,
+            stdout=self.stdout,
+            stderr=self.stderr,
+            workers=options["workers"],
+        )
+
+        self.report_results(results)
+
+    def report_results(self, results: list[DatabaseResult]) -> None:
+        width = max(len(database) for database, _ in results)
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Summary:"))
+        for database, result in results:
+            status = (
+                self.style.ERROR(f"FAILED (exit code {result.exit_code})")
+                if result.exit_code
+                else self.style.SUCCESS("OK")
+            )
+
+            self.stdout.write(
+                f"  {database:<{width}}  {status} ({result.duration:.2f}s)",
+            )
+
+        if failed := sum(bool(result.exit_code) for _, result in results):
+            msg = f"command failed on {failed} of {len(results)} databases"
+            raise CommandError(msg)
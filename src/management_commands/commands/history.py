@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from management_commands.conf import settings
+from management_commands.history import get_command_names, get_runs, summarize_runs
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+    from management_commands.history import Run
+
+
+def format_duration(duration: float | None) -> str:
+    return f"{duration * 1000:.1f} ms" if duration is not None else "-"
+
+
+def format_memory(peak_memory: int | None) -> str:
+    return f"{peak_memory / 2**20:.1f} MiB" if peak_memory is not None else "-"
+
+
+class Command(BaseCommand):
+    help = "Shows recorded runtimes of commands and flags performance regressions."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "command_name",
+            nargs="?",
+            help="Name of the command to show the individual runs of.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Number of the most recent runs taken into account (default: 20).",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=1.5,
+            help=(
+                "Ratio of the latest runtime to the median of the previous ones "
+                "above which a regression is reported (default: 1.5)."
+            ),
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        if not (path := settings.HISTORY_DB):
+            msg = "history of runs is not recorded; set MANAGEMENT_COMMANDS_HISTORY_DB"
+            raise CommandError(msg)
+
+        try:
+            if name := options["command_name"]:
+                self.report_runs(get_runs(path, name, options["limit"]))
+            else:
+                self.report_summaries(path, options["limit"], options["threshold"])
+        except sqlite3.Error as exc:
+            msg = f"history database {path!r} could not be read: {exc}"
+            raise CommandError(msg) from exc
+
+    def report_runs(self, runs: list[Run]) -> None:
+        for run in runs:
+            started_at = (
+                datetime.fromtimestamp(run.started_at, timezone.utc)
+                .astimezone()
+                .strftime("%Y-%m-%d %H:%M:%S")
+            )
+            status = (
+                self.style.SUCCESS("OK")
+                if not run.exit_code
+                else self.style.ERROR(f"EXIT {run.exit_code}")
+            )
+            alias = f" [{run.alias}]" if run.alias else ""
+
+            self.stdout.write(
+                f"{started_at} {status} {format_duration(run.duration)} "
+                f"{format_memory(run.peak_memory)} "
+                f"{' '.join([run.name, *run.argv])}{alias}",
+            )
+
+    def report_summaries(self, path: str, limit: int, threshold: float) -> None:
+        for name in get_command_names(path):
+            summary = summarize_runs(
+                name,
+                get_runs(path, name, limit),
+                threshold=threshold,
+            )
+
+            line = (
+                f"{summary.name}: {summary.runs} runs, {summary.failures} failed, "
+                f"p50 {format_duration(summary.p50)}, "
+                f"p95 {format_duration(summary.p95)}, "
+                f"latest {format_duration(summary.latest)}"
+            )
+
+            if summary.regressed:
+                self.stdout.write(f"{line} {self.style.WARNING('REGRESSED')}")
+            else:
+                self.stdout.write(line)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from management_commands.batch import map_command, read_argv_sets
+from management_commands.conf import settings
+from management_commands.core import get_command_class
+from management_commands.exceptions import (
+    CommandArgvSetError,
+    ManagementCommandsException,
+)
+from management_commands.spooling import iter_output
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+    from management_commands.execution import CommandResult
+
+
+class Command(BaseCommand):
+    help = "Runs a command once per argument set on a pool of worker processes."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "command_name",
+            help="Name of the command or alias to run.",
+        )
+        parser.add_argument(
+            "argv_sets",
+            help=(
+                "Path to a file with argument sets: JSON lines (lists of arguments "
+                "or objects of options) or CSV (columns of options)."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of worker processes (defaults to the number of CPUs).",
+        )
+        parser.add_argument(
+            "--retries",
+            type=int,
+            default=0,
+            help="Number of times failed argument sets are retried.",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        name: str = options["command_name"]
+
+        if name not in settings.ALIASES:
+            try:
+                get_command_class(name)
+            except ManagementCommandsException as exc:
+                raise CommandError(exc) from exc
+
+        try:
+            argv_sets = read_argv_sets(options["argv_sets"])
+        except (OSError, CommandArgvSetError) as exc:
+            raise CommandError(exc) from exc
+
+        self.completed = 0
+
+        results = map_command(
+            name,
+            argv_sets,
+            workers=options["workers"],
+            retries=options["retries"],
+            callback=partial(
+                self.report_progress,
+                total=len(argv_sets),
+                verbosity=options["verbosity"],
+            ),
+        )
+
+        self.report_results(results, verbosity=options["verbosity"])
+
+    def report_progress(
+        self,
+        index: int,
+        result: CommandResult,
+        attempt: int,
+        *,
+        total: int,
+        verbosity: int,
+    ) -> None:
+        if not attempt:
+            self.completed += 1
+
+        if verbosity < 1:
+            return
+
+        status = (
+            self.style.ERROR(f"FAILED (exit code {result.exit_code})")
+            if result.exit_code
+            else self.style.SUCCESS("OK")
+        )
+        retry_info = f" [retry {attempt}]" if attempt else ""
+
+        self.stderr.write(
+            f"[{self.completed}/{total}] #{index}{retry_info} "
+            f"{' '.join(result.argv)}: {status} ({result.duration:.2f}s)",
+        )
+
+    def report_results(self, results: list[CommandResult], *, verbosity: int) -> None:
+        failed = 0
+        for result in results:
+            for chunk in iter_output(result.stdout):
+                self.stdout.write(chunk, ending="")
+
+            if result.exit_code:
+                failed += 1
+
+                for chunk in iter_output(result.stderr):
+                    self.stderr.write(chunk, ending="")
+
+        if failed:
+            msg = f"{failed} of {len(results)} argument sets failed"
+            raise CommandError(msg)
+
+        if verbosity >= 1:
+            self.stderr.write(
+                self.style.SUCCESS(f"{len(results)} argument sets succeeded"),
+            )
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+
+from management_commands.conf import settings
+from management_commands.core import get_command_class
+from management_commands.exceptions import ManagementCommandsException
+from management_commands.execution import run_command
+from management_commands.fanout import PrefixedStream
+from management_commands.scheduling import Scheduler, get_scheduled_jobs
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+    from management_commands.scheduling import ScheduledJob, ScheduleEvent
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs commands scheduled by MANAGEMENT_COMMANDS_SCHEDULE in a single, "
+        "resident process."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Maximum number of jobs running concurrently (default: 4).",
+        )
+        parser.add_argument(
+            "--misfire-grace-time",
+            type=int,
+            default=60,
+            metavar="SECONDS",
+            help=(
+                "Maximum delay after which a job that could not be started on time "
+                "is still run (default: 60)."
+            ),
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        if not (jobs := get_scheduled_jobs()):
+            msg = "no jobs scheduled; set MANAGEMENT_COMMANDS_SCHEDULE"
+            raise CommandError(msg)
+
+        for job in jobs:
+            if (name := job.command_expr.split()[0]) not in settings.ALIASES:
+                try:
+                    get_command_class(name)
+                except ManagementCommandsException as exc:
+                    raise CommandError(exc) from exc
+
+        self.lock = threading.Lock()
+
+        scheduler = Scheduler(
+            jobs,
+            self.run_job,
+            workers=options["workers"],
+            misfire_grace_time=timedelta(seconds=options["misfire_grace_time"]),
+        )
+
+        self.write(f"Scheduler started with {len(jobs)} jobs.")
+
+        try:
+            while True:
+                for event in scheduler.tick(self.now()):
+                    if event.status != "started":
+                        self.report_event(event)
+
+                self.sleep()
+        except KeyboardInterrupt:
+            self.write("Scheduler stopping; waiting for running jobs to finish.")
+        finally:
+            scheduler.shutdown()
+
+    def now(self) -> datetime:
+        return datetime.now(tz=timezone.get_current_timezone())
+
+    def sleep(self) -> None:
+        now = self.now()
+
+        time.sleep(60 - now.second - now.microsecond / 1_000_000)
+
+    def write(self, msg: str) -> None:
+        with self.lock:
+            self.stdout.write(msg)
+
+    def report_event(self, event: ScheduleEvent) -> None:
+        self.write(
+            f"[{event.scheduled_at:%Y-%m-%d %H:%M}] {event.job.command_expr}: "
+            f"{self.style.WARNING(event.status)}",
+        )
+
+    def run_job(self, job: ScheduledJob, scheduled_at: datetime) -> None:
+        name, *argv = job.command_expr.split()
+        prefix = f"[{scheduled_at:%Y-%m-%d %H:%M}] [{name}] "
+
+        self.write(
+            f"[{scheduled_at:%Y-%m-%d %H:%M}] {job.command_expr}: "
+            f"{self.style.MIGRATE_HEADING('started')}",
+        )
+
+        stdout = PrefixedStream(self.stdout, prefix, self.lock)
+        stderr = PrefixedStream(self.stderr, prefix, self.lock)
+
+        try:
+            result = run_command(name, argv, stdout=stdout, stderr=stderr)
+        finally:
+            stdout.close()
+            stderr.close()
+
+            connections.close_all()
+
+        status = (
+            self.style.ERROR(f"failed (exit code {result.exit_code})")
+            if result.exit_code
+            else self.style.SUCCESS("finished")
+        )
+
+        self.write(
+            f"[{scheduled_at:%Y-%m-%d %H:%M}] {job.command_expr}: "
+            f"{status} ({result.duration:.2f}s)",
+        )
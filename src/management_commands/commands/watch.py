@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from management_commands.conf import settings
+from management_commands.core import get_command_class
+from management_commands.exceptions import ManagementCommandsException
+from management_commands.execution import run_command
+from management_commands.watching import (
+    Watcher,
+    get_command_paths,
+    get_modules_by_paths,
+    get_watched_paths,
+    reload_modules,
+    restart,
+)
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+
+class Command(BaseCommand):
+    help = "Reruns a command in a warm process whenever its source files change."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0.5,
+            help="Interval (in seconds) between checks for file changes.",
+        )
+        parser.add_argument(
+            "command_name",
+            help="Name of the command to watch.",
+        )
+        parser.add_argument(
+            "command_args",
+            nargs=argparse.REMAINDER,
+            help="Arguments and options passed to the command.",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        name: str = options["command_name"]
+
+        command_classes = [
+            self.get_command_class(command_name)
+            for command_name in (
+                [alias_expr.split()[0] for alias_expr in settings.ALIASES[name]]
+                if name in settings.ALIASES and name not in settings.PATHS
+                else [name]
+            )
+            if command_name not in settings.ALIASES
+        ]
+
+        watcher = Watcher(
+            path
+            for command_class in command_classes
+            for path in get_watched_paths(command_class)
+        )
+
+        command_paths = get_command_paths(command_classes)
+
+        self.run(name, options["command_args"])
+
+        while True:
+            changed_paths = watcher.wait(options["interval"])
+
+            if not changed_paths <= command_paths:
+                self.stderr.write("Modules other than commands changed; restarting...")
+                restart()
+
+            if not reload_modules(
+                get_modules_by_paths(changed_paths),
+                stderr=self.stderr,
+            ):
+                self.stderr.write("Reloading changed modules failed; watching...")
+                continue
+
+            self.stderr.write(
+                f"Changes detected in {len(changed_paths)} file(s); rerunning...",
+            )
+
+            self.run(name, options["command_args"])
+
+    def get_command_class(self, name: str) -> type[BaseCommand]:
+        try:
+            return get_command_class(name)
+        except ManagementCommandsException as exc:
+            raise CommandError(exc) from exc
+
+    def run(self, name: str, argv: list[str]) -> None:
+        result = run_command(name, argv, stdout=self.stdout, stderr=self.stderr)
+
+        status = (
+            self.style.ERROR(f"exited with code {result.exit_code}")
+            if result.exit_code
+            else self.style.SUCCESS("finished")
+        )
+
+        self.stderr.write(f"Command {status} in {result.duration:.2f}s; watching...")
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+
+from management_commands.exceptions import CommandQueueNotConfiguredError
+from management_commands.jobs import connect, run_worker
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+    from management_commands.execution import CommandResult
+    from management_commands.jobs import Job
+
+
+def format_job(job: Job, result: CommandResult) -> str:
+    status = f"FAILED (exit code {result.exit_code})" if result.exit_code else "OK"
+
+    return (
+        f"Job {job.id} ({' '.join([job.name, *job.argv])}): "
+        f"{status} ({result.duration:.2f}s)"
+    )
+
+
+def report_job(job: Job, result: CommandResult) -> None:
+    sys.stdout.write(f"{format_job(job, result)}\n")
+    sys.stdout.flush()
+
+
+class Command(BaseCommand):
+    help = "Runs commands enqueued in the MANAGEMENT_COMMANDS_QUEUE_DB job queue."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes (default: 1).",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            metavar="SECONDS",
+            help="Time to wait before checking an empty queue again (default: 1).",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once the queue is empty instead of waiting for new jobs.",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        try:
+            connect().close()
+        except CommandQueueNotConfiguredError as exc:
+            raise CommandError(exc) from exc
+
+        worker_options = {
+            "poll_interval": options["poll_interval"],
+            "burst": options["burst"],
+        }
+
+        try:
+            if (workers := options["workers"]) == 1:
+                processed = run_worker(callback=self.report_job, **worker_options)
+            else:
+                with ProcessPoolExecutor(workers, initializer=django.setup) as executor:
+                    futures = [
+                        executor.submit(
+                            run_worker,
+                            callback=report_job,
+                            **worker_options,
+                        )
+                        for _ in range(workers)
+                    ]
+
+                processed = sum(future.result() for future in futures)
+        except KeyboardInterrupt:
+            self.stdout.write("Workers stopped.")
+        else:
+            self.stdout.write(f"{processed} jobs processed.")
+
+    def report_job(self, job: Job, result: CommandResult) -> None:
+        style = self.style.ERROR if result.exit_code else self.style.SUCCESS
+
+        self.stdout.write(style(format_job(job, result)))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import py_compile
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from .conf import settings
+from .core import discover_commands
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class CompilationResult(NamedTuple):
+    module: str
+    path: str
+    error: str | None
+    duration: float
+
+
+def get_command_module_paths() -> dict[str, str]:
+    modules = dict.fromkeys(
+        [
+            *(dotted_path.rsplit(".", 1)[0] for dotted_path in settings.PATHS.values()),
+            *(module for modules in discover_commands().values() for module in modules),
+        ],
+    )
+
+    module_paths: dict[str, str] = {}
+    for module in modules:
+        try:
+            spec = find_spec(module)
+        except ImportError:
+            continue
+
+        if spec and spec.origin and spec.origin.endswith(".py"):
+            module_paths[module] = spec.origin
+
+    return module_paths
+
+
+def compile_module(
+    module: str,
+    path: str,
+    invalidation_mode: py_compile.PycInvalidationMode,
+) -> CompilationResult:
+    start = perf_counter()
+    try:
+        py_compile.compile(path, doraise=True, invalidation_mode=invalidation_mode)
+    except (py_compile.PyCompileError, OSError) as exc:
+        error: str | None = str(exc).strip()
+    else:
+        error = None
+
+    return CompilationResult(module, path, error, perf_counter() - start)
+
+
+def compile_modules(
+    module_paths: dict[str, str],
+    *,
+    invalidation_mode: py_compile.PycInvalidationMode,
+    workers: int | None = None,
+) -> Iterable[CompilationResult]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            compile_module,
+            module_paths.keys(),
+            module_paths.values(),
+            [invalidation_mode] * len(module_paths),
+        )
@@ -1,23 +1,168 @@
 from __future__ import annotations
 
+import os
 import re
+from functools import cache, lru_cache
 from keyword import iskeyword
-from typing import ClassVar
+from typing import Any, ClassVar
 
 import appconf
 
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .aliases import split_pipeline
+from .cron import parse_cron_expression
+
+ALIAS_MODES = ("inline", "subprocess", "fork")
+
+SINGLE_FLIGHT_MODES = ("wait", "skip")
+
+VALIDATION_CACHE_SIZE = 32
+
+_DOTTED_PATH_PATTERN = re.compile(r"[^\d\W]\w*(?:\.[^\d\W]\w*)*")
+
+_Errors = tuple[tuple[str, str], ...]
+
 
 def _is_identifier(s: str) -> bool:
     return s.replace("-", "_").isidentifier() and not iskeyword(s)
 
 
+def _is_command_name(s: str) -> bool:
+    return all(map(_is_identifier, s.split(":")))
+
+
 def _is_dotted_path(s: str, /, *, min_parts: int = 0) -> bool:
-    if not (dotted_path_match := re.match(r"^[^\d\W]\w*(\.[^\d\W]\w*)*$", s)):
+    if not _DOTTED_PATH_PATTERN.fullmatch(s):
         return False
 
-    parts = dotted_path_match.group().split(".")
+    parts = s.split(".")
+
+    return len(parts) >= min_parts and not any(map(iskeyword, parts))
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_paths(items: tuple[tuple[str, str], ...]) -> _Errors:
+    errors: list[tuple[str, str]] = []
+    for key, value in items:
+        if not _is_command_name(key):
+            msg = (
+                f"invalid key {key!r} in PATHS; "
+                f"keys must be valid Python identifiers (with hyphens allowed), "
+                f"optionally separated by colons"
+            )
+
+            errors.append((msg, "paths.key"))
+
+        if not _is_dotted_path(value, min_parts=2):
+            msg = (
+                f"invalid value for PATHS[{key!r}]; "
+                f"values must be valid absolute dotted paths with at least 2 parts"
+            )
+
+            errors.append((msg, "paths.value"))
+
+    return tuple(errors)
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_path_list(setting_name: str, items: tuple[str, ...]) -> _Errors:
+    errors: list[tuple[str, str]] = []
+    for index, item in enumerate(items):
+        if not _is_dotted_path(item):
+            msg = (
+                f"invalid value for {setting_name.upper()}[{index}]; "
+                f"items must be valid absolute dotted paths"
+            )
+
+            errors.append((msg, f"{setting_name}.item"))
+
+    return tuple(errors)
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_aliases(items: tuple[tuple[str, tuple[str, ...]], ...]) -> _Errors:
+    errors: list[tuple[str, str]] = []
+    for key, value in items:
+        if not _is_command_name(key):
+            msg = (
+                f"invalid key {key!r} in ALIASES; "
+                f"keys must be valid Python identifiers (with hyphens allowed), "
+                f"optionally separated by colons"
+            )
+
+            errors.append((msg, "aliases.key"))
+
+        for index, item in enumerate(value):
+            if not item.split():
+                msg = (
+                    f"empty item found in ALIASES[{key!r}][{index}]; "
+                    f"items must not be empty"
+                )
+
+                errors.append((msg, "aliases.empty"))
+            elif not all(pipeline := split_pipeline(item)):
+                msg = (
+                    f"invalid value for ALIASES[{key!r}][{index}]; "
+                    f"each side of '|' must be a command expression"
+                )
+
+                errors.append((msg, "aliases.pipe"))
+            elif any(argv[0] == key for argv in pipeline):
+                msg = (
+                    f"invalid value for ALIASES[{key!r}][{index}]; "
+                    f"items must not refer to the aliases they are defined by"
+                )
+
+                errors.append((msg, "aliases.self_reference"))
 
-    return len(parts) >= min_parts and all(map(_is_identifier, parts))
+    return tuple(errors)
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_standalone(items: tuple[str, ...], paths: tuple[str, ...]) -> _Errors:
+    errors: list[tuple[str, str]] = []
+    for index, item in enumerate(items):
+        if not _is_command_name(item):
+            msg = (
+                f"invalid value for STANDALONE[{index}]; "
+                f"items must be valid Python identifiers (with hyphens allowed), "
+                f"optionally separated by colons"
+            )
+
+            errors.append((msg, "standalone.item"))
+        elif item not in paths:
+            msg = (
+                f"invalid value for STANDALONE[{index}]; "
+                f"items must be names of commands defined in PATHS"
+            )
+
+            errors.append((msg, "standalone.path"))
+
+    return tuple(errors)
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_single_flight(items: tuple[tuple[str, str], ...]) -> _Errors:
+    errors: list[tuple[str, str]] = []
+    for key, value in items:
+        if value not in SINGLE_FLIGHT_MODES:
+            msg = (
+                f"invalid value for SINGLE_FLIGHT[{key!r}]; "
+                f"values must be one of {', '.join(map(repr, SINGLE_FLIGHT_MODES))}"
+            )
+
+            errors.append((msg, "single_flight.value"))
+
+    return tuple(errors)
+
+
+@cache
+def _get_setting_names_pattern(names: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile(
+        rf"\b(?:{'|'.join(map(re.escape, sorted(names, key=len, reverse=True)))})\b",
+    )
 
 
 class ManagementCommandsConf(appconf.AppConf):  # type: ignore[misc]
@@ -29,42 +174,85 @@ class ManagementCommandsConf(appconf.AppConf):  # type: ignore[misc]
 
     ALIASES: ClassVar[dict[str, list[str]]] = {}
 
+    STANDALONE: ClassVar[list[str]] = []
+
+    CACHE_PARSERS: ClassVar[bool] = False
+
+    HELP_CACHE_DIR: ClassVar[str | None] = None
+
+    ALIAS_MODE: ClassVar[str] = "inline"
+
+    ALIAS_WORKERS: ClassVar[int] = 1
+
+    ALIAS_PRECONNECT: ClassVar[bool] = False
+
+    ALIAS_PIPE_SIZE: ClassVar[int | None] = None
+
+    SINGLE_FLIGHT: ClassVar[dict[str, str]] = {}
+
+    SINGLE_FLIGHT_DIR: ClassVar[str | None] = None
+
+    HISTORY_DB: ClassVar[str | None] = None
+
+    OUTPUT_BUFFER_SIZE: ClassVar[int | None] = None
+
+    SCHEDULE: ClassVar[dict[str, list[str]]] = {}
+
+    QUEUE_DB: ClassVar[str | None] = None
+
+    QUEUE_LEASE_TIMEOUT: ClassVar[float] = 60
+
+    MODULE_CACHE_SIZE: ClassVar[int | None] = None
+
+    MODULE_MEMORY_LIMIT: ClassVar[int | None] = None
+
+    SPOOL_THRESHOLD: ClassVar[int | None] = None
+
     class ImproperlyConfigured(Exception):
-        def __init__(self, msg: str, code: str | None = None) -> None:
+        def __init__(
+            self,
+            msg: str,
+            code: str | None = None,
+            errors: list[ManagementCommandsConf.ImproperlyConfigured] | None = None,
+        ) -> None:
             super().__init__(msg)
 
             self.code = code
+            self.errors = errors if errors is not None else [self]
 
     def improperly_configured(
         self,
         msg: str,
         code: str | None = None,
     ) -> ImproperlyConfigured:
-        msg = re.sub(
-            rf"({'|'.join(dir(self))})",
+        msg = _get_setting_names_pattern(tuple(dir(self))).sub(
             lambda m: f"{self._meta.prefixed_name(m.group(0))}",
             msg,
         )
 
         return self.__class__.ImproperlyConfigured(msg, code)
 
-    def configure_paths(self, setting_value: dict[str, str]) -> dict[str, str]:
-        for key, value in setting_value.items():
-            if not _is_identifier(key):
-                msg = (
-                    f"invalid key {key!r} in PATHS; "
-                    f"keys must be valid Python identifiers (with hyphens allowed)"
-                )
+    def _raise_errors(self, errors: _Errors) -> None:
+        if not errors:
+            return
 
-                raise self.improperly_configured(msg, "paths.key")
+        exceptions = [self.improperly_configured(msg, code) for msg, code in errors]
 
-            if not _is_dotted_path(value, min_parts=2):
-                msg = (
-                    f"invalid value for PATHS[{key!r}]; "
-                    f"values must be valid absolute dotted paths with at least 2 parts"
-                )
+        if len(exceptions) == 1:
+            raise exceptions[0]
+
+        msg = f"{len(exceptions)} errors found:\n" + "\n".join(
+            f"- {exception}" for exception in exceptions
+        )
 
-                raise self.improperly_configured(msg, "paths.value")
+        raise self.__class__.ImproperlyConfigured(
+            msg,
+            exceptions[0].code,
+            exceptions,
+        )
+
+    def configure_paths(self, setting_value: dict[str, str]) -> dict[str, str]:
+        self._raise_errors(_validate_paths(tuple(setting_value.items())))
 
         return setting_value
 
@@ -73,14 +261,7 @@ class ManagementCommandsConf(appconf.AppConf):  # type: ignore[misc]
         setting_name: str,
         setting_value: list[str],
     ) -> list[str]:
-        for index, item in enumerate(setting_value):
-            if not _is_dotted_path(item):
-                msg = (
-                    f"invalid value for {setting_name.upper()}[{index}]; "
-                    f"items must be valid absolute dotted paths"
-                )
-
-                raise self.improperly_configured(msg, f"{setting_name}.item")
+        self._raise_errors(_validate_path_list(setting_name, tuple(setting_value)))
 
         return setting_value
 
@@ -99,37 +280,163 @@ class ManagementCommandsConf(appconf.AppConf):  # type: ignore[misc]
         self,
         setting_value: dict[str, list[str]],
     ) -> dict[str, list[str]]:
+        self._raise_errors(
+            _validate_aliases(
+                tuple((key, tuple(value)) for key, value in setting_value.items()),
+            ),
+        )
+
+        return setting_value
+
+    def configure_standalone(self, setting_value: list[str]) -> list[str]:
+        paths = getattr(self._meta.holder, self._meta.prefixed_name("PATHS"), {})
+
+        self._raise_errors(_validate_standalone(tuple(setting_value), tuple(paths)))
+
+        return setting_value
+
+    def configure_alias_mode(self, setting_value: str) -> str:
+        if setting_value not in ALIAS_MODES:
+            msg = (
+                f"invalid value for ALIAS_MODE; "
+                f"must be one of {', '.join(map(repr, ALIAS_MODES))}"
+            )
+
+            raise self.improperly_configured(msg, "alias_mode.value")
+
+        if setting_value == "fork" and not hasattr(os, "fork"):
+            msg = (
+                "invalid value for ALIAS_MODE; 'fork' is not supported on this platform"
+            )
+
+            raise self.improperly_configured(msg, "alias_mode.platform")
+
+        return setting_value
+
+    def configure_queue_lease_timeout(self, setting_value: float) -> float:
+        if not (
+            isinstance(setting_value, (int, float))
+            and not isinstance(setting_value, bool)
+            and setting_value > 0
+        ):
+            msg = "invalid value for QUEUE_LEASE_TIMEOUT; must be a positive number"
+
+            raise self.improperly_configured(msg, "queue_lease_timeout.value")
+
+        return setting_value
+
+    def configure_alias_workers(self, setting_value: int) -> int:
+        if not (isinstance(setting_value, int) and setting_value >= 1):
+            msg = "invalid value for ALIAS_WORKERS; must be a positive integer"
+
+            raise self.improperly_configured(msg, "alias_workers.value")
+
+        return setting_value
+
+    def configure_schedule(
+        self,
+        setting_value: dict[str, list[str]],
+    ) -> dict[str, list[str]]:
+        errors: list[tuple[str, str]] = []
         for key, value in setting_value.items():
-            if not _is_identifier(key):
-                msg = (
-                    f"invalid key {key!r} in ALIASES; "
-                    f"keys must be valid Python identifiers (with hyphens allowed)"
-                )
+            try:
+                parse_cron_expression(key)
+            except ValueError as exc:
+                msg = f"invalid key {key!r} in SCHEDULE; {exc}"
 
-                raise self.improperly_configured(msg, "aliases.key")
+                errors.append((msg, "schedule.key"))
 
             for index, item in enumerate(value):
-                argv = item.split()
-
-                try:
-                    command = argv[0]
-                except IndexError as exc:
+                if not item.split():
                     msg = (
-                        f"empty item found in ALIASES[{key!r}][{index}]; "
+                        f"empty item found in SCHEDULE[{key!r}][{index}]; "
                         f"items must not be empty"
                     )
 
-                    raise self.improperly_configured(msg, "aliases.empty") from exc
+                    errors.append((msg, "schedule.empty"))
 
-                if command == key:
-                    msg = (
-                        f"invalid value for ALIASES[{key!r}][{index}]; "
-                        f"items must not refer to the aliases they are defined by"
-                    )
+        self._raise_errors(tuple(errors))
+
+        return setting_value
 
-                    raise self.improperly_configured(msg, "aliases.self_reference")
+    def reload(self, setting_name: str) -> None:
+        prefix = self._meta.prefixed_name("")
+
+        if not (
+            setting_name.startswith(prefix)
+            and (name := setting_name.removeprefix(prefix)) in self._meta.names
+        ):
+            return
+
+        setting_value = getattr(
+            self._meta.holder,
+            setting_name,
+            self._meta.defaults.get(setting_name),
+        )
+
+        if callable(configure := getattr(self, f"configure_{name.lower()}", None)):
+            setting_value = configure(setting_value)
+
+        setattr(type(self), name, setting_value)
+
+        self._meta.configured_data[name] = setting_value
+
+    def _configure_optional_positive_integer(
+        self,
+        setting_name: str,
+        setting_value: int | None,
+    ) -> int | None:
+        if setting_value is not None and not (
+            isinstance(setting_value, int) and setting_value >= 1
+        ):
+            msg = (
+                f"invalid value for {setting_name.upper()}; "
+                f"must be a positive integer or None"
+            )
+
+            raise self.improperly_configured(msg, f"{setting_name}.value")
+
+        return setting_value
+
+    def configure_output_buffer_size(self, setting_value: int | None) -> int | None:
+        return self._configure_optional_positive_integer(
+            "output_buffer_size",
+            setting_value,
+        )
+
+    def configure_module_cache_size(self, setting_value: int | None) -> int | None:
+        return self._configure_optional_positive_integer(
+            "module_cache_size",
+            setting_value,
+        )
+
+    def configure_module_memory_limit(self, setting_value: int | None) -> int | None:
+        return self._configure_optional_positive_integer(
+            "module_memory_limit",
+            setting_value,
+        )
+
+    def configure_alias_pipe_size(self, setting_value: int | None) -> int | None:
+        return self._configure_optional_positive_integer(
+            "alias_pipe_size",
+            setting_value,
+        )
+
+    def configure_spool_threshold(self, setting_value: int | None) -> int | None:
+        return self._configure_optional_positive_integer(
+            "spool_threshold",
+            setting_value,
+        )
+
+    def configure_single_flight(self, setting_value: dict[str, str]) -> dict[str, str]:
+        self._raise_errors(_validate_single_flight(tuple(setting_value.items())))
 
         return setting_value
 
 
 settings = ManagementCommandsConf()
+
+
+@receiver(setting_changed)
+def handle_setting_changed(*, setting: str, **_kwargs: Any) -> None:
+    settings.reload(setting)
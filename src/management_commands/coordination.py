@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple
+
+from .conf import settings
+from .core import get_command_class
+from .execution import run_command
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from io import BufferedIOBase, TextIOBase
+
+    from .execution import CommandResult
+
+
+class WorkItemResult(NamedTuple):
+    item: int
+    argv: list[str]
+    agent: str
+    exit_code: int
+    duration: float
+    attempt: int
+
+
+def _send(file: BinaryIO | BufferedIOBase, message: dict[str, Any]) -> None:
+    file.write(json.dumps(message).encode() + b"\n")
+    file.flush()
+
+
+def _receive(file: BinaryIO | BufferedIOBase) -> dict[str, Any] | None:
+    return json.loads(line) if (line := file.readline()) else None
+
+
+class Coordinator:
+    def __init__(
+        self,
+        name: str,
+        argv_sets: Sequence[Sequence[str]],
+        *,
+        retries: int = 0,
+        callback: Callable[[WorkItemResult], None] | None = None,
+    ) -> None:
+        self.name = name
+        self.argv_sets = [list(argv) for argv in argv_sets]
+        self.retries = retries
+        self.callback = callback
+
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._server: _Server | None = None
+
+        self._pending = list(range(len(self.argv_sets)))
+        self._in_flight: dict[int, str] = {}
+        self._attempts: dict[int, int] = {}
+        self._failed_on: dict[int, set[str]] = {}
+        self._results: dict[int, WorkItemResult] = {}
+        self._agents: set[str] = set()
+        self._agent_count = 0
+
+        if not self.argv_sets:
+            self._done.set()
+
+    def connect(self, agent: str) -> str:
+        with self._lock:
+            self._agent_count += 1
+
+            agent_id = f"{agent}#{self._agent_count}"
+            self._agents.add(agent_id)
+
+        return agent_id
+
+    def disconnect(self, agent_id: str) -> None:
+        with self._lock:
+            self._agents.discard(agent_id)
+
+            for index, owner in list(self._in_flight.items()):
+                if owner == agent_id:
+                    del self._in_flight[index]
+                    self._pending.insert(0, index)
+
+    def take(self, agent_id: str, size: int) -> list[int] | None:
+        with self._lock:
+            if self._done.is_set():
+                return None
+
+            other_agents = self._agents - {agent_id}
+
+            indexes: list[int] = []
+            for index in self._pending:
+                if len(indexes) == size:
+                    break
+
+                failed_on = self._failed_on.get(index, set())
+
+                if agent_id not in failed_on or other_agents <= failed_on:
+                    indexes.append(index)
+
+            for index in indexes:
+                self._pending.remove(index)
+                self._in_flight[index] = agent_id
+
+            return indexes
+
+    def report(
+        self,
+        agent_id: str,
+        index: int,
+        exit_code: int,
+        duration: float,
+    ) -> None:
+        with self._lock:
+            if self._in_flight.get(index) != agent_id:
+                return
+
+            del self._in_flight[index]
+
+            attempt = self._attempts[index] = self._attempts.get(index, 0) + 1
+
+            result = WorkItemResult(
+                index,
+                self.argv_sets[index],
+                agent_id,
+                exit_code,
+                duration,
+                attempt,
+            )
+
+            self._results[index] = result
+
+            if exit_code and attempt <= self.retries:
+                self._failed_on.setdefault(index, set()).add(agent_id)
+                self._pending.append(index)
+            elif not (self._pending or self._in_flight):
+                self._done.set()
+
+        if self.callback:
+            self.callback(result)
+
+    def start(self, address: tuple[str, int]) -> tuple[str, int]:
+        self._server = _Server(address, _Handler)
+        self._server.coordinator = self
+
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+        host, port = self._server.server_address[:2]
+
+        return str(host), int(port)
+
+    def wait(self, timeout: float | None = None) -> list[WorkItemResult]:
+        self._done.wait(timeout)
+
+        return [self._results[index] for index in sorted(self._results)]
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    coordinator: Coordinator
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        coordinator = self.server.coordinator
+
+        if not (message := _receive(self.rfile)) or message["type"] != "hello":
+            return
+
+        agent_id = coordinator.connect(message["agent"])
+        try:
+            _send(
+                self.wfile,
+                {"type": "welcome", "agent": agent_id, "command": coordinator.name},
+            )
+
+            while message := _receive(self.rfile):
+                if message["type"] == "request":
+                    indexes = coordinator.take(agent_id, message["size"])
+
+                    if indexes is None:
+                        _send(self.wfile, {"type": "done"})
+                    elif not indexes:
+                        _send(self.wfile, {"type": "wait"})
+                    else:
+                        _send(
+                            self.wfile,
+                            {
+                                "type": "batch",
+                                "items": [
+                                    {
+                                        "index": index,
+                                        "argv": coordinator.argv_sets[index],
+                                    }
+                                    for index in indexes
+                                ],
+                            },
+                        )
+                elif message["type"] == "result":
+                    coordinator.report(
+                        agent_id,
+                        message["index"],
+                        message["exit_code"],
+                        message["duration"],
+                    )
+        except OSError:
+            pass
+        finally:
+            coordinator.disconnect(agent_id)
+
+
+def run_agent(  # noqa: PLR0913
+    address: tuple[str, int],
+    *,
+    batch_size: int = 1,
+    poll_interval: float = 0.5,
+    stdout: TextIOBase | None = None,
+    stderr: TextIOBase | None = None,
+    callback: Callable[[int, CommandResult], None] | None = None,
+) -> int:
+    processed = 0
+
+    with socket.create_connection(address) as sock, sock.makefile("rwb") as file:
+        _send(file, {"type": "hello", "agent": f"{socket.gethostname()}:{os.getpid()}"})
+
+        if not (welcome := _receive(file)):
+            return processed
+
+        name = welcome["command"]
+
+        if name not in settings.ALIASES:
+            get_command_class(name)
+
+        while True:
+            _send(file, {"type": "request", "size": batch_size})
+
+            if not (message := _receive(file)) or message["type"] == "done":
+                break
+
+            if message["type"] == "wait":
+                time.sleep(poll_interval)
+                continue
+
+            for item in message["items"]:
+                result = run_command(name, item["argv"], stdout=stdout, stderr=stderr)
+
+                _send(
+                    file,
+                    {
+                        "type": "result",
+                        "index": item["index"],
+                        "exit_code": result.exit_code,
+                        "duration": result.duration,
+                    },
+                )
+                processed += 1
+
+                if callback:
+                    callback(item["index"], result)
+
+    return processed
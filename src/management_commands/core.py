@@ -1,18 +1,50 @@
 from __future__ import annotations
 
-from contextlib import suppress
+import pkgutil
+import threading
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from functools import partial
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
 
 from django.apps.registry import apps
+from django.conf import settings as django_settings
+from django.core.management import get_commands
 from django.core.management.base import BaseCommand
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.module_loading import import_string
 
+from .buffering import buffer_output
 from .conf import settings
 from .exceptions import (
     CommandAppLookupError,
     CommandClassLookupError,
     CommandImportError,
     CommandTypeError,
+    ManagementCommandsException,
 )
+from .namespaces import NAMESPACE_SEPARATOR, CommandTrie
+from .suggestions import NGramIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
+
+    from django.core.management.base import CommandParser
+
+    from .namespaces import Namespace
+
+_IMMUTABLE_DEFAULT_TYPES = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+
+_suggestion_index: NGramIndex | None = None
+_suggestion_index_lock = threading.Lock()
+
+_command_trie: CommandTrie | None = None
+_command_trie_lock = threading.Lock()
+
+_parsers: dict[Hashable, CommandParser | None] = {}
+_parsers_lock = threading.Lock()
 
 
 def import_command_class(dotted_path: str) -> type[BaseCommand]:
@@ -27,14 +59,14 @@ def import_command_class(dotted_path: str) -> type[BaseCommand]:
     return command_class
 
 
-def get_command_paths(name: str, app_label: str | None = None) -> list[str]:
+def get_command_packages(app_label: str | None = None) -> list[str]:
     if not app_label:
         app_names = [
             *(app_config.name for app_config in reversed(list(apps.get_app_configs()))),
             "django.core",
         ]
 
-        modules_paths = [f"{module}.{name}.Command" for module in settings.MODULES]
+        modules = list(settings.MODULES)
     else:
         try:
             app_config = apps.get_app_config(app_label)
@@ -43,17 +75,119 @@ def get_command_paths(name: str, app_label: str | None = None) -> list[str]:
         else:
             app_names = [app_config.name]
 
-        modules_paths = []
+        modules = []
+
+    submodules = settings.SUBMODULES
 
-    submodules_paths: list[str] = []
+    submodules_packages: list[str] = []
     for app_name in app_names:
-        for submodule in settings.SUBMODULES:
+        for submodule in submodules:
             if app_name == "django.core" and submodule != "management.commands":
                 continue
 
-            submodules_paths.append(f"{app_name}.{submodule}.{name}.Command")
+            submodules_packages.append(f"{app_name}.{submodule}")
+
+    return modules + submodules_packages
+
+
+def get_command_paths(name: str, app_label: str | None = None) -> list[str]:
+    return [f"{package}.{name}.Command" for package in get_command_packages(app_label)]
+
+
+def iter_package_modules(package: str) -> Iterator[str]:
+    try:
+        spec = find_spec(package)
+    except ImportError:
+        return
+
+    if not (spec and spec.submodule_search_locations):
+        return
+
+    for module_info in pkgutil.iter_modules(spec.submodule_search_locations):
+        if not module_info.name.startswith("_"):
+            yield f"{package}.{module_info.name}"
+
+
+def discover_commands() -> dict[str, list[str]]:
+    commands: dict[str, list[str]] = {}
+    for package in get_command_packages():
+        for module in iter_package_modules(package):
+            commands.setdefault(module.rsplit(".", 1)[1], []).append(module)
+
+    return commands
+
+
+def get_suggestion_index() -> NGramIndex:
+    global _suggestion_index  # noqa: PLW0603
+
+    with _suggestion_index_lock:
+        if _suggestion_index is None:
+            _suggestion_index = NGramIndex(
+                [
+                    *settings.PATHS,
+                    *settings.ALIASES,
+                    *get_commands(),
+                    *discover_commands(),
+                ],
+            )
 
-    return modules_paths + submodules_paths
+        return _suggestion_index
+
+
+def get_command_trie() -> CommandTrie:
+    global _command_trie  # noqa: PLW0603
+
+    with _command_trie_lock:
+        if _command_trie is None:
+            _command_trie = CommandTrie([*settings.PATHS, *settings.ALIASES])
+
+        return _command_trie
+
+
+def _is_registered(name: str) -> bool:
+    return name in settings.PATHS or name in settings.ALIASES
+
+
+def resolve_command_name(name: str) -> str:
+    if (
+        NAMESPACE_SEPARATOR not in name
+        or name.endswith(NAMESPACE_SEPARATOR)
+        or _is_registered(name)
+    ):
+        return name
+
+    return get_command_trie().resolve(name) or name
+
+
+def get_command_namespace(name: str) -> Namespace | None:
+    if _is_registered(name):
+        return None
+
+    trie = get_command_trie()
+
+    if NAMESPACE_SEPARATOR not in name:
+        if not ((namespace := trie.root.children.get(name)) and namespace.children):
+            return None
+
+        with suppress(ManagementCommandsException):
+            get_command_class(name)
+
+            return None
+
+    return trie.find_namespace(name.removesuffix(NAMESPACE_SEPARATOR))
+
+
+def get_command_suggestions(name: str, app_label: str | None = None) -> list[str]:
+    if not app_label:
+        return get_suggestion_index().search(name)
+
+    index = NGramIndex(
+        module.rsplit(".", 1)[1]
+        for package in get_command_packages(app_label)
+        for module in iter_package_modules(package)
+    )
+
+    return [f"{app_label}.{suggestion}" for suggestion in index.search(name)]
 
 
 def load_command_class(name: str, app_label: str | None = None) -> type[BaseCommand]:
@@ -63,4 +197,160 @@ def load_command_class(name: str, app_label: str | None = None) -> type[BaseComm
         with suppress(CommandImportError, CommandTypeError):
             return import_command_class(command_path)
 
-    raise CommandClassLookupError(name, app_label)
+    raise CommandClassLookupError(
+        name,
+        app_label,
+        partial(get_command_suggestions, name, app_label),
+    )
+
+
+def resolve_command_class(subcommand: str) -> type[BaseCommand]:
+    subcommand = resolve_command_name(subcommand)
+
+    if dotted_path := settings.PATHS.get(subcommand):
+        return import_command_class(dotted_path)
+
+    try:
+        app_label, name = subcommand.rsplit(".", 1)
+    except ValueError:
+        app_label, name = None, subcommand
+
+    return load_command_class(name, app_label)
+
+
+def get_settings_fingerprint() -> Hashable:
+    return (
+        tuple(django_settings.INSTALLED_APPS),
+        repr(settings.PATHS),
+        repr(settings.MODULES),
+        repr(settings.SUBMODULES),
+        repr(settings.ALIASES),
+    )
+
+
+class CommandResolver:
+    def __init__(self, *, fingerprint: Callable[[], Hashable] | None = None) -> None:
+        self.fingerprint = fingerprint
+
+        self._command_classes: dict[Hashable, type[BaseCommand]] = {}
+        self._locks: dict[Hashable, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def get_key(self, subcommand: str) -> Hashable:
+        return (subcommand, self.fingerprint()) if self.fingerprint else subcommand
+
+    def get_command_class(self, subcommand: str) -> type[BaseCommand]:
+        key = self.get_key(subcommand)
+
+        with suppress(KeyError):
+            return self._command_classes[key]
+
+        with self._locks_lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            if (command_class := self._command_classes.get(key)) is None:
+                command_class = resolve_command_class(subcommand)
+
+                self._command_classes[key] = command_class
+
+        return command_class
+
+    def clear(self) -> None:
+        with self._locks_lock:
+            self._command_classes.clear()
+            self._locks.clear()
+
+
+_default_command_resolver = CommandResolver()
+
+_command_resolver: ContextVar[CommandResolver] = ContextVar(
+    "command_resolver",
+    default=_default_command_resolver,
+)
+
+
+@contextmanager
+def use_command_resolver(resolver: CommandResolver) -> Iterator[CommandResolver]:
+    token = _command_resolver.set(resolver)
+    try:
+        yield resolver
+    finally:
+        _command_resolver.reset(token)
+
+
+def get_command_class(subcommand: str) -> type[BaseCommand]:
+    return _command_resolver.get().get_command_class(subcommand)
+
+
+def clear_command_class_cache() -> None:
+    global _suggestion_index, _command_trie  # noqa: PLW0603
+
+    _default_command_resolver.clear()
+    _command_resolver.get().clear()
+
+    with _suggestion_index_lock:
+        _suggestion_index = None
+
+    with _command_trie_lock:
+        _command_trie = None
+
+
+@receiver(setting_changed)
+def handle_setting_changed(*, setting: str, **_kwargs: Any) -> None:
+    if setting == "INSTALLED_APPS" or setting.startswith("MANAGEMENT_COMMANDS_"):
+        clear_command_class_cache()
+
+
+def clear_parser_cache() -> None:
+    with _parsers_lock:
+        _parsers.clear()
+
+
+def create_cached_parser(
+    command: BaseCommand,
+    prog_name: str,
+    subcommand: str,
+    **kwargs: Any,
+) -> CommandParser:
+    key = (
+        type(command),
+        getattr(command, "_called_from_command_line", None),
+        prog_name,
+        subcommand,
+        tuple(sorted(kwargs.items())),
+    )
+
+    with suppress(KeyError, TypeError), _parsers_lock:
+        if parser := _parsers[key]:
+            return parser
+
+    parser = type(command).create_parser(command, prog_name, subcommand, **kwargs)
+
+    with suppress(TypeError), _parsers_lock:
+        _parsers.setdefault(
+            key,
+            parser
+            if all(
+                isinstance(action.default, _IMMUTABLE_DEFAULT_TYPES)
+                for action in parser._actions  # noqa: SLF001
+            )
+            else None,
+        )
+
+    return parser
+
+
+def create_command(command_class: type[BaseCommand]) -> BaseCommand:
+    command = command_class()
+
+    if settings.CACHE_PARSERS:
+        command.create_parser = partial(  # type: ignore[method-assign]
+            create_cached_parser,
+            command,
+        )
+
+    if buffer_size := settings.OUTPUT_BUFFER_SIZE:
+        buffer_output(command, buffer_size)
+
+    return command
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 7),
+)
+
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+
+class CronExpression(NamedTuple):
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    any_day: bool
+    any_weekday: bool
+
+    def matches(self, dt: datetime) -> bool:
+        if not (
+            dt.minute in self.minutes
+            and dt.hour in self.hours
+            and dt.month in self.months
+        ):
+            return False
+
+        day_matches = dt.day in self.days
+        weekday_matches = dt.isoweekday() % 7 in self.weekdays
+
+        if self.any_day or self.any_weekday:
+            return day_matches and weekday_matches
+
+        return day_matches or weekday_matches
+
+
+def _parse_field(field: str, name: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for item in field.split(","):
+        range_, _, step = item.partition("/")
+
+        try:
+            if range_ == "*":
+                start, stop = low, high
+            elif "-" in range_:
+                start, stop = map(int, range_.split("-", 1))
+            else:
+                start = int(range_)
+                stop = high if step else start
+
+            step_value = int(step) if step else 1
+        except ValueError:
+            msg = f"invalid {name} field {field!r}"
+            raise ValueError(msg) from None
+
+        if not (low <= start <= stop <= high and step_value >= 1):
+            msg = (
+                f"invalid {name} field {field!r}; "
+                f"values must be in {low}-{high} and steps must be positive"
+            )
+            raise ValueError(msg)
+
+        values.update(range(start, stop + 1, step_value))
+
+    return frozenset(values)
+
+
+@cache
+def parse_cron_expression(expression: str) -> CronExpression:
+    fields = MACROS.get(expression, expression).split()
+
+    if len(fields) != len(FIELDS):
+        msg = f"expected {len(FIELDS)} fields, got {len(fields)}"
+        raise ValueError(msg)
+
+    minutes, hours, days, months, weekdays = (
+        _parse_field(field, *spec) for field, spec in zip(fields, FIELDS)
+    )
+
+    return CronExpression(
+        minutes,
+        hours,
+        days,
+        months,
+        frozenset(weekday % 7 for weekday in weekdays),
+        any_day=fields[2] == "*",
+        any_weekday=fields[4] == "*",
+    )
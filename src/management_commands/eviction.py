@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import ctypes
+import gc
+import os
+import sys
+import sysconfig
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.apps.registry import apps
+
+from .conf import settings
+from .core import clear_command_class_cache, clear_parser_cache, get_command_packages
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from types import ModuleType
+
+PROTECTED_PACKAGES = ("django", "management_commands")
+
+
+def get_rss() -> int | None:
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def release_memory() -> None:
+    gc.collect()
+
+    with suppress(AttributeError, OSError):
+        ctypes.CDLL(None).malloc_trim(0)
+
+
+def _is_in_packages(module_name: str, packages: Iterable[str]) -> bool:
+    return any(
+        module_name == package or module_name.startswith(f"{package}.")
+        for package in packages
+    )
+
+
+def _is_stdlib_module(module_name: str, origin: str) -> bool:
+    if stdlib_module_names := getattr(sys, "stdlib_module_names", None):
+        return module_name.partition(".")[0] in stdlib_module_names
+
+    return origin.startswith(sysconfig.get_paths()["stdlib"]) and (
+        "site-packages" not in origin
+    )
+
+
+def get_evictable_packages() -> list[str]:
+    return [
+        *get_command_packages(),
+        *(path.rsplit(".", 2)[0] for path in settings.PATHS.values()),
+    ]
+
+
+def is_evictable(module_name: str, module: ModuleType | None) -> bool:
+    origin = getattr(getattr(module, "__spec__", None), "origin", None)
+
+    if not (isinstance(origin, str) and origin.endswith(".py")):
+        return False
+
+    if _is_stdlib_module(module_name, origin) or _is_in_packages(
+        module_name,
+        PROTECTED_PACKAGES,
+    ):
+        return False
+
+    evictable_packages = get_evictable_packages()
+
+    if module_name in evictable_packages or not _is_in_packages(
+        module_name,
+        evictable_packages,
+    ):
+        return False
+
+    return not _is_in_packages(
+        module_name,
+        (app_config.name for app_config in apps.get_app_configs()),
+    ) or _is_in_packages(module_name, get_command_packages())
+
+
+def evict_modules(module_names: Iterable[str]) -> None:
+    for module_name in sorted(module_names, reverse=True):
+        sys.modules.pop(module_name, None)
+
+        parent_name, _, attribute = module_name.rpartition(".")
+
+        if (parent := sys.modules.get(parent_name)) and isinstance(
+            getattr(parent, attribute, None),
+            type(sys),
+        ):
+            delattr(parent, attribute)
+
+    clear_command_class_cache()
+    clear_parser_cache()
+
+
+class ModuleEvictor:
+    def __init__(self, *, size: int | None, memory_limit: int | None) -> None:
+        self.size = size
+        self.memory_limit = memory_limit
+
+        self._entries: OrderedDict[str, set[str]] = OrderedDict()
+        self._active = 0
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self) -> dict[str, set[str]]:
+        with self._lock:
+            return {key: set(modules) for key, modules in self._entries.items()}
+
+    @contextmanager
+    def track(self, key: str) -> Iterator[None]:
+        with self._lock:
+            self._active += 1
+
+        before = set(sys.modules)
+        try:
+            yield
+        finally:
+            imported = {
+                module_name
+                for module_name in set(sys.modules) - before
+                if is_evictable(module_name, sys.modules.get(module_name))
+            }
+
+            with self._lock:
+                self._active -= 1
+
+                modules = self._entries.pop(key, set())
+                self._entries[key] = modules | imported
+
+                if not self._active:
+                    self._evict()
+
+    def _is_over_memory_limit(self) -> bool:
+        return bool(
+            self.memory_limit
+            and (rss := get_rss()) is not None
+            and rss > self.memory_limit,
+        )
+
+    def _evict_least_recently_used(self) -> None:
+        _, modules = self._entries.popitem(last=False)
+
+        evict_modules(modules)
+
+    def _evict(self) -> None:
+        if self.size is not None and len(self._entries) > self.size:
+            while len(self._entries) > self.size:
+                self._evict_least_recently_used()
+
+            release_memory()
+
+        while len(self._entries) > 1 and self._is_over_memory_limit():
+            self._evict_least_recently_used()
+
+            release_memory()
+
+
+_evictor: ModuleEvictor | None = None
+_evictor_lock = threading.Lock()
+
+
+def get_module_evictor() -> ModuleEvictor | None:
+    global _evictor  # noqa: PLW0603
+
+    size, memory_limit = settings.MODULE_CACHE_SIZE, settings.MODULE_MEMORY_LIMIT
+
+    if size is None and memory_limit is None:
+        return None
+
+    with _evictor_lock:
+        if _evictor is None or (_evictor.size, _evictor.memory_limit) != (
+            size,
+            memory_limit,
+        ):
+            _evictor = ModuleEvictor(size=size, memory_limit=memory_limit)
+
+        return _evictor
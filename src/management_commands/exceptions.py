@@ -1,7 +1,19 @@
 from __future__ import annotations
 
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 from django.core.management.base import BaseCommand
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+def _join_alternatives(names: Sequence[str]) -> str:
+    *others, last = map(repr, names)
+
+    return f"{', '.join(others)} or {last}" if others else last
+
 
 class ManagementCommandsException(Exception):
     msg: str
@@ -25,18 +37,51 @@ class CommandClassLookupError(ManagementCommandsException):
         self,
         command_name: str | None = None,
         app_name: str | None = None,
+        suggestions: Sequence[str] | Callable[[], Sequence[str]] = (),
+    ) -> None:
+        self._suggestions = suggestions
+
+        msg = None
+        if command_name:
+            msg = self.msg.format(
+                command_name=command_name,
+                app_info=(
+                    f"the {app_name!r} app" if app_name else "any of the installed apps"
+                ),
+            )
+
+        super().__init__(msg)
+
+    @cached_property
+    def suggestions(self) -> list[str]:
+        return list(
+            self._suggestions() if callable(self._suggestions) else self._suggestions,
+        )
+
+    def __str__(self) -> str:
+        if (msg := super().__str__()) and self.suggestions:
+            msg += f"; did you mean {_join_alternatives(self.suggestions)}?"
+
+        return msg
+
+
+class CommandNameAmbiguityError(ManagementCommandsException):
+    msg = "command name {command_name!r} is ambiguous; it may refer to {candidates}"
+
+    def __init__(
+        self,
+        command_name: str | None = None,
+        candidates: Sequence[str] = (),
     ) -> None:
+        self.candidates = list(candidates)
+
         super().__init__(
             **(
                 {
                     "command_name": command_name,
-                    "app_info": (
-                        f"the {app_name!r} app"
-                        if app_name
-                        else "any of the installed apps"
-                    ),
+                    "candidates": _join_alternatives(self.candidates),
                 }
-                if command_name
+                if command_name and self.candidates
                 else {}
             ),
         )
@@ -78,3 +123,30 @@ class CommandTypeError(ManagementCommandsException):
     @staticmethod
     def _class_path(class_: type) -> str:
         return f"{class_.__module__}.{class_.__qualname__}"
+
+
+class CommandArgvSetError(ManagementCommandsException, ValueError):
+    msg = "argument set in line {line_number} of {path!r} is invalid"
+
+    def __init__(self, path: str | None = None, line_number: int | None = None) -> None:
+        super().__init__(
+            **(
+                {"path": path, "line_number": str(line_number)}
+                if path and line_number
+                else {}
+            ),
+        )
+
+
+class CommandQueueNotConfiguredError(ManagementCommandsException):
+    def __init__(self) -> None:
+        super().__init__(
+            "command queue is not configured; set MANAGEMENT_COMMANDS_QUEUE_DB",
+        )
+
+
+class SingleFlightDirectoryError(ManagementCommandsException):
+    msg = "single-flight directory {path!r} is not private to the current user"
+
+    def __init__(self, path: str | None = None) -> None:
+        super().__init__(**({"path": path} if path else {}))
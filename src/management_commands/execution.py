@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import traceback
+from contextlib import nullcontext
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.core.management.base import CommandError
+
+from .eviction import get_module_evictor
+from .management import call_command
+from .spooling import create_capture, get_captured_output
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from io import TextIOBase
+
+    from .spooling import SpooledOutput
+
+
+class CommandResult(NamedTuple):
+    argv: list[str]
+    exit_code: int
+    stdout: str | SpooledOutput
+    stderr: str | SpooledOutput
+    duration: float
+
+
+def run_command(
+    name: str,
+    argv: Sequence[str] = (),
+    *,
+    stdout: TextIOBase | None = None,
+    stderr: TextIOBase | None = None,
+) -> CommandResult:
+    stdout_capture, stderr_capture = create_capture(), create_capture()
+
+    stdout = stdout if stdout is not None else stdout_capture
+    stderr = stderr if stderr is not None else stderr_capture
+
+    evictor = get_module_evictor()
+
+    start = perf_counter()
+    try:
+        with evictor.track(name) if evictor else nullcontext():
+            call_command(name, *argv, stdout=stdout, stderr=stderr)
+    except CommandError as exc:
+        stderr.write(f"CommandError: {exc}\n")
+        exit_code = exc.returncode
+    except SystemExit as exc:
+        exit_code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    except Exception:  # noqa: BLE001
+        stderr.write(traceback.format_exc())
+        exit_code = 1
+    else:
+        exit_code = 0
+    duration = perf_counter() - start
+
+    return CommandResult(
+        [name, *argv],
+        exit_code,
+        get_captured_output(stdout_capture),
+        get_captured_output(stderr_capture),
+        duration,
+    )
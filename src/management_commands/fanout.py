@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from io import TextIOBase
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.db import connections
+
+from .execution import CommandResult, run_command
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+
+class DatabaseResult(NamedTuple):
+    database: str
+    result: CommandResult
+
+
+class PrefixedStream(TextIOBase):
+    def __init__(self, stream: TextIOBase, prefix: str, lock: threading.Lock) -> None:
+        super().__init__()
+
+        self.stream = stream
+        self.prefix = prefix
+        self.lock = lock
+
+        self._partial_line = ""
+
+    @override
+    def write(self, s: str) -> int:
+        *lines, self._partial_line = (self._partial_line + s).split("\n")
+
+        if lines:
+            with self.lock:
+                self.stream.write("".join(f"{self.prefix}{line}\n" for line in lines))
+                self.stream.flush()
+
+        return len(s)
+
+    @override
+    def flush(self) -> None:
+        self.stream.flush()
+
+    @override
+    def close(self) -> None:
+        if self._partial_line:
+            self.write("\n")
+
+        super().close()
+
+    @override
+    def isatty(self) -> bool:
+        return False
+
+
+def match_databases(patterns: Sequence[str]) -> list[str]:
+    return [
+        alias
+        for alias in connections
+        if any(fnmatchcase(alias, pattern) for pattern in patterns)
+    ]
+
+
+def _run_on_database(
+    name: str,
+    argv: Sequence[str],
+    database: str,
+    stdout: TextIOBase,
+    stderr: TextIOBase,
+) -> DatabaseResult:
+    try:
+        result = run_command(
+            name,
+            [*argv, "--database", database],
+            stdout=stdout,
+            stderr=stderr,
+        )
+    finally:
+        stdout.close()
+        stderr.close()
+
+        connections.close_all()
+
+    return DatabaseResult(database, result)
+
+
+def fan_out(  # noqa: PLR0913
+    name: str,
+    argv: Sequence[str],
+    databases: Sequence[str],
+    *,
+    stdout: TextIOBase,
+    stderr: TextIOBase,
+    workers: int | None = None,
+) -> list[DatabaseResult]:
+    lock = threading.Lock()
+
+    width = max(map(len, databases), default=0)
+
+    with ThreadPoolExecutor(max_workers=workers or len(databases) or 1) as executor:
+        futures = [
+            executor.submit(
+                _run_on_database,
+                name,
+                argv,
+                database,
+                PrefixedStream(stdout, f"[{database:<{width}}] ", lock),
+                PrefixedStream(stderr, f"[{database:<{width}}] ", lock),
+            )
+            for database in databases
+        ]
+
+    return [future.result() for future in futures]
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import sqlite3
+import sys
+import time
+from contextlib import closing, contextmanager, suppress
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from .conf import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+ALIAS_ENVIRONMENT_VARIABLE = "MANAGEMENT_COMMANDS_HISTORY_ALIAS"
+
+MIN_BASELINE_RUNS = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    argv TEXT NOT NULL,
+    alias TEXT,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    exit_code INTEGER NOT NULL,
+    peak_memory INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_name_started_at ON runs (name, started_at);
+"""
+
+
+class Summary(NamedTuple):
+    name: str
+    runs: int
+    failures: int
+    p50: float | None
+    p95: float | None
+    latest: float | None
+    regressed: bool
+
+
+class Run(NamedTuple):
+    name: str
+    argv: list[str]
+    alias: str | None
+    started_at: float
+    duration: float
+    exit_code: int
+    peak_memory: int | None
+
+
+def connect(path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=30)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+
+    return connection
+
+
+def get_peak_memory() -> int | None:
+    if resource is None:  # pragma: no cover
+        return None
+
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return peak_memory if sys.platform == "darwin" else peak_memory * 1024
+
+
+def get_peak_memory_growth(start_peak_memory: int | None) -> int | None:
+    if start_peak_memory is None or (peak_memory := get_peak_memory()) is None:
+        return None
+
+    return peak_memory - start_peak_memory
+
+
+def save_run(path: str, run: Run) -> None:
+    with closing(connect(path)) as connection, connection:
+        connection.execute(
+            "INSERT INTO runs "
+            "(name, argv, alias, started_at, duration, exit_code, peak_memory) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                run.name,
+                json.dumps(run.argv),
+                run.alias,
+                run.started_at,
+                run.duration,
+                run.exit_code,
+                run.peak_memory,
+            ),
+        )
+
+
+def get_runs(
+    path: str,
+    name: str | None = None,
+    limit: int | None = None,
+) -> list[Run]:
+    query = (
+        "SELECT name, argv, alias, started_at, duration, exit_code, peak_memory "
+        "FROM runs"
+    )
+    params: list[object] = []
+
+    if name is not None:
+        query += " WHERE name = ?"
+        params.append(name)
+
+    query += " ORDER BY started_at DESC, id DESC"
+
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    with closing(connect(path)) as connection:
+        rows = connection.execute(query, params).fetchall()
+
+    return [Run(row[0], json.loads(row[1]), *row[2:]) for row in rows]
+
+
+def get_command_names(path: str) -> list[str]:
+    with closing(connect(path)) as connection:
+        rows = connection.execute("SELECT DISTINCT name FROM runs ORDER BY name")
+
+        return [name for (name,) in rows]
+
+
+def get_mean_durations(path: str, names: Iterable[str]) -> dict[str, float]:
+    names = list(dict.fromkeys(names))
+
+    with closing(connect(path)) as connection:
+        rows = connection.execute(
+            "SELECT name, AVG(duration) FROM runs "  # noqa: S608
+            f"WHERE name IN ({', '.join('?' * len(names))}) AND exit_code = 0 "
+            "GROUP BY name",
+            names,
+        ).fetchall()
+
+    return dict(rows)
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    ordered = sorted(values)
+
+    return ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+
+
+def summarize_runs(name: str, runs: Sequence[Run], *, threshold: float) -> Summary:
+    durations = [run.duration for run in runs if not run.exit_code]
+
+    if not durations:
+        return Summary(name, len(runs), len(runs), None, None, None, regressed=False)
+
+    latest, *previous = durations
+
+    return Summary(
+        name,
+        len(runs),
+        len(runs) - len(durations),
+        percentile(durations, 50),
+        percentile(durations, 95),
+        latest,
+        regressed=len(previous) >= MIN_BASELINE_RUNS
+        and latest > threshold * percentile(previous, 50),
+    )
+
+
+def get_longest_first_order(names: Sequence[str]) -> list[int]:
+    if not (path := settings.HISTORY_DB):
+        return list(range(len(names)))
+
+    try:
+        durations = get_mean_durations(path, names)
+    except sqlite3.Error:
+        return list(range(len(names)))
+
+    return sorted(
+        range(len(names)),
+        key=lambda index: -durations.get(names[index], math.inf),
+    )
+
+
+@contextmanager
+def record_run(
+    name: str,
+    argv: Sequence[str],
+    alias: str | None = None,
+) -> Iterator[None]:
+    if not (path := settings.HISTORY_DB):
+        yield
+        return
+
+    alias = alias or os.environ.get(ALIAS_ENVIRONMENT_VARIABLE)
+
+    started_at = time.time()
+    start = perf_counter()
+    start_peak_memory = get_peak_memory()
+
+    exit_code = 1
+    try:
+        yield
+    except SystemExit as exc:
+        exit_code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+        raise
+    else:
+        exit_code = 0
+    finally:
+        with suppress(sqlite3.Error):
+            save_run(
+                path,
+                Run(
+                    name,
+                    list(argv),
+                    alias,
+                    started_at,
+                    perf_counter() - start,
+                    exit_code,
+                    get_peak_memory_growth(start_peak_memory),
+                ),
+            )
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from typing import TYPE_CHECKING, NamedTuple
+
+from .conf import settings
+from .exceptions import CommandQueueNotConfiguredError
+from .execution import run_command
+from .spooling import get_output_value
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from threading import Event
+
+    from .execution import CommandResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    argv TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    worker TEXT,
+    heartbeat_at REAL,
+    exit_code INTEGER,
+    stdout TEXT,
+    stderr TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status_id ON jobs (status, id);
+"""
+
+_COLUMNS = (
+    "id, name, argv, status, enqueued_at, started_at, finished_at, worker, "
+    "heartbeat_at, exit_code, stdout, stderr"
+)
+
+
+class Job(NamedTuple):
+    id: int
+    name: str
+    argv: list[str]
+    status: str
+    enqueued_at: float
+    started_at: float | None
+    finished_at: float | None
+    worker: str | None
+    heartbeat_at: float | None
+    exit_code: int | None
+    stdout: str | None
+    stderr: str | None
+
+
+def _get_queue_path(path: str | None) -> str:
+    if not (path := path or settings.QUEUE_DB):
+        raise CommandQueueNotConfiguredError
+
+    return path
+
+
+def _to_job(row: tuple[object, ...]) -> Job:
+    return Job(row[0], row[1], json.loads(row[2]), *row[3:])  # type: ignore[arg-type]
+
+
+def connect(path: str | None = None) -> sqlite3.Connection:
+    connection = sqlite3.connect(
+        _get_queue_path(path),
+        timeout=30,
+        isolation_level=None,
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+
+    return connection
+
+
+def enqueue(name: str, argv: Sequence[str] = (), *, path: str | None = None) -> int:
+    with closing(connect(path)) as connection:
+        cursor = connection.execute(
+            "INSERT INTO jobs (name, argv, enqueued_at) VALUES (?, ?, ?)",
+            (name, json.dumps(list(argv)), time.time()),
+        )
+
+    return cursor.lastrowid  # type: ignore[return-value]
+
+
+def get_job(job_id: int, *, path: str | None = None) -> Job | None:
+    with closing(connect(path)) as connection:
+        row = connection.execute(
+            f"SELECT {_COLUMNS} FROM jobs WHERE id = ?",  # noqa: S608
+            (job_id,),
+        ).fetchone()
+
+    return _to_job(row) if row else None
+
+
+def claim_job(
+    connection: sqlite3.Connection,
+    worker: str,
+    *,
+    lease_timeout: float | None = None,
+) -> Job | None:
+    lease_timeout = lease_timeout or settings.QUEUE_LEASE_TIMEOUT
+    now = time.time()
+
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        row = connection.execute(
+            f"SELECT {_COLUMNS} FROM jobs "  # noqa: S608
+            "WHERE status = 'queued' OR (status = 'running' AND heartbeat_at < ?) "
+            "ORDER BY id LIMIT 1",
+            (now - lease_timeout,),
+        ).fetchone()
+
+        if row:
+            connection.execute(
+                "UPDATE jobs SET status = 'running', started_at = ?, worker = ?, "
+                "heartbeat_at = ? WHERE id = ?",
+                (now, worker, now, row[0]),
+            )
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    else:
+        connection.execute("COMMIT")
+
+    return _to_job(row) if row else None
+
+
+@contextmanager
+def keep_job_alive(
+    path: str | None,
+    job: Job,
+    worker: str,
+    *,
+    interval: float,
+) -> Iterator[None]:
+    stop = threading.Event()
+
+    def beat() -> None:
+        with closing(connect(path)) as connection:
+            while not stop.wait(interval):
+                connection.execute(
+                    "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND worker = ?",
+                    (time.time(), job.id, worker),
+                )
+
+    thread = threading.Thread(target=beat, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def finish_job(connection: sqlite3.Connection, job: Job, result: CommandResult) -> None:
+    connection.execute(
+        "UPDATE jobs SET status = ?, finished_at = ?, exit_code = ?, stdout = ?, "
+        "stderr = ? WHERE id = ?",
+        (
+            "failed" if result.exit_code else "succeeded",
+            time.time(),
+            result.exit_code,
+            get_output_value(result.stdout),
+            get_output_value(result.stderr),
+            job.id,
+        ),
+    )
+
+
+def requeue_job(connection: sqlite3.Connection, job: Job) -> None:
+    connection.execute(
+        "UPDATE jobs SET status = 'queued', started_at = NULL, worker = NULL, "
+        "heartbeat_at = NULL WHERE id = ?",
+        (job.id,),
+    )
+
+
+def run_worker(
+    path: str | None = None,
+    *,
+    poll_interval: float = 1.0,
+    burst: bool = False,
+    stop: Event | None = None,
+    callback: Callable[[Job, CommandResult], None] | None = None,
+) -> int:
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+
+    lease_timeout = settings.QUEUE_LEASE_TIMEOUT
+
+    processed = 0
+    with closing(connect(path)) as connection:
+        while not (stop and stop.is_set()):
+            if (
+                job := claim_job(connection, worker, lease_timeout=lease_timeout)
+            ) is None:
+                if burst:
+                    break
+
+                time.sleep(poll_interval)
+                continue
+
+            try:
+                with keep_job_alive(path, job, worker, interval=lease_timeout / 3):
+                    result = run_command(job.name, job.argv)
+            except BaseException:
+                requeue_job(connection, job)
+                raise
+
+            finish_job(connection, job, result)
+            processed += 1
+
+            if callback:
+                callback(job, result)
+
+    return processed
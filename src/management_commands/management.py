@@ -1,17 +1,47 @@
 from __future__ import annotations
 
+import os
 import sys
-from typing import TYPE_CHECKING
+from contextlib import suppress
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
+import django
 from django.core.management import ManagementUtility as BaseManagementUtility
+from django.core.management import call_command as django_call_command
+from django.core.management.base import CommandError
 from django.core.management.color import color_style
 
+from .aliases import (
+    PIPE_OPERATOR,
+    manage_step_connections,
+    run_in_forks,
+    run_in_subprocesses,
+    split_pipeline,
+)
+from .caching import get_help_fingerprint, read_cache, write_cache
 from .conf import settings
-from .core import import_command_class, load_command_class
+from .core import (
+    create_command,
+    get_command_class,
+    get_command_namespace,
+    get_command_trie,
+    resolve_command_class,
+    resolve_command_name,
+)
+from .exceptions import ManagementCommandsException
+from .history import ALIAS_ENVIRONMENT_VARIABLE, get_longest_first_order, record_run
+from .namespaces import NAMESPACE_SEPARATOR
+from .singleflight import wrap_single_flight
 
 if TYPE_CHECKING:
+    from io import TextIOBase
+    from typing import TextIO
+
     from django.core.management.base import BaseCommand
 
+    from .namespaces import Namespace
+
 if sys.version_info >= (3, 12):
     from typing import override
 else:
@@ -19,8 +49,24 @@ else:
 
 
 class ManagementUtility(BaseManagementUtility):
+    alias: str | None = None
+
     @override
     def main_help_text(self, commands_only: bool = False) -> str:
+        if not (cache_dir := settings.HELP_CACHE_DIR) or self.settings_exception:
+            return self.render_main_help_text(commands_only=commands_only)
+
+        fingerprint = get_help_fingerprint(self.prog_name, commands_only=commands_only)
+        key = f"help-{fingerprint}"
+
+        if (help_text := read_cache(cache_dir, key)) is None:
+            help_text = self.render_main_help_text(commands_only=commands_only)
+
+            write_cache(cache_dir, key, help_text)
+
+        return help_text
+
+    def render_main_help_text(self, *, commands_only: bool = False) -> str:
         usage = super().main_help_text(commands_only=commands_only)
 
         style = color_style()
@@ -31,7 +77,11 @@ class ManagementUtility(BaseManagementUtility):
                 *[f"    {path}" for path in paths],
                 "",
             ]
-            if (paths := settings.PATHS)
+            if (
+                paths := [
+                    path for path in settings.PATHS if NAMESPACE_SEPARATOR not in path
+                ]
+            )
             else []
         )
         aliases_usage = (
@@ -40,30 +90,48 @@ class ManagementUtility(BaseManagementUtility):
                 *[f"    {alias}" for alias in aliases],
                 "",
             ]
-            if (aliases := settings.ALIASES)
+            if (
+                aliases := [
+                    alias
+                    for alias in settings.ALIASES
+                    if NAMESPACE_SEPARATOR not in alias
+                ]
+            )
             else []
         )
+        namespaces_usage = [
+            line
+            for namespace in get_command_trie().namespaces
+            for line in self.render_namespace_help_text(namespace)
+        ]
 
         usage_list = usage.split("\n")
         usage_list.append("")
         usage_list.extend(commands_usage)
         usage_list.extend(aliases_usage)
+        usage_list.extend(namespaces_usage)
 
         return "\n".join(usage_list)
 
+    def render_namespace_help_text(self, namespace: Namespace) -> list[str]:
+        style = color_style()
+
+        return [
+            style.NOTICE(f"[django-management-commands: {namespace.path}]"),
+            *[f"    {name}" for name in namespace.iter_names()],
+            "",
+        ]
+
     @override
     def fetch_command(self, subcommand: str) -> BaseCommand:
-        if dotted_path := settings.PATHS.get(subcommand):
-            command_class = import_command_class(dotted_path)
-        else:
-            try:
-                app_label, name = subcommand.rsplit(".", 1)
-            except ValueError:
-                app_label, name = None, subcommand
+        command_class = resolve_command_class(subcommand)
+
+        command = create_command(command_class)
 
-            command_class = load_command_class(name, app_label)
+        if mode := settings.SINGLE_FLIGHT.get(subcommand):
+            wrap_single_flight(command, mode)
 
-        return command_class()
+        return command
 
     @override
     def execute(self) -> None:
@@ -72,19 +140,168 @@ class ManagementUtility(BaseManagementUtility):
         except IndexError:
             super().execute()
         else:
-            if name in settings.PATHS:
-                utility = self.__class__([self.prog_name, name, *self.argv[2:]])
-                super(ManagementUtility, utility).execute()
-            elif alias_exprs := settings.ALIASES.get(name):
-                for alias_expr in alias_exprs:
-                    argv = alias_expr.split()
+            self.argv[1] = name = resolve_command_name(name)
+
+            if namespace := get_command_namespace(name):
+                sys.stdout.write("\n".join(self.render_namespace_help_text(namespace)))
+                return
+
+            with record_run(name, self.argv[2:], alias=self.alias):
+                self.execute_subcommand(name)
+
+    def execute_subcommand(self, name: str) -> None:
+        if name in settings.PATHS and name in settings.STANDALONE:
+            self.execute_standalone(name)
+        elif name in settings.PATHS:
+            utility = self.__class__([self.prog_name, name, *self.argv[2:]])
+            super(ManagementUtility, utility).execute()
+        elif alias_exprs := settings.ALIASES.get(name):
+            self.execute_alias(alias_exprs)
+        else:
+            super().execute()
+
+    def execute_standalone(self, name: str) -> None:
+        command = self.fetch_command(name)
+
+        command.requires_system_checks = []
+        command.requires_migrations_checks = False
+
+        command.run_from_argv(self.argv)
+
+    def execute_alias(self, alias_exprs: list[str]) -> None:
+        name = self.argv[1]
+
+        if settings.ALIAS_MODE == "subprocess":
+            workers = settings.ALIAS_WORKERS
+
+            exit_codes = run_alias_in_subprocesses(
+                self.get_prefix_argv(),
+                name,
+                alias_exprs,
+                workers=workers,
+                order=(
+                    get_longest_first_order(
+                        [alias_expr.split()[0] for alias_expr in alias_exprs],
+                    )
+                    if workers > 1
+                    else None
+                ),
+            )
+
+        elif settings.ALIAS_MODE == "fork":
+            django.setup()
+
+            for alias_expr in alias_exprs:
+                with suppress(ManagementCommandsException):
+                    resolve_command_class(alias_expr.split()[0])
+
+            exit_codes = run_in_forks(partial(self.execute_step, name), alias_exprs)
+        else:
+            for alias_expr in alias_exprs:
+                self.execute_step(name, alias_expr.split())
 
-                    utility = ManagementUtility([self.prog_name, *argv])
-                    utility.execute()
-            else:
-                super().execute()
+            return
+
+        if exit_code := next(filter(None, exit_codes), 0):
+            sys.exit(exit_code)
+
+    def get_prefix_argv(self) -> list[str]:
+        main_spec = getattr(sys.modules.get("__main__"), "__spec__", None)
+
+        if main_spec and main_spec.name == f"{__package__}.__main__":
+            return [sys.executable, "-m", __package__]
+
+        return [sys.executable, self.argv[0]]
+
+    def execute_step(self, alias: str, argv: list[str]) -> None:
+        if PIPE_OPERATOR in argv:
+            self.execute_pipeline(alias, argv)
+            return
+
+        utility = ManagementUtility([self.prog_name, *argv])
+        utility.alias = alias
+
+        with manage_step_connections(argv, preconnect=settings.ALIAS_PRECONNECT):
+            utility.execute()
+
+    def execute_pipeline(self, alias: str, argv: list[str]) -> None:
+        (exit_code,) = run_alias_in_subprocesses(
+            self.get_prefix_argv(),
+            alias,
+            [" ".join(argv)],
+        )
+
+        if exit_code:
+            sys.exit(exit_code)
+
+
+def run_alias_in_subprocesses(  # noqa: PLR0913
+    prefix_argv: list[str],
+    alias: str,
+    alias_exprs: list[str],
+    *,
+    stdout: TextIO | TextIOBase | None = None,
+    stderr: TextIO | TextIOBase | None = None,
+    workers: int = 1,
+    order: list[int] | None = None,
+) -> list[int | None]:
+    return run_in_subprocesses(
+        prefix_argv,
+        alias_exprs,
+        stdout=stdout or sys.stdout,
+        stderr=stderr or sys.stderr,
+        workers=workers,
+        order=order,
+        env={**os.environ, ALIAS_ENVIRONMENT_VARIABLE: alias},
+        pipe_size=settings.ALIAS_PIPE_SIZE,
+    )
 
 
 def execute_from_command_line(argv: list[str] | None = None) -> None:
     utility = ManagementUtility(argv)
     utility.execute()
+
+
+def _call_alias_step(alias: str, argv: list[str], options: dict[str, Any]) -> Any:
+    if PIPE_OPERATOR in argv:
+        (exit_code,) = run_alias_in_subprocesses(
+            [sys.executable, "-m", __package__],
+            alias,
+            [" ".join(argv)],
+            stdout=options.get("stdout"),
+            stderr=options.get("stderr"),
+        )
+
+        if exit_code:
+            msg = f"pipeline {' '.join(argv)!r} failed with exit code {exit_code}"
+
+            raise CommandError(msg, returncode=exit_code)
+
+        return exit_code
+
+    return call_command(*argv, **options)
+
+
+def _get_alias_step_argv(alias_expr: str, args: tuple[Any, ...]) -> list[str]:
+    step_argv: list[str] = []
+    for index, argv in enumerate(split_pipeline(alias_expr)):
+        if index:
+            step_argv.append(PIPE_OPERATOR)
+
+        step_argv.extend([*argv, *map(str, args)])
+
+    return step_argv
+
+
+def call_command(name: str, *args: Any, **options: Any) -> Any:
+    name = resolve_command_name(name)
+
+    if name not in settings.PATHS and (alias_exprs := settings.ALIASES.get(name)):
+        return [
+            _call_alias_step(name, _get_alias_step_argv(alias_expr, args), options)
+            for alias_expr in alias_exprs
+        ]
+
+    command = create_command(get_command_class(name))
+
+    return django_call_command(command, *args, **options)
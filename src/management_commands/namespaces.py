@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .exceptions import CommandNameAmbiguityError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+NAMESPACE_SEPARATOR = ":"
+
+
+class _SegmentNode:
+    __slots__ = ("children", "count", "first", "segment")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _SegmentNode] = {}
+        self.count = 0
+        self.first: str | None = None
+        self.segment: str | None = None
+
+
+class SegmentIndex:
+    def __init__(self) -> None:
+        self._root = _SegmentNode()
+
+    def add(self, segment: str) -> None:
+        nodes = [self._root]
+        for char in segment:
+            nodes.append(nodes[-1].children.setdefault(char, _SegmentNode()))
+
+        if nodes[-1].segment is not None:
+            return
+
+        nodes[-1].segment = segment
+
+        for node in nodes:
+            node.count += 1
+            node.first = node.first or segment
+
+    def _iter_segments(self, node: _SegmentNode) -> Iterator[str]:
+        if node.segment is not None:
+            yield node.segment
+
+        for child in node.children.values():
+            yield from self._iter_segments(child)
+
+    def match(self, prefix: str) -> list[str]:
+        node = self._root
+        for char in prefix:
+            if (child := node.children.get(char)) is None:
+                return []
+
+            node = child
+
+        if node.segment is not None:
+            return [node.segment]
+
+        if node.count == 1 and node.first is not None:
+            return [node.first]
+
+        return sorted(self._iter_segments(node))
+
+
+class Namespace:
+    __slots__ = ("children", "name", "names", "namespaces", "path")
+
+    def __init__(self, path: str = "") -> None:
+        self.path = path
+        self.name: str | None = None
+        self.children: dict[str, Namespace] = {}
+        self.names = SegmentIndex()
+        self.namespaces = SegmentIndex()
+
+    def add_child(self, segment: str) -> Namespace:
+        if (child := self.children.get(segment)) is None:
+            child = self.children[segment] = Namespace(
+                f"{self.path}{NAMESPACE_SEPARATOR}{segment}" if self.path else segment,
+            )
+
+        return child
+
+    def iter_names(self) -> Iterator[str]:
+        if self.name is not None:
+            yield self.name
+
+        for segment in sorted(self.children):
+            yield from self.children[segment].iter_names()
+
+
+class CommandTrie:
+    def __init__(self, names: Iterable[str]) -> None:
+        self.root = Namespace()
+
+        for name in names:
+            *namespace_segments, segment = name.split(NAMESPACE_SEPARATOR)
+
+            node = self.root
+            for namespace_segment in namespace_segments:
+                node.namespaces.add(namespace_segment)
+                node = node.add_child(namespace_segment)
+
+            node.names.add(segment)
+            node.add_child(segment).name = name
+
+    @property
+    def namespaces(self) -> list[Namespace]:
+        return [
+            self.root.children[segment]
+            for segment in sorted(self.root.children)
+            if self.root.children[segment].children
+        ]
+
+    def _match(
+        self,
+        query: str,
+        node: Namespace,
+        index: SegmentIndex,
+        abbreviation: str,
+    ) -> Namespace | None:
+        if not (segments := index.match(abbreviation)):
+            return None
+
+        if len(segments) > 1:
+            raise CommandNameAmbiguityError(
+                query,
+                [node.children[segment].path for segment in segments],
+            )
+
+        return node.children[segments[0]]
+
+    def _find(self, query: str, abbreviations: list[str]) -> Namespace | None:
+        node: Namespace | None = self.root
+        for abbreviation in abbreviations:
+            if node is None:
+                break
+
+            node = self._match(query, node, node.namespaces, abbreviation)
+
+        return node
+
+    def resolve(self, query: str) -> str | None:
+        *abbreviations, abbreviation = query.split(NAMESPACE_SEPARATOR)
+
+        if (node := self._find(query, abbreviations)) is None or (
+            child := self._match(query, node, node.names, abbreviation)
+        ) is None:
+            return None
+
+        return child.name
+
+    def find_namespace(self, query: str) -> Namespace | None:
+        return self._find(query, query.split(NAMESPACE_SEPARATOR))
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+import pytest
+
+if TYPE_CHECKING:
+    from .core import CommandResolver
+    from .execution import CommandResult
+
+
+class RunCommand(Protocol):
+    def __call__(self, name: str, *argv: str) -> CommandResult: ...
+
+
+@pytest.fixture(scope="session")
+def command_resolver() -> CommandResolver:
+    from .core import CommandResolver, get_settings_fingerprint  # noqa: PLC0415
+
+    return CommandResolver(fingerprint=get_settings_fingerprint)
+
+
+@pytest.fixture
+def run_command(command_resolver: CommandResolver) -> RunCommand:
+    from .core import use_command_resolver  # noqa: PLC0415
+    from .execution import run_command  # noqa: PLC0415
+
+    def run(name: str, *argv: str) -> CommandResult:
+        with use_command_resolver(command_resolver):
+            return run_command(name, argv)
+
+    return run
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING, NamedTuple
+
+from .conf import settings
+from .cron import CronExpression, parse_cron_expression
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+    from datetime import datetime
+
+MAX_CATCH_UP = timedelta(days=1)
+
+
+class ScheduledJob(NamedTuple):
+    expression: str
+    cron: CronExpression
+    command_expr: str
+
+
+class ScheduleEvent(NamedTuple):
+    job: ScheduledJob
+    scheduled_at: datetime
+    status: str
+
+
+def get_scheduled_jobs() -> list[ScheduledJob]:
+    return [
+        ScheduledJob(expression, parse_cron_expression(expression), command_expr)
+        for expression, command_exprs in settings.SCHEDULE.items()
+        for command_expr in command_exprs
+    ]
+
+
+class Scheduler:
+    def __init__(
+        self,
+        jobs: list[ScheduledJob],
+        run_job: Callable[[ScheduledJob, datetime], object],
+        *,
+        workers: int,
+        misfire_grace_time: timedelta,
+    ) -> None:
+        self.jobs = jobs
+        self.run_job = run_job
+        self.misfire_grace_time = misfire_grace_time
+
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="scheduler")
+        self._running: dict[int, Future[object]] = {}
+        self._lock = threading.Lock()
+        self._last_tick: datetime | None = None
+
+    def _iter_minutes(self, now: datetime) -> list[datetime]:
+        if self._last_tick is None:
+            return [now]
+
+        minute = max(self._last_tick, now - MAX_CATCH_UP) + timedelta(minutes=1)
+
+        minutes: list[datetime] = []
+        while minute <= now:
+            minutes.append(minute)
+            minute += timedelta(minutes=1)
+
+        return minutes
+
+    def _is_running(self, index: int) -> bool:
+        with self._lock:
+            return index in self._running
+
+    def _submit(self, index: int, job: ScheduledJob, scheduled_at: datetime) -> None:
+        future = self._executor.submit(self.run_job, job, scheduled_at)
+
+        with self._lock:
+            self._running[index] = future
+
+        def done(_future: Future[object]) -> None:
+            with self._lock:
+                self._running.pop(index, None)
+
+        future.add_done_callback(done)
+
+    def tick(self, now: datetime) -> list[ScheduleEvent]:
+        now = now.replace(second=0, microsecond=0)
+
+        minutes = self._iter_minutes(now)
+        self._last_tick = now
+
+        events: list[ScheduleEvent] = []
+        for index, job in enumerate(self.jobs):
+            if not (due := [minute for minute in minutes if job.cron.matches(minute)]):
+                continue
+
+            scheduled_at = due[-1]
+
+            if now - scheduled_at > self.misfire_grace_time:
+                status = "misfired"
+            elif self._is_running(index):
+                status = "skipped"
+            else:
+                status = "started"
+
+                self._submit(index, job, scheduled_at)
+
+            events.append(ScheduleEvent(job, scheduled_at, status))
+
+        return events
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from .conf import settings
+from .exceptions import SingleFlightDirectoryError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from django.core.management.base import BaseCommand
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+
+class SingleFlightResult(NamedTuple):
+    status: str
+    exit_code: int = 0
+
+
+def get_single_flight_key(command_class: type[BaseCommand], argv: Sequence[str]) -> str:
+    command_path = f"{command_class.__module__}.{command_class.__qualname__}"
+
+    return hashlib.sha256(json.dumps([command_path, *argv]).encode()).hexdigest()
+
+
+def get_default_lock_dir() -> Path:
+    path = Path(tempfile.gettempdir()) / f"management-commands-{os.getuid()}"
+
+    path.mkdir(mode=0o700, exist_ok=True)
+
+    path_stat = path.lstat()
+    if (
+        not stat.S_ISDIR(path_stat.st_mode)
+        or path_stat.st_uid != os.getuid()
+        or path_stat.st_mode & 0o077
+    ):
+        raise SingleFlightDirectoryError(str(path))
+
+    return path
+
+
+def _open_lock_file(path: Path) -> int:
+    return os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+
+
+def _read_status(path: Path) -> tuple[str, int] | None:
+    try:
+        with os.fdopen(os.open(path, os.O_RDONLY | os.O_NOFOLLOW)) as file:
+            token, exit_code = file.read().split()
+        return token, int(exit_code)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_status(path: Path, exit_code: int) -> None:
+    with tempfile.NamedTemporaryFile(
+        "w",
+        dir=path.parent,
+        prefix=f"{path.name}.",
+        delete=False,
+    ) as file:
+        file.write(f"{uuid.uuid4().hex} {exit_code}")
+
+    Path(file.name).replace(path)
+
+
+def _get_exit_code(exc: SystemExit) -> int:
+    return exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+
+
+def run_single_flight(
+    func: Callable[[], object],
+    key: str,
+    *,
+    mode: str,
+    lock_dir: str | None = None,
+) -> SingleFlightResult:
+    if fcntl is None:  # pragma: no cover
+        func()
+        return SingleFlightResult("ran")
+
+    lock_dir_path = Path(lock_dir) if lock_dir else get_default_lock_dir()
+    lock_path = lock_dir_path / f"management-commands-{key}.lock"
+    status_path = lock_dir_path / f"management-commands-{key}.status"
+
+    with os.fdopen(_open_lock_file(lock_path), "r+") as lock_file:
+        status = _read_status(status_path)
+
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            if mode == "skip":
+                return SingleFlightResult("skipped")
+
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            if (new_status := _read_status(status_path)) and new_status != status:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+                return SingleFlightResult("reused", new_status[1])
+
+        exit_code = 1
+        try:
+            func()
+        except SystemExit as exc:
+            exit_code = _get_exit_code(exc)
+            raise
+        else:
+            exit_code = 0
+        finally:
+            _write_status(status_path, exit_code)
+
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    return SingleFlightResult("ran")
+
+
+def wrap_single_flight(command: BaseCommand, mode: str) -> None:
+    run_from_argv = command.run_from_argv
+
+    def run_from_argv_single_flight(argv: list[str]) -> None:
+        result = run_single_flight(
+            lambda: run_from_argv(argv),
+            get_single_flight_key(type(command), argv[2:]),
+            mode=mode,
+            lock_dir=settings.SINGLE_FLIGHT_DIR,
+        )
+
+        if result.status == "skipped":
+            sys.stderr.write("Identical command is already running; skipping.\n")
+        elif result.exit_code:
+            sys.exit(result.exit_code)
+
+    command.run_from_argv = run_from_argv_single_flight  # type: ignore[method-assign]
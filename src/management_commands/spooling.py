@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import codecs
+import gzip
+import os
+import shutil
+import sys
+import tempfile
+import weakref
+from collections import deque
+from contextlib import suppress
+from io import StringIO, TextIOBase
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from .conf import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+CHUNK_SIZE = 64 * 1024
+
+COMPRESS_LEVEL = 1
+
+ENCODING = "utf-8"
+
+ERRORS = "surrogatepass"
+
+PREFIX = "management_commands_"
+
+SUFFIX = ".gz"
+
+
+def _discard(file: IO[bytes] | None, path: str) -> None:
+    if file:
+        file.close()
+
+    with suppress(OSError):
+        Path(path).unlink()
+
+
+def _copy_spool(path: str) -> str:
+    fd, copy_path = tempfile.mkstemp(prefix=PREFIX, suffix=SUFFIX)
+
+    try:
+        os.close(fd)
+        Path(copy_path).unlink()
+        os.link(path, copy_path)
+    except OSError:
+        shutil.copyfile(path, copy_path)
+
+    return copy_path
+
+
+class SpooledOutput(TextIOBase):
+    def __init__(self, threshold: int) -> None:
+        super().__init__()
+
+        self.threshold = threshold
+
+        self._buffer = StringIO()
+        self._buffer_limit = threshold
+        self._file: IO[bytes] | None = None
+        self._path: str | None = None
+        self._compressor: gzip.GzipFile | None = None
+        self._encoder = codecs.getincrementalencoder(ENCODING)(ERRORS)
+        self._compressed_length = 0
+        self._handed_over = False
+        self._finalizer: (
+            weakref.finalize[[IO[bytes] | None, str], SpooledOutput] | None
+        ) = None
+
+    @property
+    def path(self) -> str | None:
+        return self._path
+
+    @property
+    def spooled(self) -> bool:
+        return self._path is not None
+
+    @property
+    def length(self) -> int:
+        return self._compressed_length + self._buffer.tell()
+
+    @override
+    def writable(self) -> bool:
+        return True
+
+    @override
+    def readable(self) -> bool:
+        return False
+
+    @override
+    def write(self, s: str) -> int:
+        if self.closed:
+            msg = "I/O operation on closed spooled output"
+            raise ValueError(msg)
+
+        written = self._buffer.write(s)
+
+        if self._buffer.tell() > self._buffer_limit:
+            self._compress_buffer()
+
+        return written
+
+    @override
+    def flush(self) -> None:
+        if self._compressor and not self._compressor.closed:
+            self._compress_buffer()
+            self._compressor.flush()
+
+    @override
+    def close(self) -> None:
+        if self._compressor and not self._compressor.closed:
+            self._compress_buffer(final=True)
+            self._compressor.close()
+
+        if self._file:
+            self._file.flush()
+
+        super().close()
+
+    def _open(self, file: IO[bytes] | None, path: str) -> None:
+        self._file, self._path = file, path
+        self._finalizer = weakref.finalize(self, _discard, file, path)
+
+    def _roll_over(self) -> gzip.GzipFile:
+        fd, path = tempfile.mkstemp(prefix=PREFIX, suffix=SUFFIX)
+        self._open(os.fdopen(fd, "wb"), path)
+
+        self._buffer_limit = CHUNK_SIZE
+
+        return gzip.GzipFile(
+            fileobj=self._file,
+            mode="wb",
+            compresslevel=COMPRESS_LEVEL,
+        )
+
+    def _compress_buffer(self, *, final: bool = False) -> None:
+        if self._compressor is None:
+            self._compressor = self._roll_over()
+
+        value = self._buffer.getvalue()
+
+        self._compressor.write(self._encoder.encode(value, final=final))
+        self._compressed_length += len(value)
+
+        self._buffer = StringIO()
+
+    def iter_chunks(self, size: int = CHUNK_SIZE) -> Iterator[str]:
+        if self._path is None:
+            value = self._buffer.getvalue()
+
+            for start in range(0, len(value), size):
+                yield value[start : start + size]
+
+            return
+
+        self.flush()
+        if self._file:
+            self._file.flush()
+
+        decoder = codecs.getincrementaldecoder(ENCODING)(ERRORS)
+
+        with gzip.open(self._path, "rb") as file:
+            while True:
+                try:
+                    data = file.read1(size)
+                except EOFError:
+                    data = b""
+
+                if chunk := decoder.decode(data, final=not data):
+                    yield chunk
+
+                if not data:
+                    break
+
+    def iter_lines(self) -> Iterator[str]:
+        partial_line = ""
+        for chunk in self.iter_chunks():
+            *lines, partial_line = (partial_line + chunk).split("\n")
+
+            for line in lines:
+                yield f"{line}\n"
+
+        if partial_line:
+            yield partial_line
+
+    def tail(self, lines: int) -> str:
+        return "".join(deque(self.iter_lines(), maxlen=lines))
+
+    def getvalue(self) -> str:
+        return "".join(self.iter_chunks())
+
+    def hand_over(self) -> None:
+        self.close()
+
+        if self._finalizer:
+            self._finalizer.detach()
+            self._finalizer = None
+            self._handed_over = True
+
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __getstate__(self) -> dict[str, object]:
+        if self.spooled and not self.closed:
+            msg = "cannot pickle spooled output that is not closed"
+            raise TypeError(msg)
+
+        return {
+            "threshold": self.threshold,
+            "value": None if self.spooled else self._buffer.getvalue(),
+            "path": self._path,
+            "length": self.length,
+            "handed_over": self._handed_over,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["threshold"])  # type: ignore[misc]
+
+        if state["path"] is None:
+            self.write(state["value"])
+        else:
+            self._open(
+                None,
+                state["path"] if state["handed_over"] else _copy_spool(state["path"]),
+            )
+            self._compressed_length = state["length"]
+
+        self.close()
+
+
+def create_capture() -> StringIO | SpooledOutput:
+    if settings.SPOOL_THRESHOLD is None:
+        return StringIO()
+
+    return SpooledOutput(settings.SPOOL_THRESHOLD)
+
+
+def get_captured_output(capture: StringIO | SpooledOutput) -> str | SpooledOutput:
+    if isinstance(capture, SpooledOutput):
+        capture.close()
+
+        return capture
+
+    return capture.getvalue()
+
+
+def iter_output(output: str | SpooledOutput, size: int = CHUNK_SIZE) -> Iterator[str]:
+    if isinstance(output, str):
+        if output:
+            yield output
+    else:
+        yield from output.iter_chunks(size)
+
+
+def hand_over_output(output: str | SpooledOutput) -> None:
+    if isinstance(output, SpooledOutput):
+        output.hand_over()
+
+
+def get_output_value(output: str | SpooledOutput) -> str:
+    return output if isinstance(output, str) else output.getvalue()
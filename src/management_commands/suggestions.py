@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+CANDIDATES_PER_SUGGESTION = 4
+
+
+class NGramIndex:
+    def __init__(self, names: Iterable[str], n: int = 3) -> None:
+        self.n = n
+        self.names = sorted(set(names))
+
+        self._postings: defaultdict[str, list[int]] = defaultdict(list)
+        self._sizes: list[int] = []
+
+        for position, name in enumerate(self.names):
+            ngrams = self._get_ngrams(name)
+
+            self._sizes.append(len(ngrams))
+
+            for ngram in ngrams:
+                self._postings[ngram].append(position)
+
+    def _get_ngrams(self, s: str) -> set[str]:
+        padding = " " * (self.n - 1)
+        padded = f"{padding}{s.lower()}{padding}"
+
+        return {padded[i : i + self.n] for i in range(len(padded) - self.n + 1)}
+
+    def search(self, query: str, *, limit: int = 3, cutoff: float = 0.6) -> list[str]:
+        ngrams = self._get_ngrams(query)
+
+        shared = Counter(
+            position for ngram in ngrams for position in self._postings.get(ngram, ())
+        )
+
+        candidates = sorted(
+            shared,
+            key=lambda position: (
+                -2 * shared[position] / (len(ngrams) + self._sizes[position])
+            ),
+        )[: limit * CANDIDATES_PER_SUGGESTION]
+
+        matcher = SequenceMatcher(b=query.lower())
+
+        scores: list[tuple[float, str]] = []
+        for position in candidates:
+            name = self.names[position]
+
+            matcher.set_seq1(name.lower())
+            if (score := matcher.ratio()) >= cutoff:
+                scores.append((score, name))
+
+        scores.sort(key=lambda item: (-item[0], item[1]))
+
+        return [name for _, name in scores[:limit]]
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.apps.registry import apps
+from django.utils.autoreload import get_child_arguments
+
+from .caching import get_mtime
+from .core import clear_command_class_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from io import TextIOBase
+    from typing import TextIO
+
+    from django.core.management.base import BaseCommand
+
+
+def _iter_python_files(path: Path) -> Iterator[Path]:
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False) and entry.name != "__pycache__":
+            yield from _iter_python_files(Path(entry.path))
+        elif entry.name.endswith(".py"):
+            yield Path(entry.path)
+
+
+def _get_module_file(module_name: str) -> Path | None:
+    if (module := sys.modules.get(module_name)) and (
+        file := getattr(module, "__file__", None)
+    ):
+        return Path(file).resolve()
+
+    return None
+
+
+def get_restart_paths() -> set[Path]:
+    paths = {
+        path
+        for app_config in apps.get_app_configs()
+        if app_config.models_module
+        and (path := _get_module_file(app_config.models_module.__name__))
+    }
+
+    if (settings_module := os.environ.get("DJANGO_SETTINGS_MODULE")) and (
+        path := _get_module_file(settings_module)
+    ):
+        paths.add(path)
+
+    return paths
+
+
+def get_command_paths(command_classes: Iterable[type[BaseCommand]]) -> set[Path]:
+    return {
+        path
+        for command_class in command_classes
+        if (path := _get_module_file(command_class.__module__))
+    }
+
+
+def get_watched_paths(command_class: type[BaseCommand]) -> set[Path]:
+    paths = get_command_paths([command_class])
+
+    app_config = apps.get_containing_app_config(command_class.__module__)
+    if app_config:
+        paths.update(
+            path.resolve() for path in _iter_python_files(Path(app_config.path))
+        )
+
+    return paths | get_restart_paths()
+
+
+class Watcher:
+    def __init__(self, paths: Iterable[Path]) -> None:
+        self.paths = set(paths)
+        self.mtimes = self.snapshot()
+
+    def snapshot(self) -> dict[Path, int | None]:
+        return {path: get_mtime(path) for path in self.paths}
+
+    def poll(self) -> set[Path]:
+        mtimes = self.snapshot()
+
+        changed = {
+            path for path, mtime in mtimes.items() if self.mtimes.get(path) != mtime
+        }
+
+        self.mtimes = mtimes
+
+        return changed
+
+    def wait(self, interval: float) -> set[Path]:
+        while not (changed := self.poll()):
+            time.sleep(interval)
+
+        return changed
+
+
+def get_modules_by_paths(paths: Iterable[Path]) -> list[str]:
+    paths = set(paths)
+
+    return [
+        module_name
+        for module_name in list(sys.modules)
+        if (path := _get_module_file(module_name)) and path in paths
+    ]
+
+
+def _reload_module(module_name: str, *, stderr: TextIO | TextIOBase) -> bool:
+    try:
+        importlib.reload(sys.modules[module_name])
+    except Exception:  # noqa: BLE001
+        stderr.write(traceback.format_exc())
+
+        return False
+
+    return True
+
+
+def reload_modules(
+    module_names: Iterable[str],
+    *,
+    stderr: TextIO | TextIOBase,
+) -> bool:
+    reloaded = [
+        _reload_module(module_name, stderr=stderr) for module_name in module_names
+    ]
+
+    clear_command_class_cache()
+
+    return all(reloaded)
+
+
+def restart() -> None:
+    os.execv(sys.executable, get_child_arguments())  # noqa: S606
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import py_compile
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from management_commands.commands.compile_commands import Command
+from management_commands.compilation import CompilationResult
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_compile_commands_command_reports_compiled_modules(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch(
+        "management_commands.commands.compile_commands.get_command_module_paths",
+        return_value={"module": "module.py"},
+    )
+    compile_modules_mock = mocker.patch(
+        "management_commands.commands.compile_commands.compile_modules",
+        return_value=[CompilationResult("module", "module.py", None, 0.0123)],
+    )
+    stdout = StringIO()
+
+    # Act.
+    call_command(Command(), "--invalidation-mode", "checked-hash", stdout=stdout)
+
+    # Assert.
+    assert (
+        compile_modules_mock.call_args.kwargs["invalidation_mode"]
+        == py_compile.PycInvalidationMode.CHECKED_HASH
+    )
+    assert "OK module (12.3 ms)" in stdout.getvalue()
+    assert "1 modules compiled" in stdout.getvalue()
+
+
+def test_compile_commands_command_raises_command_error_if_any_module_failed(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch(
+        "management_commands.commands.compile_commands.get_command_module_paths",
+        return_value={"module": "module.py"},
+    )
+    mocker.patch(
+        "management_commands.commands.compile_commands.compile_modules",
+        return_value=[CompilationResult("module", "module.py", "error", 0.0)],
+    )
+
+    # Act & assert.
+    with pytest.raises(CommandError, match="1 of 1 modules failed"):
+        call_command(Command(), stdout=StringIO(), stderr=StringIO())
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from management_commands.commands.fanout import Command
+from management_commands.execution import CommandResult
+from management_commands.fanout import DatabaseResult
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_fanout_command_runs_command_against_matching_databases_and_reports_summary(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch("management_commands.commands.fanout.get_command_class")
+    mocker.patch(
+        "management_commands.commands.fanout.match_databases",
+        return_value=["shard_1", "shard_2"],
+    )
+    fan_out_mock = mocker.patch(
+        "management_commands.commands.fanout.fan_out",
+        return_value=[
+            DatabaseResult("shard_1", CommandResult([], 0, "", "", 0.0)),
+            DatabaseResult("shard_2", CommandResult([], 0, "", "", 0.0)),
+        ],
+    )
+    stdout = StringIO()
+
+    # Act.
+    call_command(
+        Command(),
+        "--databases",
+        "shard_*",
+        "migrate",
+        "--no-input",
+        stdout=stdout,
+    )
+
+    # Assert.
+    assert fan_out_mock.call_args.args == (
+        "migrate",
+        ["--no-input"],
+        ["shard_1", "shard_2"],
+    )
+    assert "shard_1  OK" in stdout.getvalue()
+    assert "shard_2  OK" in stdout.getvalue()
+
+
+def test_fanout_command_raises_command_error_if_command_failed_on_any_database(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch("management_commands.commands.fanout.get_command_class")
+    mocker.patch(
+        "management_commands.commands.fanout.match_databases",
+        return_value=["shard_1", "shard_2"],
+    )
+    mocker.patch(
+        "management_commands.commands.fanout.fan_out",
+        return_value=[
+            DatabaseResult("shard_1", CommandResult([], 0, "", "", 0.0)),
+            DatabaseResult("shard_2", CommandResult([], 1, "", "", 0.0)),
+        ],
+    )
+
+    # Act & assert.
+    with pytest.raises(CommandError, match="failed on 1 of 2 databases"):
+        call_command(Command(), "migrate", stdout=StringIO())
+
+
+def test_fanout_command_raises_command_error_if_no_database_matches(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch("management_commands.commands.fanout.get_command_class")
+    mocker.patch(
+        "management_commands.commands.fanout.match_databases",
+        return_value=[],
+    )
+
+    # Act & assert.
+    with pytest.raises(CommandError, match="no databases"):
+        call_command(Command(), "--databases", "missing_*", "migrate")
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from management_commands.commands.history import Command
+from management_commands.history import Run, save_run
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def history_db(mocker: MockerFixture, tmp_path: Path) -> str:
+    path = str(tmp_path / "history.sqlite3")
+    mocker.patch.multiple(
+        "management_commands.commands.history.settings",
+        HISTORY_DB=path,
+    )
+
+    for started_at, duration in enumerate([0.01, 0.01, 0.01, 0.05]):
+        save_run(path, Run("command", ["arg"], None, started_at, duration, 0, 2**20))
+
+    return path
+
+
+def test_history_command_reports_summary_and_regressions(history_db: str) -> None:
+    # Arrange.
+    stdout = StringIO()
+
+    # Act.
+    call_command(Command(), stdout=stdout)
+
+    # Assert.
+    assert stdout.getvalue() == (
+        "command: 4 runs, 0 failed, p50 10.0 ms, p95 50.0 ms, latest 50.0 ms "
+        "REGRESSED\n"
+    )
+
+
+def test_history_command_reports_runs_of_given_command(history_db: str) -> None:
+    # Arrange.
+    stdout = StringIO()
+
+    # Act.
+    call_command(Command(), "command", "--limit", "2", stdout=stdout)
+
+    # Assert.
+    lines = stdout.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith("OK 50.0 ms 1.0 MiB command arg")
+
+
+def test_history_command_raises_command_error_if_history_db_is_not_set(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.commands.history.settings",
+        HISTORY_DB=None,
+    )
+
+    # Act & assert.
+    with pytest.raises(CommandError, match="HISTORY_DB"):
+        call_command(Command())
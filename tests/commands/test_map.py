@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from management_commands.commands.map import Command
+from management_commands.exceptions import CommandClassLookupError
+from management_commands.execution import CommandResult
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def argv_sets_path(tmp_path: Path) -> Path:
+    path = tmp_path / "argv_sets.jsonl"
+    path.write_text('["a"]\n["b"]\n')
+
+    return path
+
+
+def test_map_command_writes_aggregated_output_of_all_argv_sets(
+    mocker: MockerFixture,
+    argv_sets_path: Path,
+) -> None:
+    # Mock.
+    mocker.patch("management_commands.commands.map.get_command_class")
+    map_command_mock = mocker.patch(
+        "management_commands.commands.map.map_command",
+        return_value=[
+            CommandResult(["command", "a"], 0, "output_a\n", "", 0.0),
+            CommandResult(["command", "b"], 0, "output_b\n", "", 0.0),
+        ],
+    )
+    stdout = StringIO()
+
+    # Act.
+    call_command(Command(), "command", str(argv_sets_path), stdout=stdout)
+
+    # Assert.
+    assert map_command_mock.call_args.args == ("command", [["a"], ["b"]])
+    assert stdout.getvalue() == "output_a\noutput_b\n"
+
+
+def test_map_command_raises_command_error_if_any_argv_set_failed(
+    mocker: MockerFixture,
+    argv_sets_path: Path,
+) -> None:
+    # Mock.
+    mocker.patch("management_commands.commands.map.get_command_class")
+    mocker.patch(
+        "management_commands.commands.map.map_command",
+        return_value=[
+            CommandResult(["command", "a"], 0, "", "", 0.0),
+            CommandResult(["command", "b"], 1, "", "error\n", 0.0),
+        ],
+    )
+    stderr = StringIO()
+
+    # Act & assert.
+    with pytest.raises(CommandError, match="1 of 2 argument sets failed"):
+        call_command(Command(), "command", str(argv_sets_path), stderr=stderr)
+
+    assert "error\n" in stderr.getvalue()
+
+
+def test_map_command_raises_command_error_if_command_is_not_registered(
+    mocker: MockerFixture,
+    argv_sets_path: Path,
+) -> None:
+    # Mock.
+    mocker.patch(
+        "management_commands.commands.map.get_command_class",
+        side_effect=CommandClassLookupError("command"),
+    )
+
+    # Act & assert.
+    with pytest.raises(CommandError, match="not registered"):
+        call_command(Command(), "command", str(argv_sets_path))
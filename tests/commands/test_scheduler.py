@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from management_commands.commands.scheduler import Command
+from management_commands.cron import parse_cron_expression
+from management_commands.execution import CommandResult
+from management_commands.scheduling import ScheduledJob
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_scheduler_command_runs_due_jobs_until_interrupted(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.scheduling.settings",
+        SCHEDULE={"* * * * *": ["command --option value"]},
+    )
+
+    # Mock.
+    mocker.patch("management_commands.commands.scheduler.get_command_class")
+    run_command_mock = mocker.patch(
+        "management_commands.commands.scheduler.run_command",
+        return_value=CommandResult(["command"], 0, "", "", 0.5),
+    )
+    mocker.patch.object(
+        Command,
+        "now",
+        return_value=datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc),
+    )
+    mocker.patch.object(Command, "sleep", side_effect=KeyboardInterrupt)
+    stdout = StringIO()
+
+    # Act.
+    call_command(Command(), stdout=stdout)
+
+    # Assert.
+    assert run_command_mock.call_args.args == ("command", ["--option", "value"])
+    lines = stdout.getvalue().splitlines()
+    assert lines[0] == "Scheduler started with 1 jobs."
+    assert lines.index("[2026-01-01 12:30] command --option value: started") < (
+        lines.index("[2026-01-01 12:30] command --option value: finished (0.50s)")
+    )
+    assert "Scheduler stopping; waiting for running jobs to finish." in lines
+
+
+def test_scheduler_command_raises_command_error_if_job_command_does_not_exist(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.scheduling.settings",
+        SCHEDULE={"* * * * *": ["missing"]},
+    )
+
+    # Act & assert.
+    with pytest.raises(CommandError, match="missing"):
+        call_command(Command(), stdout=StringIO())
+
+
+def test_scheduler_command_run_job_prefixes_output_of_job(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    job = ScheduledJob("* * * * *", parse_cron_expression("* * * * *"), "command")
+
+    # Mock.
+    def run_command_side_effect(*_args: object, **kwargs: StringIO) -> CommandResult:
+        kwargs["stdout"].write("output\n")
+        kwargs["stderr"].write("error\n")
+
+        return CommandResult(["command"], 2, "", "", 0.0)
+
+    mocker.patch(
+        "management_commands.commands.scheduler.run_command",
+        side_effect=run_command_side_effect,
+    )
+    stdout, stderr = StringIO(), StringIO()
+
+    command = Command(stdout=stdout, stderr=stderr)
+    command.lock = mocker.MagicMock()
+
+    # Act.
+    command.run_job(job, datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc))
+
+    # Assert.
+    assert stdout.getvalue() == (
+        "[2026-01-01 00:00] command: started\n"
+        "[2026-01-01 00:00] [command] output\n"
+        "[2026-01-01 00:00] command: failed (exit code 2) (0.00s)\n"
+    )
+    assert stderr.getvalue() == "[2026-01-01 00:00] [command] error\n"
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django.core.management import call_command
+
+from management_commands.commands.watch import Command
+from management_commands.execution import CommandResult
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_watch_command_reloads_changed_modules_and_reruns_command(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch("management_commands.commands.watch.get_command_class")
+    mocker.patch(
+        "management_commands.commands.watch.get_watched_paths",
+        return_value=set(),
+    )
+    mocker.patch(
+        "management_commands.commands.watch.get_command_paths",
+        return_value={Path("module.py")},
+    )
+    mocker.patch(
+        "management_commands.commands.watch.Watcher.wait",
+        side_effect=[{Path("module.py")}, KeyboardInterrupt],
+    )
+    mocker.patch(
+        "management_commands.commands.watch.get_modules_by_paths",
+        return_value=["module"],
+    )
+    reload_modules_mock = mocker.patch(
+        "management_commands.commands.watch.reload_modules",
+    )
+    restart_mock = mocker.patch("management_commands.commands.watch.restart")
+    run_command_mock = mocker.patch(
+        "management_commands.commands.watch.run_command",
+        return_value=CommandResult(["command"], 0, "", "", 0.0),
+    )
+
+    # Act.
+    with pytest.raises(KeyboardInterrupt):
+        call_command(Command(), "command", "--option", stderr=StringIO())
+
+    # Assert.
+    assert run_command_mock.call_count == 2
+    assert run_command_mock.call_args.args == ("command", ["--option"])
+    reload_modules_mock.assert_called_once_with(["module"], stderr=mocker.ANY)
+    restart_mock.assert_not_called()
+
+
+def test_watch_command_keeps_watching_if_reloading_changed_modules_fails(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    stderr = StringIO()
+
+    # Mock.
+    mocker.patch("management_commands.commands.watch.get_command_class")
+    mocker.patch(
+        "management_commands.commands.watch.get_watched_paths",
+        return_value=set(),
+    )
+    mocker.patch(
+        "management_commands.commands.watch.get_command_paths",
+        return_value={Path("module.py")},
+    )
+    mocker.patch(
+        "management_commands.commands.watch.Watcher.wait",
+        side_effect=[{Path("module.py")}, {Path("module.py")}, KeyboardInterrupt],
+    )
+    mocker.patch(
+        "management_commands.commands.watch.get_modules_by_paths",
+        return_value=["module"],
+    )
+    mocker.patch(
+        "management_commands.commands.watch.reload_modules",
+        side_effect=[False, True],
+    )
+    run_command_mock = mocker.patch(
+        "management_commands.commands.watch.run_command",
+        return_value=CommandResult(["command"], 0, "", "", 0.0),
+    )
+
+    # Act.
+    with pytest.raises(KeyboardInterrupt):
+        call_command(Command(), "command", stderr=stderr)
+
+    # Assert.
+    assert run_command_mock.call_count == 2
+    assert "Reloading changed modules failed; watching..." in stderr.getvalue()
+
+
+def test_watch_command_restarts_process_if_modules_other_than_commands_change(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch("management_commands.commands.watch.get_command_class")
+    mocker.patch(
+        "management_commands.commands.watch.get_watched_paths",
+        return_value=set(),
+    )
+    mocker.patch(
+        "management_commands.commands.watch.get_command_paths",
+        return_value={Path("command.py")},
+    )
+    mocker.patch(
+        "management_commands.commands.watch.Watcher.wait",
+        return_value={Path("command.py"), Path("utils.py")},
+    )
+    reload_modules_mock = mocker.patch(
+        "management_commands.commands.watch.reload_modules",
+    )
+    mocker.patch(
+        "management_commands.commands.watch.run_command",
+        return_value=CommandResult(["command"], 0, "", "", 0.0),
+    )
+    restart_mock = mocker.patch(
+        "management_commands.commands.watch.restart",
+        side_effect=SystemExit,
+    )
+
+    # Act.
+    with pytest.raises(SystemExit):
+        call_command(Command(), "command", stderr=StringIO())
+
+    # Assert.
+    restart_mock.assert_called_once()
+    reload_modules_mock.assert_not_called()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from management_commands.commands.worker import Command
+from management_commands.jobs import enqueue, get_job
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_worker_command_runs_queued_jobs_in_burst_mode(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    workers: int,
+) -> None:
+    # Configure.
+    path = str(tmp_path / "queue.sqlite3")
+    mocker.patch.multiple("management_commands.jobs.settings", QUEUE_DB=path)
+
+    # Arrange.
+    job_ids = [enqueue("check"), enqueue("check", ["missing_app"])]
+    stdout = StringIO()
+
+    # Act.
+    call_command(Command(), "--burst", "--workers", str(workers), stdout=stdout)
+
+    # Assert.
+    assert [job.status for job in map(get_job, job_ids) if job] == [
+        "succeeded",
+        "failed",
+    ]
+    assert "2 jobs processed." in stdout.getvalue()
+
+
+def test_worker_command_raises_command_error_if_queue_is_not_configured(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple("management_commands.jobs.settings", QUEUE_DB=None)
+
+    # Act & assert.
+    with pytest.raises(CommandError, match="QUEUE_DB"):
+        call_command(Command())
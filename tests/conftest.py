@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django.conf import settings
+
+from management_commands.core import clear_command_class_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+pytest_plugins = ["pytester"]
+
+SETTINGS_PREFIX = "MANAGEMENT_COMMANDS_"
+
+
+@pytest.fixture(autouse=True)
+def _clear_command_class_cache() -> None:
+    clear_command_class_cache()
+
+
+@pytest.fixture(autouse=True)
+def _restore_plugin_settings() -> Iterator[None]:
+    # Patching the plugin's settings also sets them on Django's settings.
+    plugin_settings = {
+        name: getattr(settings, name)
+        for name in dir(settings)
+        if name.startswith(SETTINGS_PREFIX)
+    }
+
+    yield
+
+    for name in dir(settings):
+        if name.startswith(SETTINGS_PREFIX) and name not in plugin_settings:
+            delattr(settings, name)
+
+    for name, value in plugin_settings.items():
+        setattr(settings, name, value)
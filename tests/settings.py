@@ -1 +1,15 @@
 from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {
+            # In-memory databases are never closed, which hides connection handling.
+            "NAME": str(Path(tempfile.gettempdir()) / "management_commands.sqlite3"),
+        },
+    },
+}
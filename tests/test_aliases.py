@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import sys
+from io import StringIO
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from django.db import transaction
+
+from management_commands.aliases import (
+    _start_pipeline,
+    get_step_databases,
+    manage_step_connections,
+    run_in_forks,
+    run_in_subprocesses,
+    split_pipeline,
+)
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+SCRIPT = """
+import sys
+
+name, *args = sys.argv[1:]
+for arg in args:
+    print(arg)
+print(f"error from {name}", file=sys.stderr)
+sys.exit(3 if name == "fail" else 0)
+"""
+
+PREFIX_ARGV = [sys.executable, "-c", SCRIPT]
+
+PIPE_SCRIPT = """
+import os
+import signal
+import sys
+
+name, *args = sys.argv[1:]
+if name == "kill":
+    os.kill(os.getpid(), signal.SIGKILL)
+elif name == "export":
+    for index in range(int(args[0])):
+        print(f"row {index}")
+elif name == "upper":
+    for line in sys.stdin:
+        print(line.rstrip().upper())
+print(f"done {name}", file=sys.stderr)
+sys.exit(int(args[0]) if name == "exit" else 0)
+"""
+
+PIPE_PREFIX_ARGV = [sys.executable, "-c", PIPE_SCRIPT]
+
+
+def test_run_in_subprocesses_streams_prefixed_output_of_each_step() -> None:
+    # Arrange.
+    stdout, stderr = StringIO(), StringIO()
+
+    # Act.
+    exit_codes = run_in_subprocesses(
+        PREFIX_ARGV,
+        ["step_a line_1 line_2", "step_b line_3"],
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+    # Assert.
+    assert exit_codes == [0, 0]
+    assert stdout.getvalue() == (
+        "[step_a] line_1\n"
+        "[step_a] line_2\n"
+        "[step_b] line_3\n"
+    )  # fmt: skip
+    assert stderr.getvalue() == (
+        "[step_a] error from step_a\n"
+        "[step_b] error from step_b\n"
+    )  # fmt: skip
+
+
+def test_run_in_subprocesses_does_not_start_steps_after_failed_one() -> None:
+    # Act.
+    exit_codes = run_in_subprocesses(
+        PREFIX_ARGV,
+        ["fail", "step"],
+        stdout=StringIO(),
+        stderr=StringIO(),
+    )
+
+    # Assert.
+    assert exit_codes == [3, None]
+
+
+def test_run_in_subprocesses_runs_steps_concurrently_with_multiple_workers() -> None:
+    # Arrange.
+    stdout = StringIO()
+
+    # Act.
+    exit_codes = run_in_subprocesses(
+        PREFIX_ARGV,
+        ["step_a line_1", "fail line_2", "step_c line_3"],
+        stdout=stdout,
+        stderr=StringIO(),
+        workers=3,
+    )
+
+    # Assert.
+    assert exit_codes == [0, 3, 0]
+    assert sorted(stdout.getvalue().splitlines()) == [
+        "[fail  ] line_2",
+        "[step_a] line_1",
+        "[step_c] line_3",
+    ]
+
+
+def test_run_in_subprocesses_writes_unterminated_last_line_of_output() -> None:
+    # Arrange.
+    stdout = StringIO()
+
+    # Act.
+    run_in_subprocesses(
+        [sys.executable, "-c", "import sys; sys.stdout.write(sys.argv[1])"],
+        ["step"],
+        stdout=stdout,
+        stderr=StringIO(),
+    )
+
+    # Assert.
+    assert stdout.getvalue() == "[step] step\n"
+
+
+def test_run_in_subprocesses_starts_steps_in_given_order() -> None:
+    # Arrange.
+    stdout = StringIO()
+
+    # Act.
+    exit_codes = run_in_subprocesses(
+        PREFIX_ARGV,
+        ["step_a line_1", "step_b line_2"],
+        stdout=stdout,
+        stderr=StringIO(),
+        order=[1, 0],
+    )
+
+    # Assert.
+    assert exit_codes == [0, 0]
+    assert stdout.getvalue().splitlines() == ["[step_b] line_2", "[step_a] line_1"]
+
+
+def test_split_pipeline_splits_alias_expression_on_pipe_operator() -> None:
+    # Act & assert.
+    assert split_pipeline("command --option value") == [
+        ["command", "--option", "value"],
+    ]
+    assert split_pipeline("export --format csv | import") == [
+        ["export", "--format", "csv"],
+        ["import"],
+    ]
+    assert split_pipeline("export |") == [["export"], []]
+
+
+def test_run_in_subprocesses_streams_output_through_pipeline() -> None:
+    # Arrange.
+    stdout, stderr = StringIO(), StringIO()
+
+    # Act.
+    exit_codes = run_in_subprocesses(
+        PIPE_PREFIX_ARGV,
+        ["export 100000 | upper"],
+        stdout=stdout,
+        stderr=stderr,
+        pipe_size=4096,
+    )
+
+    # Assert.
+    lines = stdout.getvalue().splitlines()
+    assert exit_codes == [0]
+    assert len(lines) == 100_000
+    assert lines[0] == "[upper ] ROW 0"
+    assert lines[-1] == "[upper ] ROW 99999"
+    assert sorted(stderr.getvalue().splitlines()) == [
+        "[export] done export",
+        "[upper ] done upper",
+    ]
+
+
+def test_run_in_subprocesses_reports_last_failed_exit_code_of_pipeline() -> None:
+    # Act.
+    exit_codes = run_in_subprocesses(
+        PIPE_PREFIX_ARGV,
+        ["exit 3 | upper", "exit 3 | exit 4", "export 1 | upper"],
+        stdout=StringIO(),
+        stderr=StringIO(),
+        workers=3,
+    )
+
+    # Assert.
+    assert exit_codes == [3, 4, 0]
+
+
+def test_run_in_subprocesses_reports_commands_killed_by_signals_as_shells_do() -> None:
+    # Act.
+    exit_codes = run_in_subprocesses(
+        PIPE_PREFIX_ARGV,
+        ["kill", "kill | upper"],
+        stdout=StringIO(),
+        stderr=StringIO(),
+        workers=2,
+    )
+
+    # Assert.
+    assert exit_codes == [128 + signal.SIGKILL, 128 + signal.SIGKILL]
+
+
+def test_start_pipeline_stops_started_commands_if_next_one_fails_to_start(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    processes: list[subprocess.Popen[bytes]] = []
+    popen = subprocess.Popen
+
+    # Mock.
+    def popen_side_effect(*args: Any, **kwargs: Any) -> subprocess.Popen[bytes]:
+        if processes:
+            raise OSError
+
+        processes.append(popen(*args, **kwargs))
+        return processes[-1]
+
+    mocker.patch(
+        "management_commands.aliases.subprocess.Popen",
+        side_effect=popen_side_effect,
+    )
+
+    # Act & assert.
+    with pytest.raises(OSError):  # noqa: PT011
+        _start_pipeline(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            [["sleep"], ["next"]],
+        )
+
+    assert processes[0].returncode is not None
+
+
+def test_run_in_forks_runs_each_step_in_child_process(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    pids: list[int] = []
+
+    def run_step(argv: list[str]) -> None:
+        pids.append(os.getpid())
+
+        if argv[0] == "fail":
+            sys.exit(int(argv[1]))
+
+    # Mock.
+    close_all_mock = mocker.patch("management_commands.aliases.connections.close_all")
+
+    # Act.
+    exit_codes = run_in_forks(run_step, ["step", "fail 3", "step"])
+
+    # Assert.
+    assert exit_codes == [0, 3, None]
+    assert pids == []
+    assert close_all_mock.call_count == 2
+
+
+def test_run_in_forks_reports_uncaught_exception_of_step_as_failure() -> None:
+    # Arrange.
+    def run_step(argv: list[str]) -> None:
+        raise RuntimeError
+
+    # Act.
+    exit_codes = run_in_forks(run_step, ["step"])
+
+    # Assert.
+    assert exit_codes == [1]
+
+
+def test_get_step_databases_returns_configured_databases_passed_with_option(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch(
+        "management_commands.aliases.connections.settings",
+        {"default": {}, "replica": {}},
+    )
+
+    # Act.
+    databases = get_step_databases(
+        [
+            "command",
+            "--database",
+            "replica",
+            "--database=default",
+            "--database=replica",
+            "--database=unknown",
+            "--database",
+        ],
+    )
+
+    # Assert.
+    assert databases == ["replica", "default"]
+
+
+def test_manage_step_connections_closes_old_connections_around_step(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    calls: list[str] = []
+
+    # Mock.
+    mocker.patch(
+        "management_commands.aliases.close_old_connections",
+        side_effect=lambda: calls.append("close_old_connections"),
+    )
+    connections_mock = mocker.patch("management_commands.aliases.connections")
+
+    # Act.
+    with manage_step_connections(["command", "--database", "default"]):
+        calls.append("step")
+
+    # Assert.
+    assert calls == ["close_old_connections", "step", "close_old_connections"]
+    connections_mock.__getitem__.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_manage_step_connections_leaves_connections_alone_inside_atomic_block(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    close_old_connections_mock = mocker.patch(
+        "management_commands.aliases.close_old_connections",
+    )
+
+    # Act.
+    with transaction.atomic(), manage_step_connections(["command"], preconnect=True):
+        pass
+
+    # Assert.
+    close_old_connections_mock.assert_not_called()
+
+
+def test_manage_step_connections_connects_to_step_databases_if_preconnect_is_set(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch("management_commands.aliases.close_old_connections")
+    connections_mock = mocker.patch("management_commands.aliases.connections")
+    connections_mock.settings = {"default": {}, "replica": {}}
+
+    # Act.
+    with manage_step_connections(
+        ["command", "--database", "replica"],
+        preconnect=True,
+    ):
+        pass
+
+    # Assert.
+    connections_mock.__getitem__.assert_called_once_with("replica")
+    connections_mock.__getitem__.return_value.ensure_connection.assert_called_once()
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from django.core.management.base import BaseCommand
+
+from management_commands.batch import map_command, read_argv_sets
+from management_commands.exceptions import CommandArgvSetError
+from management_commands.execution import CommandResult
+from management_commands.spooling import SpooledOutput
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from django.core.management.base import CommandParser
+
+
+def test_read_argv_sets_reads_json_lines_of_arguments_and_options(
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    path = tmp_path / "argv_sets.jsonl"
+    path.write_text(
+        '["arg", "--option", 1]\n'
+        "\n"
+        '{"tenant": "a", "dry_run": true, "force": false, "tag": ["x", "y"]}\n',
+    )
+
+    # Act.
+    argv_sets = read_argv_sets(path)
+
+    # Assert.
+    assert argv_sets == [
+        ["arg", "--option", "1"],
+        ["--tenant", "a", "--dry-run", "--tag", "x", "--tag", "y"],
+    ]
+
+
+def test_read_argv_sets_reads_csv_columns_as_options(tmp_path: Path) -> None:
+    # Arrange.
+    path = tmp_path / "argv_sets.csv"
+    path.write_text("tenant,date\na,2024-01-01\nb,\n")
+
+    # Act.
+    argv_sets = read_argv_sets(path)
+
+    # Assert.
+    assert argv_sets == [
+        ["--tenant", "a", "--date", "2024-01-01"],
+        ["--tenant", "b"],
+    ]
+
+
+@pytest.mark.parametrize("line", ["[", '"arg"'])
+def test_read_argv_sets_raises_command_argv_set_error_with_invalid_line(
+    tmp_path: Path,
+    line: str,
+) -> None:
+    # Arrange.
+    path = tmp_path / "argv_sets.jsonl"
+    path.write_text(f'["arg"]\n{line}\n')
+
+    # Act & assert.
+    with pytest.raises(CommandArgvSetError, match="line 2"):
+        read_argv_sets(path)
+
+
+def test_map_command_runs_command_for_each_argv_set_and_retries_failed_ones(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    attempts: dict[str, int] = {}
+
+    # Mock.
+    def run_command_side_effect(name: str, argv: list[str]) -> CommandResult:
+        attempts[argv[0]] = attempts.get(argv[0], 0) + 1
+        exit_code = int(argv[0] == "b" and attempts["b"] == 1)
+        return CommandResult([name, *argv], exit_code, argv[0], "", 0.0)
+
+    mocker.patch("management_commands.batch.ProcessPoolExecutor", ThreadPoolExecutor)
+    mocker.patch("management_commands.batch.django.setup")
+    mocker.patch("management_commands.batch.get_command_class")
+    mocker.patch(
+        "management_commands.batch.run_command",
+        side_effect=run_command_side_effect,
+    )
+    callback_mock = mocker.Mock()
+
+    # Act.
+    results = map_command(
+        "command",
+        [["a"], ["b"], ["c"]],
+        workers=2,
+        retries=1,
+        callback=callback_mock,
+    )
+
+    # Assert.
+    assert [result.stdout for result in results] == ["a", "b", "c"]
+    assert [result.exit_code for result in results] == [0, 0, 0]
+    assert attempts == {"a": 1, "b": 2, "c": 1}
+    assert callback_mock.call_count == 4
+
+
+def test_map_command_records_broken_pool_as_failure_and_retries_on_new_pool(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    executor_mock = mocker.patch(
+        "management_commands.batch.ProcessPoolExecutor",
+        side_effect=ThreadPoolExecutor,
+    )
+    mocker.patch("management_commands.batch.django.setup")
+    mocker.patch("management_commands.batch.get_command_class")
+    mocker.patch(
+        "management_commands.batch.run_command",
+        side_effect=[
+            BrokenProcessPool("worker died"),
+            CommandResult(["command", "a"], 0, "a", "", 0.0),
+        ],
+    )
+    callback_mock = mocker.Mock()
+
+    # Act.
+    results = map_command("command", [["a"]], retries=1, callback=callback_mock)
+
+    # Assert.
+    assert executor_mock.call_count == 2
+    assert results[0].exit_code == 0
+    [(_, failed_result, _), _] = [call.args for call in callback_mock.call_args_list]
+    assert failed_result.exit_code == 1
+    assert failed_result.stderr == "BrokenProcessPool: worker died\n"
+
+
+def test_map_command_does_not_retry_failed_argv_sets_by_default(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch("management_commands.batch.ProcessPoolExecutor", ThreadPoolExecutor)
+    mocker.patch("management_commands.batch.django.setup")
+    mocker.patch("management_commands.batch.get_command_class")
+    run_command_mock = mocker.patch(
+        "management_commands.batch.run_command",
+        return_value=CommandResult(["command"], 1, "", "", 0.0),
+    )
+
+    # Act.
+    results = map_command("command", [["a"]])
+
+    # Assert.
+    run_command_mock.assert_called_once_with("command", ["a"])
+    assert results[0].exit_code == 1
+
+
+def test_map_command_hands_over_spooled_output_of_workers(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    stdout = SpooledOutput(threshold=1)
+    stdout.write("output")
+
+    # Mock.
+    mocker.patch("management_commands.batch.ProcessPoolExecutor", ThreadPoolExecutor)
+    mocker.patch("management_commands.batch.django.setup")
+    mocker.patch("management_commands.batch.get_command_class")
+    mocker.patch(
+        "management_commands.batch.run_command",
+        return_value=CommandResult(["command"], 0, stdout, "", 0.0),
+    )
+    hand_over_mock = mocker.spy(stdout, "hand_over")
+
+    # Act.
+    map_command("command", [["a"]])
+
+    # Assert.
+    hand_over_mock.assert_called_once_with()
+
+    Path(stdout.path or "").unlink()
+
+
+def test_map_command_runs_each_alias_step_with_each_argv_set(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "command": "module.Command",
+        },
+        ALIASES={
+            "alias": [
+                "command --step a",
+                "command --step b",
+            ],
+        },
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        def add_arguments(self, parser: CommandParser) -> None:
+            parser.add_argument("--step")
+            parser.add_argument("--item")
+
+        def handle(self, *args: Any, **options: Any) -> None:
+            self.stdout.write(f"{options['step']}: {options['item']}")
+
+    # Mock.
+    mocker.patch("management_commands.batch.ProcessPoolExecutor", ThreadPoolExecutor)
+    mocker.patch("management_commands.batch.django.setup")
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    # Act.
+    results = map_command("alias", [["--item", "1"], ["--item", "2"]], workers=1)
+
+    # Assert.
+    assert [result.exit_code for result in results] == [0, 0]
+    assert [result.stdout for result in results] == ["a: 1\nb: 1\n", "a: 2\nb: 2\n"]
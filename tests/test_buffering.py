@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import signal
+from io import StringIO
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from django.core.management.base import BaseCommand
+
+from management_commands.buffering import BufferedOutputWrapper, buffer_output
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_buffered_output_wrapper_writes_to_stream_once_buffer_is_full() -> None:
+    # Arrange.
+    stream = StringIO()
+    wrapper = BufferedOutputWrapper(stream, buffer_size=8)
+
+    # Act.
+    wrapper.write("abc")
+    buffered = stream.getvalue()
+    wrapper.write("def")
+    written = stream.getvalue()
+
+    # Assert.
+    assert buffered == ""
+    assert written == "abc\ndef\n"
+
+
+def test_buffered_output_wrapper_applies_styles_like_output_wrapper(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    stream = StringIO()
+    mocker.patch.object(stream, "isatty", return_value=True)
+
+    wrapper = BufferedOutputWrapper(stream, buffer_size=1024)
+    wrapper.style_func = str.upper
+
+    # Act.
+    wrapper.write("a")
+    wrapper.write("b", style_func=lambda msg: f"*{msg}")
+    wrapper.write("c", ending="")
+    wrapper.flush()
+
+    # Assert.
+    assert stream.getvalue() == "A\n*b\nC"
+
+
+def test_buffered_output_wrapper_does_not_style_output_if_stream_is_not_tty() -> None:
+    # Arrange.
+    stream = StringIO()
+
+    wrapper = BufferedOutputWrapper(stream, buffer_size=1024)
+    wrapper.style_func = str.upper
+
+    # Act.
+    wrapper.write("a")
+    wrapper.flush()
+
+    # Assert.
+    assert stream.getvalue() == "a\n"
+
+
+def test_buffer_output_flushes_output_once_command_is_executed(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    stream = StringIO()
+    mocker.patch("management_commands.buffering.sys.stdout", stream)
+
+    class Command(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> None:
+            self.stdout.write("line")
+
+            assert stream.getvalue() == ""
+
+            raise RuntimeError
+
+    command = Command()
+
+    # Act.
+    buffer_output(command, 1024)
+
+    with pytest.raises(RuntimeError):
+        command.run_from_argv(["manage.py", "command"])
+
+    # Assert.
+    assert stream.getvalue() == "line\n"
+
+
+def test_buffer_output_flushes_output_on_signal(mocker: MockerFixture) -> None:
+    # Arrange.
+    stream = StringIO()
+    mocker.patch("management_commands.buffering.sys.stdout", stream)
+
+    previous_handler = mocker.Mock()
+    signal.signal(signal.SIGTERM, previous_handler)
+
+    class Command(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> None:
+            self.stdout.write("line")
+
+            os.kill(os.getpid(), signal.SIGTERM)
+
+    command = Command()
+
+    # Act.
+    buffer_output(command, 1024)
+
+    try:
+        command.run_from_argv(["manage.py", "command"])
+
+        # Assert.
+        previous_handler.assert_called_once()
+        assert stream.getvalue() == "line\n"
+        assert signal.getsignal(signal.SIGTERM) is previous_handler
+    finally:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from management_commands.caching import get_help_fingerprint, read_cache, write_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_read_cache_returns_value_written_with_write_cache(tmp_path: Path) -> None:
+    # Act.
+    write_cache(str(tmp_path / "cache"), "key", "value")
+
+    # Assert.
+    assert read_cache(str(tmp_path / "cache"), "key") == "value"
+
+
+def test_read_cache_returns_none_if_key_is_not_cached(tmp_path: Path) -> None:
+    # Act & assert.
+    assert read_cache(str(tmp_path), "key") is None
+
+
+def test_get_help_fingerprint_changes_if_command_directory_is_modified(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    commands_path = tmp_path / "app" / "management" / "commands"
+    commands_path.mkdir(parents=True)
+
+    app_config_mock = mocker.Mock()
+    app_config_mock.name = "app"
+    app_config_mock.path = str(tmp_path / "app")
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.apps.app_configs",
+        {
+            "app": app_config_mock,
+        },
+    )
+
+    # Act.
+    fingerprint_a = get_help_fingerprint("manage.py", commands_only=False)
+    fingerprint_b = get_help_fingerprint("manage.py", commands_only=False)
+    (commands_path / "command.py").touch()
+    os.utime(commands_path, ns=(0, 0))
+    fingerprint_c = get_help_fingerprint("manage.py", commands_only=False)
+
+    # Assert.
+    assert fingerprint_a == fingerprint_b
+    assert fingerprint_a != fingerprint_c
+
+
+def test_get_help_fingerprint_changes_if_plugin_settings_change(
+    mocker: MockerFixture,
+) -> None:
+    # Act.
+    fingerprint_a = get_help_fingerprint("manage.py", commands_only=False)
+    mocker.patch(
+        "management_commands.caching.settings.ALIASES",
+        {
+            "alias": ["command"],
+        },
+    )
+    fingerprint_b = get_help_fingerprint("manage.py", commands_only=False)
+
+    # Assert.
+    assert fingerprint_a != fingerprint_b
+
+
+def test_get_help_fingerprint_depends_on_commands_only_flag() -> None:
+    # Act & assert.
+    assert get_help_fingerprint(
+        "manage.py",
+        commands_only=False,
+    ) != get_help_fingerprint(
+        "manage.py",
+        commands_only=True,
+    )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import py_compile
+from importlib.util import cache_from_source
+from typing import TYPE_CHECKING
+
+from management_commands.compilation import (
+    compile_module,
+    compile_modules,
+    get_command_module_paths,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_get_command_module_paths_returns_source_files_of_path_and_discovered_modules(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch(
+        "management_commands.compilation.settings.PATHS",
+        {
+            "command": "management_commands.commands.fanout.Command",
+        },
+    )
+
+    # Mock.
+    mocker.patch(
+        "management_commands.compilation.discover_commands",
+        return_value={
+            "map": ["management_commands.commands.map"],
+            "missing": ["package_does_not_exist.commands.missing"],
+        },
+    )
+
+    # Act.
+    module_paths = get_command_module_paths()
+
+    # Assert.
+    assert list(module_paths) == [
+        "management_commands.commands.fanout",
+        "management_commands.commands.map",
+    ]
+    assert module_paths["management_commands.commands.map"].endswith("map.py")
+
+
+def test_compile_module_writes_bytecode_file(tmp_path: Path) -> None:
+    # Arrange.
+    path = tmp_path / "module.py"
+    path.write_text("x = 1\n")
+
+    # Act.
+    result = compile_module(
+        "module",
+        str(path),
+        py_compile.PycInvalidationMode.TIMESTAMP,
+    )
+
+    # Assert.
+    assert result.error is None
+    assert (tmp_path / cache_from_source(str(path))).exists()
+
+
+def test_compile_module_returns_error_if_module_has_invalid_syntax(
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    path = tmp_path / "module.py"
+    path.write_text("x = \n")
+
+    # Act.
+    result = compile_module(
+        "module",
+        str(path),
+        py_compile.PycInvalidationMode.TIMESTAMP,
+    )
+
+    # Assert.
+    assert result.error is not None
+
+
+def test_compile_modules_compiles_all_modules_in_worker_processes(
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    module_paths = {}
+    for name in ["module_a", "module_b"]:
+        path = tmp_path / f"{name}.py"
+        path.write_text("x = 1\n")
+        module_paths[name] = str(path)
+
+    # Act.
+    results = list(
+        compile_modules(
+            module_paths,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            workers=2,
+        ),
+    )
+
+    # Assert.
+    assert [(result.module, result.error) for result in results] == [
+        ("module_a", None),
+        ("module_b", None),
+    ]
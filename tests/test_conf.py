@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
+from django.test import override_settings
+
+from management_commands import conf
 from management_commands.conf import settings
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 def test_configure_paths_raises_improperly_configured_with_invalid_command_key() -> None:  # fmt: skip
     # Arrange.
@@ -94,6 +102,26 @@ def test_configure_submodules_raises_improperly_configured_with_invalid_module()
     assert exc_info.value.code == "submodules.item"
 
 
+@pytest.mark.parametrize("key", ["billing:export:daily", "billing-export:daily"])
+def test_configure_paths_accepts_namespaced_command_keys(key: str) -> None:
+    # Act.
+    paths = settings.configure_paths({key: "module.Command"})
+
+    # Assert.
+    assert paths == {key: "module.Command"}
+
+
+@pytest.mark.parametrize("key", ["billing:", ":export", "billing::daily"])
+def test_configure_paths_raises_improperly_configured_with_empty_namespace_segment(
+    key: str,
+) -> None:
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_paths({key: "module.Command"})
+
+    assert exc_info.value.code == "paths.key"
+
+
 def test_configure_aliases_raises_improperly_configured_with_invalid_key() -> None:
     # Arrange.
     aliases = {
@@ -133,3 +161,235 @@ def test_configure_aliases_raises_improperly_configured_with_self_reference() ->
         settings.configure_aliases(aliases)
 
     assert exc_info.value.code == "aliases.self_reference"
+
+
+@pytest.mark.parametrize("item", ["command |", "| command", "command_a | | command_b"])
+def test_configure_aliases_raises_improperly_configured_with_empty_pipeline_command(
+    item: str,
+) -> None:
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_aliases({"alias": [item]})
+
+    assert exc_info.value.code == "aliases.pipe"
+
+
+def test_configure_aliases_raises_improperly_configured_with_self_reference_in_pipeline() -> None:  # fmt: skip
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_aliases({"alias": ["command | alias"]})
+
+    assert exc_info.value.code == "aliases.self_reference"
+
+
+def test_configure_alias_mode_raises_improperly_configured_with_invalid_value() -> None:  # fmt: skip
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_alias_mode("invalid")
+
+    assert exc_info.value.code == "alias_mode.value"
+
+
+def test_configure_alias_mode_raises_improperly_configured_if_fork_is_not_supported(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch("management_commands.conf.os", spec=[])
+
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_alias_mode("fork")
+
+    assert exc_info.value.code == "alias_mode.platform"
+
+
+@pytest.mark.parametrize("alias_workers", [0, -1, 1.5])
+def test_configure_alias_workers_raises_improperly_configured_with_invalid_value(
+    alias_workers: int,
+) -> None:
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_alias_workers(alias_workers)
+
+    assert exc_info.value.code == "alias_workers.value"
+
+
+@pytest.mark.parametrize("output_buffer_size", [0, -1, "1"])
+def test_configure_output_buffer_size_raises_improperly_configured_with_invalid_value(
+    output_buffer_size: int,
+) -> None:
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_output_buffer_size(output_buffer_size)
+
+    assert exc_info.value.code == "output_buffer_size.value"
+
+
+@pytest.mark.parametrize(
+    ("schedule", "expected_code"),
+    [
+        ({"* * *": ["command"]}, "schedule.key"),
+        ({"* * * * *": [""]}, "schedule.empty"),
+    ],
+)
+def test_configure_schedule_raises_improperly_configured_with_invalid_value(
+    schedule: dict[str, list[str]],
+    expected_code: str,
+) -> None:
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_schedule(schedule)
+
+    assert exc_info.value.code == expected_code
+
+
+def test_configure_paths_raises_improperly_configured_with_all_errors_found() -> None:
+    # Arrange.
+    paths = {
+        "*command_a": "module_a.Command",
+        "command_b": "*module_b.Command",
+        "command_c": "module_c.Command",
+    }
+
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_paths(paths)
+
+    assert exc_info.value.code == "paths.key"
+    assert [error.code for error in exc_info.value.errors] == [
+        "paths.key",
+        "paths.value",
+    ]
+    assert str(exc_info.value).startswith("2 errors found:")
+
+
+def test_improperly_configured_prefixes_setting_names_in_error_message() -> None:
+    # Arrange.
+    aliases = {
+        "alias": [""],
+    }
+
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_aliases(aliases)
+
+    assert str(exc_info.value).startswith(
+        "empty item found in MANAGEMENT_COMMANDS_ALIASES['alias'][0]",
+    )
+
+
+def test_configure_paths_does_not_validate_same_setting_value_twice(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    paths = {
+        "command_cached": "module.Command",
+    }
+
+    # Mock.
+    is_identifier_spy = mocker.spy(conf, "_is_identifier")
+
+    # Act.
+    settings.configure_paths(dict(paths))
+    settings.configure_paths(dict(paths))
+
+    # Assert.
+    assert is_identifier_spy.call_count == 1
+
+
+def test_configure_single_flight_raises_improperly_configured_with_all_errors_found() -> None:  # fmt: skip
+    # Arrange.
+    single_flight = {
+        "command_a": "invalid",
+        "command_b": "wait",
+        "command_c": "invalid",
+    }
+
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_single_flight(single_flight)
+
+    assert exc_info.value.code == "single_flight.value"
+    assert [error.code for error in exc_info.value.errors] == [
+        "single_flight.value",
+        "single_flight.value",
+    ]
+
+
+@override_settings(
+    MANAGEMENT_COMMANDS_PATHS={
+        "command": "module.Command",
+    },
+)
+def test_configure_standalone_raises_improperly_configured_with_all_errors_found() -> None:  # fmt: skip
+    # Arrange.
+    standalone = [
+        "*command",
+        "command",
+        "missing",
+    ]
+
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_standalone(standalone)
+
+    assert exc_info.value.code == "standalone.item"
+    assert [error.code for error in exc_info.value.errors] == [
+        "standalone.item",
+        "standalone.path",
+    ]
+
+
+@override_settings(
+    MANAGEMENT_COMMANDS_PATHS={
+        "command": "module.Command",
+    },
+)
+def test_configure_standalone_returns_commands_defined_in_paths() -> None:
+    # Arrange.
+    standalone = [
+        "command",
+    ]
+
+    # Act.
+    configured_value = settings.configure_standalone(standalone)
+
+    # Assert.
+    assert configured_value == standalone
+
+
+def test_override_settings_reloads_plugin_setting() -> None:
+    # Arrange.
+    paths = settings.PATHS
+
+    # Act.
+    with override_settings(MANAGEMENT_COMMANDS_PATHS={"command": "module.Command"}):
+        overridden_paths = settings.PATHS
+
+    # Assert.
+    assert overridden_paths == {"command": "module.Command"}
+    assert paths == settings.PATHS
+
+
+def test_override_settings_validates_plugin_setting() -> None:
+    # Arrange.
+    alias_mode = settings.ALIAS_MODE
+    overridden_settings = override_settings(MANAGEMENT_COMMANDS_ALIAS_MODE="invalid")
+
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        overridden_settings.enable()
+
+    assert exc_info.value.code == "alias_mode.value"
+    assert alias_mode == settings.ALIAS_MODE
+
+
+@pytest.mark.parametrize("queue_lease_timeout", [0, -1, "60", True])
+def test_configure_queue_lease_timeout_raises_improperly_configured_with_invalid_value(
+    queue_lease_timeout: float,
+) -> None:
+    # Act & assert.
+    with pytest.raises(settings.ImproperlyConfigured) as exc_info:
+        settings.configure_queue_lease_timeout(queue_lease_timeout)
+
+    assert exc_info.value.code == "queue_lease_timeout.value"
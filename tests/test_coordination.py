@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from management_commands.coordination import Coordinator, run_agent
+from management_commands.execution import CommandResult
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pytest_mock import MockerFixture
+
+
+def test_coordinator_hands_out_each_argv_set_once() -> None:
+    # Arrange.
+    coordinator = Coordinator("command", [["a"], ["b"], ["c"]])
+
+    agent_a = coordinator.connect("agent_a")
+    agent_b = coordinator.connect("agent_b")
+
+    # Act.
+    batch_a = coordinator.take(agent_a, 2)
+    batch_b = coordinator.take(agent_b, 2)
+    batch_c = coordinator.take(agent_b, 2)
+
+    # Assert.
+    assert batch_a == [0, 1]
+    assert batch_b == [2]
+    assert batch_c == []
+
+
+def test_coordinator_retries_failed_argv_set_on_other_agent() -> None:
+    # Arrange.
+    coordinator = Coordinator("command", [["a"]], retries=1)
+
+    agent_a = coordinator.connect("agent_a")
+    agent_b = coordinator.connect("agent_b")
+
+    # Act.
+    coordinator.take(agent_a, 1)
+    coordinator.report(agent_a, 0, 1, 0.0)
+    batch_a = coordinator.take(agent_a, 1)
+    batch_b = coordinator.take(agent_b, 1)
+    coordinator.report(agent_b, 0, 0, 0.0)
+
+    # Assert.
+    assert batch_a == []
+    assert batch_b == [0]
+    assert [(result.agent, result.attempt) for result in coordinator.wait(0)] == [
+        (agent_b, 2),
+    ]
+    assert coordinator.take(agent_a, 1) is None
+
+
+def test_coordinator_retries_failed_argv_set_on_same_agent_if_no_other_is_left() -> (
+    None
+):
+    # Arrange.
+    coordinator = Coordinator("command", [["a"]], retries=1)
+
+    agent_a = coordinator.connect("agent_a")
+
+    # Act.
+    coordinator.take(agent_a, 1)
+    coordinator.report(agent_a, 0, 1, 0.0)
+    batch = coordinator.take(agent_a, 1)
+
+    # Assert.
+    assert batch == [0]
+
+
+def test_coordinator_requeues_argv_sets_of_disconnected_agent() -> None:
+    # Arrange.
+    coordinator = Coordinator("command", [["a"], ["b"]])
+
+    agent_a = coordinator.connect("agent_a")
+    agent_b = coordinator.connect("agent_b")
+
+    # Act.
+    coordinator.take(agent_a, 2)
+    coordinator.disconnect(agent_a)
+    batch = coordinator.take(agent_b, 2)
+
+    # Assert.
+    assert sorted(batch or []) == [0, 1]
+
+
+def test_run_agent_processes_argv_sets_of_coordinator_over_tcp(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    argv_sets = [[f"--item={index}"] for index in range(20)]
+    coordinator = Coordinator("command", argv_sets, retries=1)
+    address = coordinator.start(("127.0.0.1", 0))
+
+    # Mock.
+    def run_command_side_effect(
+        name: str,
+        argv: Sequence[str],
+        **_kwargs: object,
+    ) -> CommandResult:
+        return CommandResult([name, *argv], 0, "", "", 0.0)
+
+    mocker.patch("management_commands.coordination.get_command_class")
+    mocker.patch(
+        "management_commands.coordination.run_command",
+        side_effect=run_command_side_effect,
+    )
+
+    processed: list[int] = []
+
+    def target() -> None:
+        processed.append(run_agent(address, batch_size=3, poll_interval=0.01))
+
+    # Act.
+    threads = [threading.Thread(target=target) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+
+    results = coordinator.wait(10)
+
+    for thread in threads:
+        thread.join(10)
+
+    coordinator.stop()
+
+    # Assert.
+    assert [result.argv for result in results] == argv_sets
+    assert not any(result.exit_code for result in results)
+    assert sum(processed) == len(argv_sets)
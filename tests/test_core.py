@@ -1,26 +1,46 @@
 from __future__ import annotations
 
+import threading
+import time
 from typing import TYPE_CHECKING
 
 import pytest
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import setting_changed
+from django.test import override_settings
 
+from management_commands.buffering import BufferedOutputWrapper
 from management_commands.core import (
+    CommandResolver,
+    clear_command_class_cache,
+    create_cached_parser,
+    create_command,
+    discover_commands,
+    get_command_class,
     get_command_paths,
+    get_settings_fingerprint,
+    get_suggestion_index,
     import_command_class,
+    iter_package_modules,
     load_command_class,
+    resolve_command_class,
+    resolve_command_name,
+    use_command_resolver,
 )
 from management_commands.exceptions import (
     CommandAppLookupError,
     CommandClassLookupError,
     CommandImportError,
+    CommandNameAmbiguityError,
     CommandTypeError,
 )
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
+    from django.core.management.base import CommandParser
+
 
 def test_import_command_class_imports_command_if_dotted_path_points_to_base_command_subclass(
     mocker: MockerFixture,
@@ -230,3 +250,477 @@ def test_load_command_class_raises_command_class_lookup_error_if_none_of_dotted_
     # Act & assert.
     with pytest.raises(CommandClassLookupError):
         load_command_class("command")
+
+
+@pytest.mark.parametrize(
+    ("app_label", "expected_message"),
+    [
+        (None, "did you mean 'command' or 'command_a'?"),
+        ("app", "did you mean 'app.command'?"),
+    ],
+)
+def test_load_command_class_raises_command_class_lookup_error_with_suggestions(
+    mocker: MockerFixture,
+    app_label: str | None,
+    expected_message: str,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.core.settings",
+        PATHS={"command_a": "module.Command"},
+        ALIASES={},
+    )
+
+    # Mock.
+    mocker.patch("management_commands.core.get_commands", return_value={})
+    mocker.patch(
+        "management_commands.core.discover_commands",
+        return_value={"command": ["app.management.commands.command"]},
+    )
+    mocker.patch(
+        "management_commands.core.get_command_packages",
+        return_value=["app.management.commands"],
+    )
+    mocker.patch(
+        "management_commands.core.iter_package_modules",
+        return_value=iter(["app.management.commands.command"]),
+    )
+    mocker.patch(
+        "management_commands.core.import_string",
+        side_effect=ImportError,
+    )
+
+    # Act & assert.
+    with pytest.raises(CommandClassLookupError, match=expected_message):
+        load_command_class("comand", app_label)
+
+
+def test_load_command_class_computes_suggestions_only_when_error_is_rendered(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch(
+        "management_commands.core.get_command_packages",
+        return_value=[],
+    )
+    get_command_suggestions_mock = mocker.patch(
+        "management_commands.core.get_command_suggestions",
+        return_value=["command"],
+    )
+
+    # Act.
+    with pytest.raises(CommandClassLookupError) as exc_info:
+        load_command_class("comand")
+
+    # Assert.
+    get_command_suggestions_mock.assert_not_called()
+    assert str(exc_info.value).endswith("did you mean 'command'?")
+    assert exc_info.value.suggestions == ["command"]
+    get_command_suggestions_mock.assert_called_once_with("comand", None)
+
+
+def test_get_suggestion_index_is_cached_until_command_class_cache_is_cleared(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    discover_commands_mock = mocker.patch(
+        "management_commands.core.discover_commands",
+        return_value={},
+    )
+
+    # Act.
+    index_a = get_suggestion_index()
+    index_b = get_suggestion_index()
+    clear_command_class_cache()
+    index_c = get_suggestion_index()
+
+    # Assert.
+    assert index_a is index_b
+    assert index_a is not index_c
+    assert discover_commands_mock.call_count == 2
+
+
+def test_resolve_command_class_imports_command_from_path(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch(
+        "management_commands.conf.settings.PATHS",
+        {
+            "command": "module.Command",
+        },
+    )
+
+    # Mock.
+    import_command_class_mock = mocker.patch(
+        "management_commands.core.import_command_class",
+    )
+
+    # Act.
+    command_class = resolve_command_class("command")
+
+    # Assert.
+    import_command_class_mock.assert_called_once_with("module.Command")
+    assert command_class is import_command_class_mock.return_value
+
+
+def test_resolve_command_class_loads_command_from_app_if_app_label_specified(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch("management_commands.conf.settings.PATHS", {})
+
+    # Mock.
+    load_command_class_mock = mocker.patch(
+        "management_commands.core.load_command_class",
+    )
+
+    # Act.
+    command_class = resolve_command_class("app.command")
+
+    # Assert.
+    load_command_class_mock.assert_called_once_with("command", "app")
+    assert command_class is load_command_class_mock.return_value
+
+
+def test_get_command_class_caches_resolved_command_classes(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    resolve_command_class_mock = mocker.patch(
+        "management_commands.core.resolve_command_class",
+    )
+
+    # Act.
+    command_class_a = get_command_class("command")
+    command_class_b = get_command_class("command")
+
+    # Assert.
+    resolve_command_class_mock.assert_called_once_with("command")
+    assert command_class_a is command_class_b
+
+
+def test_get_command_class_cache_is_cleared_if_plugin_setting_changes(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    resolve_command_class_mock = mocker.patch(
+        "management_commands.core.resolve_command_class",
+    )
+
+    # Act.
+    get_command_class("command")
+    setting_changed.send(
+        sender=None,
+        setting="MANAGEMENT_COMMANDS_PATHS",
+        value={},
+        enter=True,
+    )
+    get_command_class("command")
+
+    # Assert.
+    assert resolve_command_class_mock.call_count == 2
+
+
+def test_command_resolver_caches_command_classes_per_fingerprint(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    fingerprint = mocker.Mock(side_effect=["a", "a", "b", "a"])
+    resolver = CommandResolver(fingerprint=fingerprint)
+
+    # Mock.
+    resolve_command_class_mock = mocker.patch(
+        "management_commands.core.resolve_command_class",
+        side_effect=[
+            type("CommandA", (BaseCommand,), {}),
+            type("CommandB", (BaseCommand,), {}),
+        ],
+    )
+
+    # Act.
+    command_classes = [resolver.get_command_class("command") for _ in range(4)]
+
+    # Assert.
+    assert resolve_command_class_mock.call_count == 2
+    assert command_classes[0] is command_classes[1] is command_classes[3]
+    assert command_classes[2] is not command_classes[0]
+
+
+def test_get_command_class_uses_active_command_resolver(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    resolver = CommandResolver()
+
+    # Mock.
+    resolve_command_class_mock = mocker.patch(
+        "management_commands.core.resolve_command_class",
+    )
+
+    # Act.
+    with use_command_resolver(resolver):
+        command_class = get_command_class("command")
+    clear_command_class_cache()
+    with use_command_resolver(resolver):
+        get_command_class("command")
+
+    # Assert.
+    resolve_command_class_mock.assert_called_once_with("command")
+    assert resolver.get_command_class("command") is command_class
+
+
+def test_get_settings_fingerprint_changes_with_plugin_settings() -> None:
+    # Act.
+    fingerprint = get_settings_fingerprint()
+    with override_settings(MANAGEMENT_COMMANDS_PATHS={"command": "module.Command"}):
+        overridden_fingerprint = get_settings_fingerprint()
+
+    # Assert.
+    assert overridden_fingerprint != fingerprint
+    assert get_settings_fingerprint() == fingerprint
+
+
+def test_create_cached_parser_reuses_parser_for_same_command_class_and_prog_name() -> None:  # fmt: skip
+    # Arrange.
+    class Command(BaseCommand):
+        pass
+
+    # Act.
+    parser_a = create_cached_parser(Command(), "manage.py", "command")
+    parser_b = create_cached_parser(Command(), "manage.py", "command")
+    parser_c = create_cached_parser(Command(), "django-admin", "command")
+
+    # Assert.
+    assert parser_a is parser_b
+    assert parser_a is not parser_c
+
+
+def test_create_cached_parser_does_not_share_mutable_defaults() -> None:
+    # Arrange.
+    class Command(BaseCommand):
+        def add_arguments(self, parser: CommandParser) -> None:
+            parser.add_argument("--items", nargs="*", default=[])
+
+    command = Command()
+
+    # Act.
+    options = create_cached_parser(command, "manage.py", "command").parse_args([])
+    options.items.append("item")
+    options = create_cached_parser(command, "manage.py", "command").parse_args([])
+
+    # Assert.
+    assert options.items == []
+
+
+@pytest.mark.parametrize("called_from_command_line", [True, False])
+def test_create_cached_parser_keeps_error_handling_of_invocation(
+    called_from_command_line: bool,
+) -> None:
+    # Arrange.
+    class Command(BaseCommand):
+        def add_arguments(self, parser: CommandParser) -> None:
+            parser.add_argument("item")
+
+    command_a, command_b = Command(), Command()
+    command_a._called_from_command_line = called_from_command_line  # type: ignore[attr-defined]  # noqa: SLF001
+    command_b._called_from_command_line = not called_from_command_line  # type: ignore[attr-defined]  # noqa: SLF001
+
+    # Act.
+    create_cached_parser(command_a, "manage.py", "command")
+    parser = create_cached_parser(command_b, "manage.py", "command")
+
+    # Assert.
+    with pytest.raises(CommandError if called_from_command_line else SystemExit):
+        parser.parse_args([])
+
+
+def test_create_command_uses_cached_parsers_if_enabled(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch("management_commands.conf.settings.CACHE_PARSERS", True)
+
+    # Arrange.
+    class Command(BaseCommand):
+        pass
+
+    # Act.
+    parser_a = create_command(Command).create_parser("manage.py", "command")
+    parser_b = create_command(Command).create_parser("manage.py", "command")
+
+    # Assert.
+    assert parser_a is parser_b
+
+
+def test_create_command_does_not_cache_parsers_by_default() -> None:
+    # Arrange.
+    class Command(BaseCommand):
+        pass
+
+    # Act.
+    parser_a = create_command(Command).create_parser("manage.py", "command")
+    parser_b = create_command(Command).create_parser("manage.py", "command")
+
+    # Assert.
+    assert parser_a is not parser_b
+
+
+@pytest.mark.parametrize(
+    ("output_buffer_size", "expected_buffered"),
+    [
+        (None, False),
+        (1024, True),
+    ],
+)
+def test_create_command_buffers_output_if_enabled(
+    mocker: MockerFixture,
+    output_buffer_size: int | None,
+    expected_buffered: bool,
+) -> None:
+    # Configure.
+    mocker.patch(
+        "management_commands.conf.settings.OUTPUT_BUFFER_SIZE",
+        output_buffer_size,
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        pass
+
+    # Act.
+    command = create_command(Command)
+
+    # Assert.
+    assert isinstance(command.stdout, BufferedOutputWrapper) is expected_buffered
+
+
+def test_get_command_class_resolves_each_command_once_if_called_from_many_threads(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    class Command(BaseCommand):
+        pass
+
+    threads_count = 64
+    barrier = threading.Barrier(threads_count)
+    command_classes: list[type[BaseCommand]] = []
+
+    def target(subcommand: str) -> None:
+        barrier.wait()
+        command_classes.append(get_command_class(subcommand))
+
+    # Mock.
+    def resolve_command_class_side_effect(subcommand: str) -> type[BaseCommand]:
+        time.sleep(0.01)
+        return Command
+
+    resolve_command_class_mock = mocker.patch(
+        "management_commands.core.resolve_command_class",
+        side_effect=resolve_command_class_side_effect,
+    )
+
+    # Act.
+    threads = [
+        threading.Thread(target=target, args=(f"command_{index % 4}",))
+        for index in range(threads_count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert.
+    assert resolve_command_class_mock.call_count == 4
+    assert sorted(
+        call.args[0] for call in resolve_command_class_mock.call_args_list
+    ) == ["command_0", "command_1", "command_2", "command_3"]
+    assert command_classes == [Command] * threads_count
+
+
+def test_get_command_class_does_not_cache_failed_lookups(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    resolve_command_class_mock = mocker.patch(
+        "management_commands.core.resolve_command_class",
+        side_effect=[CommandClassLookupError("command"), BaseCommand],
+    )
+
+    # Act.
+    with pytest.raises(CommandClassLookupError):
+        get_command_class("command")
+    command_class = get_command_class("command")
+
+    # Assert.
+    assert command_class is BaseCommand
+    assert resolve_command_class_mock.call_count == 2
+
+
+def test_iter_package_modules_yields_public_modules_of_package() -> None:
+    # Act.
+    modules = list(iter_package_modules("management_commands.commands"))
+
+    # Assert.
+    assert "management_commands.commands.map" in modules
+    assert all(".commands._" not in module for module in modules)
+
+
+def test_iter_package_modules_yields_nothing_if_package_does_not_exist() -> None:
+    # Act.
+    modules = list(iter_package_modules("package_does_not_exist.commands"))
+
+    # Assert.
+    assert modules == []
+
+
+def test_discover_commands_maps_command_names_to_modules_in_lookup_order(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.conf.settings",
+        MODULES=[
+            "management_commands.commands",
+        ],
+        SUBMODULES=[
+            "management.commands",
+        ],
+    )
+
+    # Mock.
+    mocker.patch("management_commands.core.apps.app_configs", {})
+
+    # Act.
+    commands = discover_commands()
+
+    # Assert.
+    assert commands["map"] == ["management_commands.commands.map"]
+    assert commands["migrate"] == ["django.core.management.commands.migrate"]
+
+
+def test_resolve_command_name_expands_unique_prefixes_of_namespaced_names(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.core.settings",
+        PATHS={
+            "billing:export:daily": "module.Command",
+            "billing:export:monthly": "module.Command",
+            "billing:expire": "module.Command",
+        },
+        ALIASES={
+            "billing:erase": ["command"],
+        },
+    )
+
+    # Act & assert.
+    assert resolve_command_name("bil:exp:d") == "billing:export:daily"
+    assert resolve_command_name("b:er") == "billing:erase"
+    assert resolve_command_name("bil:x") == "bil:x"
+    assert resolve_command_name("billing:") == "billing:"
+    assert resolve_command_name("migrate") == "migrate"
+
+    with pytest.raises(CommandNameAmbiguityError):
+        resolve_command_name("bil:e")
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from management_commands.cron import parse_cron_expression
+
+
+@pytest.mark.parametrize(
+    ("expression", "dt", "expected_matches"),
+    [
+        ("* * * * *", datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc), True),
+        ("*/15 9-17 * * 1-5", datetime(2026, 10, 19, 9, 30, tzinfo=timezone.utc), True),
+        (
+            "*/15 9-17 * * 1-5",
+            datetime(2026, 10, 19, 9, 31, tzinfo=timezone.utc),
+            False,
+        ),
+        (
+            "*/15 9-17 * * 1-5",
+            datetime(2026, 10, 18, 9, 30, tzinfo=timezone.utc),
+            False,
+        ),
+        ("0 0 1,15 * *", datetime(2026, 10, 15, 0, 0, tzinfo=timezone.utc), True),
+        ("0 0 * * 7", datetime(2026, 10, 18, 0, 0, tzinfo=timezone.utc), True),
+        ("0 0 13 * 5", datetime(2026, 10, 16, 0, 0, tzinfo=timezone.utc), True),
+        ("0 0 13 * 5", datetime(2026, 10, 13, 0, 0, tzinfo=timezone.utc), True),
+        ("0 0 13 * 5", datetime(2026, 10, 14, 0, 0, tzinfo=timezone.utc), False),
+        ("5/20 * * * *", datetime(2026, 1, 1, 0, 45, tzinfo=timezone.utc), True),
+        ("@hourly", datetime(2026, 1, 1, 7, 0, tzinfo=timezone.utc), True),
+        ("@hourly", datetime(2026, 1, 1, 7, 1, tzinfo=timezone.utc), False),
+    ],
+)
+def test_parse_cron_expression_returns_expression_matching_datetimes(
+    expression: str,
+    dt: datetime,
+    expected_matches: bool,
+) -> None:
+    # Act.
+    cron = parse_cron_expression(expression)
+
+    # Assert.
+    assert cron.matches(dt) is expected_matches
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "* * * *",
+        "60 * * * *",
+        "* 24 * * *",
+        "* * 0 * *",
+        "5-1 * * * *",
+        "*/0 * * * *",
+        "a * * * *",
+        "@never",
+    ],
+)
+def test_parse_cron_expression_raises_value_error_if_expression_is_invalid(
+    expression: str,
+) -> None:
+    # Act & assert.
+    with pytest.raises(ValueError, match=r"invalid|expected"):
+        parse_cron_expression(expression)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from management_commands.eviction import ModuleEvictor, get_module_evictor, is_evictable
+from management_commands.execution import run_command
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+COMMAND_MODULE = """
+from django.core.management.base import BaseCommand
+
+from evictable_commands import {helper}
+{library_import}
+
+CACHE = {{}}
+
+
+class Command(BaseCommand):
+    def handle(self, *args, **options):
+        pass
+"""
+
+
+@pytest.fixture
+def evictable_commands(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[None]:
+    package = tmp_path / "evictable_commands"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+
+    for name in ("a", "b", "c"):
+        (package / f"command_{name}.py").write_text(
+            COMMAND_MODULE.format(
+                helper=f"helper_{name}",
+                library_import="import evictable_library" if name == "b" else "",
+            ),
+        )
+        (package / f"helper_{name}.py").write_text("")
+
+    (tmp_path / "evictable_library.py").write_text("")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    mocker.patch.multiple(
+        "management_commands.core.settings",
+        PATHS={
+            f"command_{name}": f"evictable_commands.command_{name}.Command"
+            for name in ("a", "b", "c")
+        },
+    )
+
+    yield
+
+    for module_name in list(sys.modules):
+        if module_name.startswith(("evictable_commands", "evictable_library")):
+            del sys.modules[module_name]
+
+
+@pytest.mark.usefixtures("evictable_commands")
+def test_module_evictor_evicts_modules_of_least_recently_used_commands() -> None:
+    # Arrange.
+    evictor = ModuleEvictor(size=2, memory_limit=None)
+
+    # Act.
+    for name in ("command_a", "command_b", "command_a", "command_c"):
+        with evictor.track(name):
+            run_command(name)
+
+    # Assert.
+    assert list(evictor.entries) == ["command_a", "command_c"]
+    assert "evictable_commands.command_a" in sys.modules
+    assert "evictable_commands.helper_a" in sys.modules
+    assert "evictable_commands.command_b" not in sys.modules
+    assert "evictable_commands.helper_b" not in sys.modules
+    assert not hasattr(sys.modules["evictable_commands"], "command_b")
+    assert "evictable_library" in sys.modules
+
+
+@pytest.mark.usefixtures("evictable_commands")
+def test_module_evictor_evicts_modules_while_memory_limit_is_exceeded(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    evictor = ModuleEvictor(size=None, memory_limit=1)
+
+    # Mock.
+    mocker.patch("management_commands.eviction.get_rss", side_effect=[0, *[2] * 4])
+
+    # Act.
+    for name in ("command_a", "command_b", "command_c"):
+        with evictor.track(name):
+            run_command(name)
+
+    # Assert.
+    assert list(evictor.entries) == ["command_c"]
+    assert "evictable_commands.command_a" not in sys.modules
+    assert "evictable_commands.command_b" not in sys.modules
+    assert "evictable_commands.command_c" in sys.modules
+
+
+@pytest.mark.usefixtures("evictable_commands")
+def test_module_evictor_does_not_evict_modules_while_other_run_is_active() -> None:
+    # Arrange.
+    evictor = ModuleEvictor(size=1, memory_limit=None)
+
+    # Act.
+    with evictor.track("command_a"):
+        run_command("command_a")
+
+        with evictor.track("command_b"):
+            run_command("command_b")
+
+        evicted_while_active = "evictable_commands.command_a" not in sys.modules
+
+    # Assert.
+    assert not evicted_while_active
+    assert "evictable_commands.command_b" not in sys.modules
+
+
+@pytest.mark.parametrize(
+    ("module_name", "expected_evictable"),
+    [
+        ("json", False),
+        ("django.db", False),
+        ("management_commands.core", False),
+        ("tests", False),
+        ("tests.commands", True),
+        ("numpy", False),
+        ("project_commands", True),
+        ("project_commands.helpers", True),
+    ],
+)
+def test_is_evictable_excludes_modules_outside_command_packages(
+    mocker: MockerFixture,
+    module_name: str,
+    expected_evictable: bool,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.eviction.settings",
+        PATHS={
+            "command": "project_commands.command.Command",
+        },
+    )
+
+    # Mock.
+    mocker.patch(
+        "management_commands.eviction.get_command_packages",
+        return_value=["tests.commands"],
+    )
+    mocker.patch(
+        "management_commands.eviction.apps.get_app_configs",
+        return_value=[SimpleNamespace(name="tests")],
+    )
+    module = mocker.Mock()
+    module.__spec__ = mocker.Mock(origin="module.py")
+
+    # Act.
+    evictable = is_evictable(f"{module_name}.module", module)
+
+    # Assert.
+    assert evictable is expected_evictable
+
+
+def test_get_module_evictor_returns_none_if_eviction_is_disabled() -> None:
+    # Act & assert.
+    assert get_module_evictor() is None
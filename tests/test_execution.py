@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from management_commands.execution import run_command
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_run_command_captures_output_of_successful_command(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch(
+        "management_commands.management.settings.PATHS",
+        {
+            "command": "module.Command",
+        },
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> None:
+            self.stdout.write("output")
+            self.stderr.write("error")
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    # Act.
+    result = run_command("command")
+
+    # Assert.
+    assert result.argv == ["command"]
+    assert result.exit_code == 0
+    assert result.stdout == "output\n"
+    assert result.stderr == "error\n"
+
+
+def test_run_command_returns_command_error_return_code(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch(
+        "management_commands.management.settings.PATHS",
+        {
+            "command": "module.Command",
+        },
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> None:
+            msg = "message"
+            raise CommandError(msg, returncode=3)
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    # Act.
+    result = run_command("command")
+
+    # Assert.
+    assert result.exit_code == 3
+    assert "CommandError: message" in result.stderr
+
+
+def test_run_command_returns_exit_code_1_and_traceback_on_unexpected_error(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch(
+        "management_commands.management.settings.PATHS",
+        {
+            "command": "module.Command",
+        },
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> None:
+            msg = "message"
+            raise RuntimeError(msg)
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    # Act.
+    result = run_command("command")
+
+    # Assert.
+    assert result.exit_code == 1
+    assert "RuntimeError: message" in result.stderr
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import threading
+from io import StringIO
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand
+
+from management_commands.execution import CommandResult
+from management_commands.fanout import PrefixedStream, fan_out, match_databases
+
+if TYPE_CHECKING:
+    from io import TextIOBase
+
+    from pytest_mock import MockerFixture
+
+    from django.core.management.base import CommandParser
+
+
+def test_prefixed_stream_prefixes_complete_lines_and_writes_partial_one_on_close() -> None:  # fmt: skip
+    # Arrange.
+    stream = StringIO()
+    prefixed_stream = PrefixedStream(stream, "[db] ", threading.Lock())
+
+    # Act.
+    prefixed_stream.write("line 1\nline")
+    prefixed_stream.flush()
+    output_before_close = stream.getvalue()
+    prefixed_stream.write(" 2\nline 3")
+    prefixed_stream.close()
+
+    # Assert.
+    assert output_before_close == "[db] line 1\n"
+    assert stream.getvalue() == "[db] line 1\n[db] line 2\n[db] line 3\n"
+
+
+def test_match_databases_returns_database_aliases_matching_any_pattern(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch(
+        "management_commands.fanout.connections",
+        ["default", "shard_1", "shard_2", "replica"],
+    )
+
+    # Act.
+    databases = match_databases(["shard_*", "default"])
+
+    # Assert.
+    assert databases == ["default", "shard_1", "shard_2"]
+
+
+def test_fan_out_runs_command_against_each_database_with_prefixed_output(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    def run_command_side_effect(
+        name: str,
+        argv: list[str],
+        *,
+        stdout: TextIOBase,
+        stderr: TextIOBase,
+    ) -> CommandResult:
+        database = argv[-1]
+        stdout.write(f"migrated {database}\n")
+        return CommandResult([name, *argv], int(database == "b"), "", "", 0.0)
+
+    mocker.patch(
+        "management_commands.fanout.run_command",
+        side_effect=run_command_side_effect,
+    )
+    connections_mock = mocker.patch("management_commands.fanout.connections")
+    stdout = StringIO()
+
+    # Act.
+    results = fan_out(
+        "migrate",
+        ["--no-input"],
+        ["a", "b"],
+        stdout=stdout,
+        stderr=StringIO(),
+    )
+
+    # Assert.
+    assert [(database, result.exit_code) for database, result in results] == [
+        ("a", 0),
+        ("b", 1),
+    ]
+    assert results[0].result.argv == ["migrate", "--no-input", "--database", "a"]
+    assert sorted(stdout.getvalue().splitlines()) == [
+        "[a] migrated a",
+        "[b] migrated b",
+    ]
+    assert connections_mock.close_all.call_count == 2
+
+
+def test_fan_out_runs_each_alias_step_against_each_database(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "command": "module.Command",
+        },
+        ALIASES={
+            "alias": [
+                "command --step a",
+                "command --step b",
+            ],
+        },
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        def add_arguments(self, parser: CommandParser) -> None:
+            parser.add_argument("--step")
+            parser.add_argument("--database", default="default")
+
+        def handle(self, *args: Any, **options: Any) -> None:
+            self.stdout.write(f"step={options['step']} db={options['database']}")
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+    mocker.patch("management_commands.fanout.connections")
+    stdout = StringIO()
+
+    # Act.
+    results = fan_out(
+        "alias",
+        [],
+        ["shard_1", "shard_2"],
+        stdout=stdout,
+        stderr=StringIO(),
+    )
+
+    # Assert.
+    assert [result.exit_code for _, result in results] == [0, 0]
+    assert sorted(stdout.getvalue().splitlines()) == [
+        "[shard_1] step=a db=shard_1",
+        "[shard_1] step=b db=shard_1",
+        "[shard_2] step=a db=shard_2",
+        "[shard_2] step=b db=shard_2",
+    ]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+import pytest
+
+from management_commands.history import (
+    Run,
+    get_longest_first_order,
+    get_runs,
+    record_run,
+    save_run,
+    summarize_runs,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def _run(name: str, duration: float, exit_code: int = 0) -> Run:
+    return Run(name, [], None, 0.0, duration, exit_code, None)
+
+
+@pytest.mark.parametrize(
+    ("exc", "expected_exit_code"),
+    [
+        (None, 0),
+        (SystemExit(3), 3),
+        (SystemExit("error"), 1),
+        (RuntimeError(), 1),
+    ],
+)
+def test_record_run_saves_run_with_exit_code(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    exc: BaseException | None,
+    expected_exit_code: int,
+) -> None:
+    # Configure.
+    path = str(tmp_path / "history.sqlite3")
+    mocker.patch.multiple("management_commands.history.settings", HISTORY_DB=path)
+
+    # Act.
+    with suppress(SystemExit, RuntimeError), record_run("command", ["--a"], "alias"):
+        if exc:
+            raise exc
+
+    # Assert.
+    [run] = get_runs(path)
+    assert run.name == "command"
+    assert run.argv == ["--a"]
+    assert run.alias == "alias"
+    assert run.exit_code == expected_exit_code
+    assert run.duration >= 0
+
+
+def test_record_run_saves_peak_memory_growth_during_run(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Configure.
+    path = str(tmp_path / "history.sqlite3")
+    mocker.patch.multiple("management_commands.history.settings", HISTORY_DB=path)
+
+    # Mock.
+    mocker.patch(
+        "management_commands.history.get_peak_memory",
+        side_effect=[100, 250],
+    )
+
+    # Act.
+    with record_run("command", []):
+        pass
+
+    # Assert.
+    [run] = get_runs(path)
+    assert run.peak_memory == 150
+
+
+def test_record_run_does_nothing_if_history_db_is_not_set(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple("management_commands.history.settings", HISTORY_DB=None)
+
+    # Mock.
+    save_run_mock = mocker.patch("management_commands.history.save_run")
+
+    # Act.
+    with record_run("command", []):
+        pass
+
+    # Assert.
+    save_run_mock.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("durations", "expected_regressed"),
+    [
+        ([1.0, 1.0, 1.0], False),
+        ([2.0, 1.0, 1.0], True),
+        ([2.0, 1.0], False),
+    ],
+)
+def test_summarize_runs_flags_regression_of_latest_run(
+    durations: list[float],
+    expected_regressed: bool,
+) -> None:
+    # Act.
+    summary = summarize_runs(
+        "command",
+        [*map(_run, ["command"] * len(durations), durations), _run("command", 9, 1)],
+        threshold=1.5,
+    )
+
+    # Assert.
+    assert summary.runs == len(durations) + 1
+    assert summary.failures == 1
+    assert summary.latest == durations[0]
+    assert summary.regressed is expected_regressed
+
+
+def test_get_longest_first_order_sorts_steps_by_mean_duration(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Configure.
+    path = str(tmp_path / "history.sqlite3")
+    mocker.patch.multiple("management_commands.history.settings", HISTORY_DB=path)
+
+    # Arrange.
+    for run in [
+        _run("short", 1),
+        _run("long", 5),
+        _run("long", 3),
+        _run("failed", 9, 1),
+    ]:
+        save_run(path, run)
+
+    # Act.
+    order = get_longest_first_order(["short", "long", "unknown"])
+
+    # Assert.
+    assert order == [2, 1, 0]
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import time
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+import pytest
+
+from management_commands.exceptions import CommandQueueNotConfiguredError
+from management_commands.execution import CommandResult
+from management_commands.jobs import claim_job, connect, enqueue, get_job, run_worker
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def queue_db(mocker: MockerFixture, tmp_path: Path) -> str:
+    path = str(tmp_path / "queue.sqlite3")
+    mocker.patch.multiple("management_commands.jobs.settings", QUEUE_DB=path)
+
+    return path
+
+
+def test_enqueue_raises_error_if_queue_is_not_configured(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple("management_commands.jobs.settings", QUEUE_DB=None)
+
+    # Act & assert.
+    with pytest.raises(CommandQueueNotConfiguredError):
+        enqueue("command")
+
+
+@pytest.mark.usefixtures("queue_db")
+def test_enqueue_stores_queued_job() -> None:
+    # Act.
+    job_id = enqueue("command", ["--option", "value"])
+
+    # Assert.
+    job = get_job(job_id)
+    assert job is not None
+    assert job.name == "command"
+    assert job.argv == ["--option", "value"]
+    assert job.status == "queued"
+
+
+@pytest.mark.usefixtures("queue_db")
+def test_claim_job_claims_each_job_once() -> None:
+    # Arrange.
+    job_ids = [enqueue("command_a"), enqueue("command_b")]
+
+    # Act.
+    with closing(connect()) as connection_a, closing(connect()) as connection_b:
+        job_a = claim_job(connection_a, "worker_a")
+        job_b = claim_job(connection_b, "worker_b")
+        job_c = claim_job(connection_a, "worker_a")
+
+    # Assert.
+    assert job_a is not None
+    assert job_b is not None
+    assert [job_a.id, job_b.id] == job_ids
+    assert job_c is None
+    assert [job.status for job in map(get_job, job_ids) if job] == ["running"] * 2
+
+
+@pytest.mark.usefixtures("queue_db")
+def test_claim_job_reclaims_running_job_of_worker_without_heartbeat() -> None:
+    # Arrange.
+    stale_job_id, alive_job_id = enqueue("command_a"), enqueue("command_b")
+
+    with closing(connect()) as connection:
+        claim_job(connection, "worker_a")
+        claim_job(connection, "worker_b")
+        connection.execute(
+            "UPDATE jobs SET heartbeat_at = heartbeat_at - 120 WHERE id = ?",
+            (stale_job_id,),
+        )
+
+        # Act.
+        reclaimed_job = claim_job(connection, "worker_c", lease_timeout=60)
+        unclaimed_job = claim_job(connection, "worker_c", lease_timeout=60)
+
+    # Assert.
+    assert reclaimed_job is not None
+    assert reclaimed_job.id == stale_job_id
+    assert unclaimed_job is None
+
+    stale_job, alive_job = get_job(stale_job_id), get_job(alive_job_id)
+    assert stale_job is not None
+    assert stale_job.worker == "worker_c"
+    assert alive_job is not None
+    assert alive_job.worker == "worker_b"
+
+
+@pytest.mark.usefixtures("queue_db")
+def test_run_worker_sends_heartbeats_while_job_is_running(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple("management_commands.jobs.settings", QUEUE_LEASE_TIMEOUT=0.03)
+
+    # Arrange.
+    job_id = enqueue("command")
+    heartbeats: list[float | None] = []
+
+    # Mock.
+    def run_command_side_effect(name: str, argv: list[str]) -> CommandResult:
+        for _ in range(2):
+            time.sleep(0.05)
+
+            job = get_job(job_id)
+            heartbeats.append(job.heartbeat_at if job else None)
+
+        return CommandResult([name, *argv], 0, "", "", 0.1)
+
+    mocker.patch(
+        "management_commands.jobs.run_command",
+        side_effect=run_command_side_effect,
+    )
+
+    # Act.
+    run_worker(burst=True)
+
+    # Assert.
+    job = get_job(job_id)
+    assert job is not None
+    assert job.status == "succeeded"
+    assert None not in heartbeats
+    assert heartbeats[0] < heartbeats[1]  # type: ignore[operator]
+
+
+@pytest.mark.usefixtures("queue_db")
+def test_run_worker_runs_queued_jobs_and_records_results(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    job_ids = [enqueue("command_a", ["arg"]), enqueue("command_b")]
+
+    # Mock.
+    run_command_mock = mocker.patch(
+        "management_commands.jobs.run_command",
+        side_effect=[
+            CommandResult(["command_a", "arg"], 0, "output", "", 0.1),
+            CommandResult(["command_b"], 2, "", "error", 0.1),
+        ],
+    )
+    callback = mocker.Mock()
+
+    # Act.
+    processed = run_worker(burst=True, callback=callback)
+
+    # Assert.
+    assert processed == 2
+    assert run_command_mock.call_args_list == [
+        mocker.call("command_a", ["arg"]),
+        mocker.call("command_b", []),
+    ]
+    assert callback.call_count == 2
+
+    job_a, job_b = map(get_job, job_ids)
+    assert job_a is not None
+    assert (job_a.status, job_a.exit_code, job_a.stdout) == ("succeeded", 0, "output")
+    assert job_b is not None
+    assert (job_b.status, job_b.exit_code, job_b.stderr) == ("failed", 2, "error")
+
+
+@pytest.mark.usefixtures("queue_db")
+def test_run_worker_requeues_job_if_interrupted(mocker: MockerFixture) -> None:
+    # Arrange.
+    job_id = enqueue("command")
+
+    # Mock.
+    mocker.patch(
+        "management_commands.jobs.run_command",
+        side_effect=KeyboardInterrupt,
+    )
+
+    # Act.
+    with pytest.raises(KeyboardInterrupt):
+        run_worker(burst=True)
+
+    # Assert.
+    job = get_job(job_id)
+    assert job is not None
+    assert job.status == "queued"
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+import sys
+from io import StringIO
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
 
 import pytest
 
 from django.core.management import get_commands
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
 
-from management_commands.management import execute_from_command_line
+from management_commands.history import ALIAS_ENVIRONMENT_VARIABLE, get_runs
+from management_commands.management import (
+    ManagementUtility,
+    call_command,
+    execute_from_command_line,
+)
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_mock import MockerFixture
 
 
@@ -56,6 +67,44 @@ def test_execute_from_command_line_help_displays_paths_and_aliases(
     ) in captured.out
 
 
+def test_execute_from_command_line_help_displays_namespaces(
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Mock.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "command": "module.Command",
+            "billing:export": "module.Command",
+            "reports:sales:daily": "module.Command",
+        },
+        ALIASES={
+            "billing:all": [
+                "billing:export",
+            ],
+        },
+    )
+
+    # Act.
+    execute_from_command_line(["manage.py", "--help"])
+    captured = capsys.readouterr()
+
+    # Assert.
+    assert (
+        "[django-management-commands: paths]\n"
+        "    command\n"
+        "\n"
+        "[django-management-commands: billing]\n"
+        "    billing:all\n"
+        "    billing:export\n"
+        "\n"
+        "[django-management-commands: reports]\n"
+        "    reports:sales:daily\n"
+        "\n"
+    ) in captured.out
+
+
 def test_execute_from_command_line_falls_back_to_django_management_utility_if_command_name_is_not_passed(
     mocker: MockerFixture,
 ) -> None:
@@ -124,6 +173,113 @@ def test_execute_from_command_line_runs_command_from_path(
     command_run_from_argv_mock.assert_called_once()
 
 
+def test_execute_from_command_line_runs_namespaced_command_by_unique_prefix(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch(
+        "management_commands.management.settings.PATHS",
+        {
+            "billing:export:daily": "module.Command",
+            "billing:export:monthly": "module.OtherCommand",
+        },
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        pass
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    command_run_from_argv_mock = mocker.patch.object(Command, "run_from_argv")
+
+    # Act.
+    execute_from_command_line(["manage.py", "bil:exp:d", "--verbosity", "2"])
+
+    # Assert.
+    command_run_from_argv_mock.assert_called_once_with(
+        ["manage.py", "billing:export:daily", "--verbosity", "2"],
+    )
+
+
+@pytest.mark.parametrize("name", ["billing", "billing:", "bil:exp:"])
+def test_execute_from_command_line_lists_commands_in_namespace(
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+    name: str,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "billing:export:daily": "module.Command",
+            "billing:export:monthly": "module.Command",
+        },
+        ALIASES={
+            "billing:export:all": [
+                "billing:export:daily",
+                "billing:export:monthly",
+            ],
+        },
+    )
+
+    # Act.
+    execute_from_command_line(["manage.py", name])
+    captured = capsys.readouterr()
+
+    # Assert.
+    assert captured.out.endswith(
+        "    billing:export:all\n"
+        "    billing:export:daily\n"
+        "    billing:export:monthly\n",
+    )
+
+
+def test_execute_from_command_line_runs_command_shadowed_by_namespace(
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "check:deep": "module.Command",
+        },
+    )
+
+    # Act.
+    execute_from_command_line(["manage.py", "check"])
+    captured = capsys.readouterr()
+
+    # Assert.
+    assert "System check identified no issues" in captured.out
+    assert "check:deep" not in captured.out
+
+
+def test_execute_from_command_line_lists_namespace_shadowing_command_with_separator(
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "check:deep": "module.Command",
+        },
+    )
+
+    # Act.
+    execute_from_command_line(["manage.py", "check:"])
+    captured = capsys.readouterr()
+
+    # Assert.
+    assert captured.out.endswith("    check:deep\n")
+
+
 def test_execute_from_command_line_uses_django_management_utility_to_run_command_from_path(
     mocker: MockerFixture,
 ) -> None:
@@ -588,3 +744,602 @@ def test_execute_from_command_line_resolves_duplicate_command_names_based_on_ord
 
     # Assert.
     command_b_run_from_argv_mock.assert_called_once()
+
+
+def test_call_command_runs_command_from_path_and_returns_its_output(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch(
+        "management_commands.management.settings.PATHS",
+        {
+            "command": "module.Command",
+        },
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        def add_arguments(self, parser: CommandParser) -> None:
+            parser.add_argument("arg")
+
+        def handle(self, *args: Any, **options: Any) -> str:
+            return f"output: {options['arg']}"
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    # Act.
+    output = call_command("command", "value", stdout=StringIO())
+
+    # Assert.
+    assert output == "output: value"
+
+
+def test_call_command_runs_all_commands_assigned_to_alias(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "command_a": "module.CommandA",
+            "command_b": "module.CommandB",
+        },
+        ALIASES={
+            "alias": [
+                "command_a",
+                "command_b --option value",
+            ],
+        },
+    )
+
+    # Arrange.
+    class CommandA(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> str:
+            return "output_a"
+
+    class CommandB(BaseCommand):
+        def add_arguments(self, parser: CommandParser) -> None:
+            parser.add_argument("--option")
+
+        def handle(self, *args: Any, **options: Any) -> str:
+            return f"output_b: {options['option']}"
+
+    # Mock.
+    def import_string_side_effect(dotted_path: str) -> type[BaseCommand]:
+        if dotted_path == "module.CommandA":
+            return CommandA
+        if dotted_path == "module.CommandB":
+            return CommandB
+        raise ImportError
+
+    mocker.patch(
+        "management_commands.core.import_string",
+        side_effect=import_string_side_effect,
+    )
+
+    # Act.
+    output = call_command("alias", stdout=StringIO())
+
+    # Assert.
+    assert output == ["output_a", "output_b: value"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_call_command_runs_alias_inside_atomic_block(mocker: MockerFixture) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "command": "module.Command",
+        },
+        ALIASES={
+            "alias": [
+                "command",
+            ],
+        },
+        ALIAS_PRECONNECT=True,
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> None:
+            with connection.cursor() as cursor:
+                cursor.execute("INSERT INTO item VALUES ('command')")
+
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE TABLE item (name TEXT)")
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    # Act.
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("INSERT INTO item VALUES ('before')")
+        call_command("alias", stdout=StringIO())
+        cursor.execute("INSERT INTO item VALUES ('after')")
+
+    # Assert.
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT name FROM item")
+
+        assert [name for (name,) in cursor.fetchall()] == ["before", "command", "after"]
+
+
+def test_call_command_appends_positional_arguments_to_each_alias_step(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "command": "module.Command",
+        },
+        ALIASES={
+            "alias": [
+                "command --option a",
+                "command --option b",
+            ],
+        },
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        def add_arguments(self, parser: CommandParser) -> None:
+            parser.add_argument("--option")
+            parser.add_argument("--database")
+
+        def handle(self, *args: Any, **options: Any) -> str:
+            return f"{options['option']}: {options['database']}"
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    # Act.
+    output = call_command("alias", "--database", "replica", stdout=StringIO())
+
+    # Assert.
+    assert output == ["a: replica", "b: replica"]
+
+
+def test_call_command_appends_positional_arguments_to_each_pipeline_command(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        ALIASES={
+            "alias": [
+                "export | import",
+            ],
+        },
+    )
+
+    # Mock.
+    run_in_subprocesses_mock = mocker.patch(
+        "management_commands.management.run_in_subprocesses",
+        return_value=[0],
+    )
+
+    # Act.
+    call_command("alias", "--database", "replica", stdout=StringIO())
+
+    # Assert.
+    assert run_in_subprocesses_mock.call_args.args[1] == [
+        "export --database replica | import --database replica",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("exit_codes", "expected_exit_code"),
+    [
+        ([0, 0], None),
+        ([0, 2, None], 2),
+    ],
+)
+def test_execute_from_command_line_runs_alias_in_subprocesses_if_configured(
+    mocker: MockerFixture,
+    exit_codes: list[int | None],
+    expected_exit_code: int | None,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        ALIASES={
+            "alias": [
+                "command_a",
+                "command_b",
+            ],
+        },
+        ALIAS_MODE="subprocess",
+        ALIAS_WORKERS=2,
+    )
+
+    # Mock.
+    run_in_subprocesses_mock = mocker.patch(
+        "management_commands.management.run_in_subprocesses",
+        return_value=exit_codes,
+    )
+    sys_exit_mock = mocker.patch("management_commands.management.sys.exit")
+
+    # Act.
+    execute_from_command_line(["manage.py", "alias"])
+
+    # Assert.
+    assert run_in_subprocesses_mock.call_args.args[1] == ["command_a", "command_b"]
+    assert run_in_subprocesses_mock.call_args.kwargs["workers"] == 2
+    if expected_exit_code:
+        sys_exit_mock.assert_called_once_with(expected_exit_code)
+    else:
+        sys_exit_mock.assert_not_called()
+
+
+def test_execute_from_command_line_runs_alias_in_forks_if_configured(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        ALIASES={
+            "alias": [
+                "command_a",
+                "command_b",
+            ],
+        },
+        ALIAS_MODE="fork",
+    )
+
+    # Mock.
+    setup_mock = mocker.patch("management_commands.management.django.setup")
+    resolve_command_class_mock = mocker.patch(
+        "management_commands.management.resolve_command_class",
+    )
+    run_in_forks_mock = mocker.patch(
+        "management_commands.management.run_in_forks",
+        return_value=[0, 4],
+    )
+    sys_exit_mock = mocker.patch("management_commands.management.sys.exit")
+
+    # Act.
+    execute_from_command_line(["manage.py", "alias"])
+
+    # Assert.
+    setup_mock.assert_called_once_with()
+    assert resolve_command_class_mock.call_count == 2
+    assert run_in_forks_mock.call_args.args[1] == ["command_a", "command_b"]
+    sys_exit_mock.assert_called_once_with(4)
+
+
+def test_management_utility_manages_connections_around_alias_step(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch(
+        "management_commands.management.settings.ALIAS_PRECONNECT",
+        True,
+    )
+
+    # Arrange.
+    utility = ManagementUtility(["manage.py", "alias"])
+
+    # Mock.
+    manage_step_connections_mock = mocker.patch(
+        "management_commands.management.manage_step_connections",
+    )
+    execute_mock = mocker.patch.object(ManagementUtility, "execute")
+
+    # Act.
+    utility.execute_step("alias", ["command", "--database", "replica"])
+
+    # Assert.
+    manage_step_connections_mock.assert_called_once_with(
+        ["command", "--database", "replica"],
+        preconnect=True,
+    )
+    manage_step_connections_mock.return_value.__enter__.assert_called_once()
+    execute_mock.assert_called_once_with()
+
+
+@pytest.mark.parametrize(
+    ("exit_code", "expected_exit_code"),
+    [
+        (0, None),
+        (3, 3),
+    ],
+)
+def test_execute_from_command_line_runs_alias_pipeline_in_subprocesses(
+    mocker: MockerFixture,
+    exit_code: int,
+    expected_exit_code: int | None,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        ALIASES={
+            "alias": [
+                "export --format csv | import",
+            ],
+        },
+        ALIAS_PIPE_SIZE=4096,
+    )
+
+    # Mock.
+    run_in_subprocesses_mock = mocker.patch(
+        "management_commands.management.run_in_subprocesses",
+        return_value=[exit_code],
+    )
+    sys_exit_mock = mocker.patch("management_commands.management.sys.exit")
+
+    # Act.
+    execute_from_command_line(["manage.py", "alias"])
+
+    # Assert.
+    assert run_in_subprocesses_mock.call_args.args == (
+        [sys.executable, "manage.py"],
+        ["export --format csv | import"],
+    )
+    assert run_in_subprocesses_mock.call_args.kwargs["pipe_size"] == 4096
+    assert (
+        run_in_subprocesses_mock.call_args.kwargs["env"][ALIAS_ENVIRONMENT_VARIABLE]
+        == "alias"
+    )
+    if expected_exit_code:
+        sys_exit_mock.assert_called_once_with(expected_exit_code)
+    else:
+        sys_exit_mock.assert_not_called()
+
+
+def test_call_command_runs_alias_pipeline_in_subprocesses(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        ALIASES={
+            "alias": [
+                "export | import",
+            ],
+        },
+    )
+
+    # Arrange.
+    stdout = StringIO()
+
+    # Mock.
+    run_in_subprocesses_mock = mocker.patch(
+        "management_commands.management.run_in_subprocesses",
+        return_value=[2],
+    )
+
+    # Act & assert.
+    with pytest.raises(CommandError) as exc_info:
+        call_command("alias", stdout=stdout)
+
+    assert exc_info.value.returncode == 2
+    assert run_in_subprocesses_mock.call_args.args == (
+        [sys.executable, "-m", "management_commands"],
+        ["export | import"],
+    )
+    assert run_in_subprocesses_mock.call_args.kwargs["stdout"] is stdout
+
+
+def test_management_utility_starts_aliased_commands_as_module_if_run_as_module(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange.
+    utility = ManagementUtility(["/venv/management_commands/__main__.py", "alias"])
+
+    # Mock.
+    monkeypatch.setitem(
+        sys.modules,
+        "__main__",
+        SimpleNamespace(__spec__=SimpleNamespace(name="management_commands.__main__")),
+    )
+
+    # Act.
+    prefix_argv = utility.get_prefix_argv()
+
+    # Assert.
+    assert prefix_argv == [sys.executable, "-m", "management_commands"]
+
+
+def test_execute_from_command_line_runs_longest_alias_steps_first_if_history_exists(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        ALIASES={
+            "alias": [
+                "command_a",
+                "command_b --option",
+            ],
+        },
+        ALIAS_MODE="subprocess",
+        ALIAS_WORKERS=2,
+    )
+
+    # Mock.
+    get_longest_first_order_mock = mocker.patch(
+        "management_commands.management.get_longest_first_order",
+        return_value=[1, 0],
+    )
+    run_in_subprocesses_mock = mocker.patch(
+        "management_commands.management.run_in_subprocesses",
+        return_value=[0, 0],
+    )
+
+    # Act.
+    execute_from_command_line(["manage.py", "alias"])
+
+    # Assert.
+    get_longest_first_order_mock.assert_called_once_with(["command_a", "command_b"])
+    assert run_in_subprocesses_mock.call_args.kwargs["order"] == [1, 0]
+    assert (
+        run_in_subprocesses_mock.call_args.kwargs["env"][
+            "MANAGEMENT_COMMANDS_HISTORY_ALIAS"
+        ]
+        == "alias"
+    )
+
+
+def test_execute_from_command_line_records_history_of_alias_and_its_steps(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Configure.
+    path = str(tmp_path / "history.sqlite3")
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "command_a": "module.CommandA",
+            "command_b": "module.CommandB",
+        },
+        ALIASES={
+            "alias": [
+                "command_a",
+                "command_b",
+            ],
+        },
+        HISTORY_DB=path,
+    )
+
+    # Arrange.
+    class CommandA(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> None:
+            pass
+
+    class CommandB(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> None:
+            raise SystemExit(2)
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        side_effect=lambda dotted_path: {
+            "module.CommandA": CommandA,
+            "module.CommandB": CommandB,
+        }[dotted_path],
+    )
+
+    # Act.
+    with pytest.raises(SystemExit):
+        execute_from_command_line(["manage.py", "alias"])
+
+    # Assert.
+    assert [(run.name, run.alias, run.exit_code) for run in get_runs(path)] == [
+        ("command_b", "alias", 2),
+        ("command_a", "alias", 0),
+        ("alias", None, 2),
+    ]
+
+
+def test_execute_from_command_line_runs_single_flight_command_with_lock(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "command": "module.Command",
+        },
+        SINGLE_FLIGHT={
+            "command": "wait",
+        },
+        SINGLE_FLIGHT_DIR=str(tmp_path),
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        pass
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    command_run_from_argv_mock = mocker.patch.object(Command, "run_from_argv")
+
+    # Act.
+    execute_from_command_line(["manage.py", "command", "--option"])
+
+    # Assert.
+    command_run_from_argv_mock.assert_called_once_with(
+        ["manage.py", "command", "--option"],
+    )
+    assert len(list(tmp_path.glob("*.status"))) == 1
+
+
+def test_execute_from_command_line_runs_standalone_command_without_setting_up_django(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.management.settings",
+        PATHS={
+            "command": "module.Command",
+        },
+        STANDALONE=[
+            "command",
+        ],
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> None:
+            pass
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    django_setup_mock = mocker.patch("django.setup")
+    command_check_mock = mocker.patch.object(Command, "check")
+    command_execute_spy = mocker.spy(Command, "execute")
+
+    # Act.
+    execute_from_command_line(["manage.py", "command"])
+
+    # Assert.
+    django_setup_mock.assert_not_called()
+    command_check_mock.assert_not_called()
+    command_execute_spy.assert_called_once()
+
+
+def test_execute_from_command_line_help_is_served_from_cache_if_cache_dir_is_set(
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    # Configure.
+    mocker.patch(
+        "management_commands.management.settings.HELP_CACHE_DIR",
+        str(tmp_path),
+    )
+
+    # Mock.
+    render_main_help_text_spy = mocker.spy(ManagementUtility, "render_main_help_text")
+
+    # Act.
+    execute_from_command_line(["manage.py", "help"])
+    output_a = capsys.readouterr().out
+    execute_from_command_line(["manage.py", "help"])
+    output_b = capsys.readouterr().out
+
+    # Assert.
+    render_main_help_text_spy.assert_called_once()
+    assert output_a == output_b
+    assert len(list(tmp_path.glob("help-*"))) == 1
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+from management_commands.exceptions import CommandNameAmbiguityError
+from management_commands.namespaces import CommandTrie, SegmentIndex
+
+
+def test_segment_index_matches_unique_prefix() -> None:
+    # Arrange.
+    index = SegmentIndex()
+    for segment in ["daily", "delete", "monthly"]:
+        index.add(segment)
+
+    # Act & assert.
+    assert index.match("m") == ["monthly"]
+    assert index.match("da") == ["daily"]
+    assert index.match("d") == ["daily", "delete"]
+    assert index.match("x") == []
+
+
+def test_segment_index_prefers_exact_match_over_longer_segments() -> None:
+    # Arrange.
+    index = SegmentIndex()
+    for segment in ["export", "export-all"]:
+        index.add(segment)
+
+    # Act & assert.
+    assert index.match("export") == ["export"]
+    assert index.match("export-") == ["export-all"]
+
+
+def test_command_trie_resolves_abbreviated_namespaced_names() -> None:
+    # Arrange.
+    trie = CommandTrie(
+        [
+            "billing:export:daily",
+            "billing:export:monthly",
+            "billing:import",
+            "build",
+        ],
+    )
+
+    # Act & assert.
+    assert trie.resolve("bil:exp:d") == "billing:export:daily"
+    assert trie.resolve("b:e:m") == "billing:export:monthly"
+    assert trie.resolve("billing:i") == "billing:import"
+    assert trie.resolve("bil:exp") is None
+    assert trie.resolve("bil:x") is None
+
+
+def test_command_trie_raises_error_for_ambiguous_names() -> None:
+    # Arrange.
+    trie = CommandTrie(["billing:export", "billing:erase", "build:export"])
+
+    # Act & assert.
+    with pytest.raises(CommandNameAmbiguityError) as exc_info:
+        trie.resolve("bil:e")
+
+    assert exc_info.value.candidates == ["billing:erase", "billing:export"]
+    assert str(exc_info.value) == (
+        "command name 'bil:e' is ambiguous; "
+        "it may refer to 'billing:erase' or 'billing:export'"
+    )
+
+
+def test_command_trie_finds_namespaces_and_lists_their_names() -> None:
+    # Arrange.
+    trie = CommandTrie(
+        [
+            "billing:export:monthly",
+            "billing:export:daily",
+            "billing",
+            "reports:sales",
+            "cleanup",
+        ],
+    )
+
+    # Act.
+    namespace = trie.find_namespace("bil:e")
+
+    # Assert.
+    assert namespace is not None
+    assert namespace.path == "billing:export"
+    assert list(namespace.iter_names()) == [
+        "billing:export:daily",
+        "billing:export:monthly",
+    ]
+    assert [namespace.path for namespace in trie.namespaces] == ["billing", "reports"]
+    assert trie.find_namespace("cleanup") is None
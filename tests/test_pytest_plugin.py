@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+COMMANDS = """
+from django.core.management.base import BaseCommand
+
+
+class Greet(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument("--name", default="world")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Hello, {options['name']}!")
+"""
+
+TESTS = """
+from django.test import override_settings
+
+
+@override_settings(MANAGEMENT_COMMANDS_PATHS={"greet": "plugin_commands.Greet"})
+def test_run_command_runs_command_with_captured_output(run_command):
+    result = run_command("greet", "--name", "plugin")
+
+    assert result.exit_code == 0
+    assert result.stdout == "Hello, plugin!\\n"
+
+
+@override_settings(MANAGEMENT_COMMANDS_ALIASES={"hello": ["greet"]})
+@override_settings(MANAGEMENT_COMMANDS_PATHS={"greet": "plugin_commands.Greet"})
+def test_run_command_runs_alias(run_command):
+    result = run_command("hello")
+
+    assert result.stdout == "Hello, world!\\n"
+
+
+def test_run_command_does_not_reuse_command_classes_of_other_settings(run_command):
+    result = run_command("greet")
+
+    assert result.exit_code == 1
+    assert "CommandClassLookupError" in result.stderr
+"""
+
+
+def test_pytest_plugin_provides_run_command_fixture(
+    pytester: pytest.Pytester,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange.
+    pytester.makepyfile(plugin_commands=COMMANDS, test_plugin=TESTS)
+
+    # Mock.
+    monkeypatch.setenv(
+        "PYTHONPATH",
+        os.pathsep.join([str(ROOT_DIR), str(ROOT_DIR / "src"), *sys.path]),
+    )
+
+    # Act.
+    result = pytester.runpytest_subprocess(
+        "-p",
+        "management_commands.pytest_plugin",
+        "-p",
+        "no:randomly",
+        "--ds=tests.settings",
+    )
+
+    # Assert.
+    result.assert_outcomes(passed=3)
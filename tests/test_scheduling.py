@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from management_commands.cron import parse_cron_expression
+from management_commands.scheduling import (
+    ScheduledJob,
+    Scheduler,
+    get_scheduled_jobs,
+)
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _job(expression: str, command_expr: str = "command") -> ScheduledJob:
+    return ScheduledJob(expression, parse_cron_expression(expression), command_expr)
+
+
+def test_get_scheduled_jobs_returns_job_for_each_scheduled_command(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.scheduling.settings",
+        SCHEDULE={"* * * * *": ["command_a", "command_b --option"]},
+    )
+
+    # Act.
+    jobs = get_scheduled_jobs()
+
+    # Assert.
+    assert [job.command_expr for job in jobs] == ["command_a", "command_b --option"]
+
+
+def test_scheduler_tick_starts_due_jobs() -> None:
+    # Arrange.
+    calls: list[tuple[str, datetime]] = []
+
+    scheduler = Scheduler(
+        [_job("*/5 * * * *", "command_a"), _job("*/7 * * * *", "command_b")],
+        lambda job, scheduled_at: calls.append((job.command_expr, scheduled_at)),
+        workers=2,
+        misfire_grace_time=timedelta(minutes=1),
+    )
+
+    # Act.
+    events = scheduler.tick(datetime(2026, 1, 1, 0, 10, 30, tzinfo=timezone.utc))
+    scheduler.shutdown()
+
+    # Assert.
+    assert [(event.job.command_expr, event.status) for event in events] == [
+        ("command_a", "started"),
+    ]
+    assert calls == [("command_a", datetime(2026, 1, 1, 0, 10, tzinfo=timezone.utc))]
+
+
+def test_scheduler_tick_skips_job_if_its_previous_run_is_still_running() -> None:
+    # Arrange.
+    release = threading.Event()
+
+    scheduler = Scheduler(
+        [_job("* * * * *")],
+        lambda *_: release.wait(),
+        workers=2,
+        misfire_grace_time=timedelta(minutes=1),
+    )
+
+    # Act.
+    first_events = scheduler.tick(datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc))
+    second_events = scheduler.tick(datetime(2026, 1, 1, 0, 1, tzinfo=timezone.utc))
+    release.set()
+    scheduler.shutdown()
+
+    # Assert.
+    assert [event.status for event in first_events] == ["started"]
+    assert [event.status for event in second_events] == ["skipped"]
+
+
+def test_scheduler_tick_coalesces_missed_runs_and_reports_misfires() -> None:
+    # Arrange.
+    calls: list[tuple[str, datetime]] = []
+
+    scheduler = Scheduler(
+        [_job("*/2 * * * *", "command_a"), _job("0 * * * *", "command_b")],
+        lambda job, scheduled_at: calls.append((job.command_expr, scheduled_at)),
+        workers=1,
+        misfire_grace_time=timedelta(minutes=3),
+    )
+
+    # Act.
+    scheduler.tick(datetime(2026, 1, 1, 0, 55, tzinfo=timezone.utc))
+    events = scheduler.tick(datetime(2026, 1, 1, 1, 5, tzinfo=timezone.utc))
+    scheduler.shutdown()
+
+    # Assert.
+    assert [(event.job.command_expr, event.status) for event in events] == [
+        ("command_a", "started"),
+        ("command_b", "misfired"),
+    ]
+    assert calls[-1] == ("command_a", datetime(2026, 1, 1, 1, 4, tzinfo=timezone.utc))
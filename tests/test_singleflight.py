@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import fcntl
+import os
+import stat
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django.core.management.base import BaseCommand
+
+from management_commands.exceptions import SingleFlightDirectoryError
+from management_commands.singleflight import (
+    SingleFlightResult,
+    get_default_lock_dir,
+    get_single_flight_key,
+    run_single_flight,
+    wrap_single_flight,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_get_single_flight_key_depends_on_command_class_and_argv() -> None:
+    # Arrange.
+    class CommandA(BaseCommand):
+        pass
+
+    class CommandB(BaseCommand):
+        pass
+
+    # Act.
+    key = get_single_flight_key(CommandA, ["--full"])
+
+    # Assert.
+    assert key == get_single_flight_key(CommandA, ["--full"])
+    assert key != get_single_flight_key(CommandA, ["--partial"])
+    assert key != get_single_flight_key(CommandB, ["--full"])
+
+
+def test_run_single_flight_runs_function_if_no_identical_invocation_is_running(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    func = mocker.Mock()
+
+    # Act.
+    run_single_flight(func, "key", mode="wait", lock_dir=str(tmp_path))
+
+    # Assert.
+    func.assert_called_once()
+    assert (tmp_path / "management-commands-key.status").read_text().endswith(" 0")
+
+
+def test_run_single_flight_skips_function_in_skip_mode_if_identical_invocation_is_running(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    func = mocker.Mock()
+
+    # Act.
+    with (tmp_path / "management-commands-key.lock").open("a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        result = run_single_flight(func, "key", mode="skip", lock_dir=str(tmp_path))
+
+    # Assert.
+    assert result == SingleFlightResult("skipped")
+    func.assert_not_called()
+
+
+def test_run_single_flight_waits_in_wait_mode_and_reuses_exit_code_of_identical_invocation(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    started, released = threading.Event(), threading.Event()
+    exit_codes: list[object] = []
+    results: list[SingleFlightResult] = []
+
+    def running_func() -> None:
+        started.set()
+        released.wait()
+        raise SystemExit(3)
+
+    waiting_func = mocker.Mock()
+
+    def target(func: Callable[[], object]) -> None:
+        try:
+            results.append(
+                run_single_flight(func, "key", mode="wait", lock_dir=str(tmp_path)),
+            )
+        except SystemExit as exc:
+            exit_codes.append(exc.code)
+
+    running_thread = threading.Thread(target=target, args=(running_func,))
+    waiting_thread = threading.Thread(target=target, args=(waiting_func,))
+
+    # Act.
+    running_thread.start()
+    started.wait()
+    waiting_thread.start()
+    time.sleep(0.1)
+    released.set()
+    running_thread.join()
+    waiting_thread.join()
+
+    # Assert.
+    waiting_func.assert_not_called()
+    assert exit_codes == [3]
+    assert results == [SingleFlightResult("reused", 3)]
+
+
+def test_run_single_flight_uses_private_directory_of_current_user_by_default(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Mock.
+    mocker.patch(
+        "management_commands.singleflight.tempfile.gettempdir",
+        return_value=str(tmp_path),
+    )
+
+    # Act.
+    run_single_flight(mocker.Mock(), "key", mode="wait")
+
+    # Assert.
+    lock_dir = tmp_path / f"management-commands-{os.getuid()}"
+    assert stat.S_IMODE(lock_dir.stat().st_mode) == 0o700
+    assert (lock_dir / "management-commands-key.status").is_file()
+
+
+def test_get_default_lock_dir_raises_error_if_directory_is_not_private(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    lock_dir = tmp_path / f"management-commands-{os.getuid()}"
+    lock_dir.mkdir()
+    lock_dir.chmod(0o777)
+
+    # Mock.
+    mocker.patch(
+        "management_commands.singleflight.tempfile.gettempdir",
+        return_value=str(tmp_path),
+    )
+
+    # Act & assert.
+    with pytest.raises(SingleFlightDirectoryError):
+        get_default_lock_dir()
+
+
+def test_run_single_flight_does_not_follow_symlinks(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    target_path = tmp_path / "target"
+    target_path.write_text("target")
+
+    status_path = tmp_path / "management-commands-status.status"
+    status_path.symlink_to(target_path)
+    lock_path = tmp_path / "management-commands-lock.lock"
+    lock_path.symlink_to(target_path)
+
+    # Act.
+    run_single_flight(mocker.Mock(), "status", mode="wait", lock_dir=str(tmp_path))
+
+    with pytest.raises(OSError, match="symbolic links"):
+        run_single_flight(mocker.Mock(), "lock", mode="wait", lock_dir=str(tmp_path))
+
+    # Assert.
+    assert target_path.read_text() == "target"
+    assert not status_path.is_symlink()
+
+
+@pytest.mark.parametrize(
+    ("result", "expected_exit_code"),
+    [
+        (SingleFlightResult("skipped"), None),
+        (SingleFlightResult("reused", 0), None),
+        (SingleFlightResult("reused", 3), 3),
+    ],
+)
+def test_wrap_single_flight_exits_only_with_failed_exit_code_of_identical_invocation(
+    mocker: MockerFixture,
+    result: SingleFlightResult,
+    expected_exit_code: int | None,
+) -> None:
+    # Arrange.
+    command = BaseCommand()
+
+    # Mock.
+    mocker.patch(
+        "management_commands.singleflight.run_single_flight",
+        return_value=result,
+    )
+    sys_exit_mock = mocker.patch("management_commands.singleflight.sys.exit")
+
+    # Act.
+    wrap_single_flight(command, "skip")
+    command.run_from_argv(["manage.py", "command"])
+
+    # Assert.
+    if expected_exit_code:
+        sys_exit_mock.assert_called_once_with(expected_exit_code)
+    else:
+        sys_exit_mock.assert_not_called()
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import gc
+import gzip
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from django.core.management.base import BaseCommand
+
+from management_commands.execution import run_command
+from management_commands.spooling import SpooledOutput, iter_output
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_spooled_output_keeps_output_below_threshold_in_memory() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=16)
+
+    # Act.
+    spooled_output.write("line 1\n")
+    spooled_output.write("line 2\n")
+    spooled_output.close()
+
+    # Assert.
+    assert not spooled_output.spooled
+    assert spooled_output.length == 14
+    assert spooled_output.getvalue() == "line 1\nline 2\n"
+
+
+def test_spooled_output_compresses_output_above_threshold_to_file() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=16)
+    lines = [f"line {index}\n" for index in range(10_000)]
+
+    # Act.
+    for line in lines:
+        spooled_output.write(line)
+    spooled_output.close()
+
+    # Assert.
+    path = Path(spooled_output.path or "")
+    assert spooled_output.spooled
+    assert spooled_output.length == len("".join(lines))
+    assert path.stat().st_size < spooled_output.length / 4
+    assert gzip.decompress(path.read_bytes()).decode() == "".join(lines)
+    assert spooled_output.getvalue() == "".join(lines)
+
+
+def test_spooled_output_streams_chunks_while_being_written() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=1)
+
+    # Act.
+    spooled_output.write("zażółć\n")
+    written = "".join(spooled_output.iter_chunks(size=3))
+    spooled_output.write("gęślą jaźń\n")
+    spooled_output.close()
+
+    # Assert.
+    assert written == "zażółć\n"
+    assert "".join(spooled_output.iter_chunks(size=3)) == "zażółć\ngęślą jaźń\n"
+
+
+def test_spooled_output_returns_tail_lines() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=8)
+
+    # Act.
+    for index in range(100):
+        spooled_output.write(f"line {index}\n")
+    spooled_output.write("partial")
+    spooled_output.close()
+
+    # Assert.
+    assert spooled_output.tail(3) == "line 98\nline 99\npartial"
+
+
+def test_spooled_output_removes_file_once_collected() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=1)
+    spooled_output.write("output")
+    spooled_output.close()
+
+    path = Path(spooled_output.path or "")
+
+    # Act.
+    del spooled_output
+    gc.collect()
+
+    # Assert.
+    assert not path.exists()
+
+
+def test_spooled_output_hands_over_file_to_unpickled_copy() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=1)
+    spooled_output.write("output\n")
+
+    path = Path(spooled_output.path or "")
+
+    # Act.
+    spooled_output.hand_over()
+    data = pickle.dumps(spooled_output)
+    del spooled_output
+    gc.collect()
+    unpickled = pickle.loads(data)  # noqa: S301
+
+    # Assert.
+    assert unpickled.closed
+    assert unpickled.path == str(path)
+    assert unpickled.length == len("output\n")
+    assert unpickled.getvalue() == "output\n"
+
+    del unpickled
+    gc.collect()
+
+    assert not path.exists()
+
+
+def test_spooled_output_keeps_file_when_pickled_without_hand_over() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=1)
+    spooled_output.write("output\n")
+    spooled_output.close()
+
+    path = Path(spooled_output.path or "")
+
+    # Act.
+    pickle.dumps(spooled_output)
+    pickle.dumps(spooled_output)
+
+    # Assert.
+    assert path.exists()
+    assert spooled_output.getvalue() == "output\n"
+
+    del spooled_output
+    gc.collect()
+
+    assert not path.exists()
+
+
+def test_spooled_output_gives_each_unpickled_copy_its_own_file() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=1)
+    spooled_output.write("output\n")
+    spooled_output.close()
+
+    data = pickle.dumps(spooled_output)
+
+    # Act.
+    copies = [pickle.loads(data) for _ in range(2)]  # noqa: S301
+    paths = [Path(item.path) for item in [spooled_output, *copies]]
+    del spooled_output
+    gc.collect()
+
+    # Assert.
+    assert len(set(paths)) == 3
+    assert [item.getvalue() for item in copies] == ["output\n", "output\n"]
+
+    del copies
+    gc.collect()
+
+    assert not any(path.exists() for path in paths)
+
+
+def test_spooled_output_cannot_be_pickled_while_spooling() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=1)
+    spooled_output.write("output\n")
+
+    # Act & assert.
+    with pytest.raises(TypeError, match="not closed"):
+        pickle.dumps(spooled_output)
+
+    assert not spooled_output.closed
+
+
+def test_spooled_output_is_pickled_by_value_below_threshold() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=1024)
+    spooled_output.write("output\n")
+
+    # Act.
+    unpickled = pickle.loads(pickle.dumps(spooled_output))  # noqa: S301
+
+    # Assert.
+    assert not spooled_output.closed
+    assert not unpickled.spooled
+    assert unpickled.getvalue() == "output\n"
+
+
+def test_iter_output_yields_chunks_of_strings_and_spooled_outputs() -> None:
+    # Arrange.
+    spooled_output = SpooledOutput(threshold=1)
+    spooled_output.write("spooled")
+    spooled_output.close()
+
+    # Act & assert.
+    assert list(iter_output("")) == []
+    assert list(iter_output("output")) == ["output"]
+    assert "".join(iter_output(spooled_output, size=2)) == "spooled"
+
+
+def test_run_command_spools_output_if_spool_threshold_is_set(
+    mocker: MockerFixture,
+) -> None:
+    # Configure.
+    mocker.patch.multiple(
+        "management_commands.spooling.settings",
+        PATHS={"command": "module.Command"},
+        SPOOL_THRESHOLD=1024,
+    )
+
+    # Arrange.
+    class Command(BaseCommand):
+        def handle(self, *args: Any, **options: Any) -> None:
+            for index in range(1000):
+                self.stdout.write(f"line {index}")
+
+    # Mock.
+    mocker.patch(
+        "management_commands.core.import_string",
+        return_value=Command,
+    )
+
+    # Act.
+    result = run_command("command")
+
+    # Assert.
+    assert isinstance(result.stdout, SpooledOutput)
+    assert result.stdout.spooled
+    assert result.stdout.tail(1) == "line 999\n"
+    assert isinstance(result.stderr, SpooledOutput)
+    assert result.stderr.length == 0
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from management_commands.suggestions import NGramIndex
+
+NAMES = ["check", "echo", "makemigrations", "migrate", "showmigrations", "sqlmigrate"]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected_suggestions"),
+    [
+        ("ecko", ["echo", "check"]),
+        ("migrat", ["migrate", "sqlmigrate"]),
+        ("MIGRATE", ["migrate", "sqlmigrate"]),
+        ("xyzzy", []),
+    ],
+)
+def test_ngram_index_search_returns_closest_names(
+    query: str,
+    expected_suggestions: list[str],
+) -> None:
+    # Arrange.
+    index = NGramIndex(NAMES)
+
+    # Act.
+    suggestions = index.search(query, limit=2)
+
+    # Assert.
+    assert suggestions == expected_suggestions
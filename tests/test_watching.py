@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+from importlib.machinery import ModuleSpec
+from io import StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from management_commands.commands.map import Command as MapCommand
+from management_commands.watching import (
+    Watcher,
+    get_command_paths,
+    get_modules_by_paths,
+    get_restart_paths,
+    get_watched_paths,
+    reload_modules,
+    restart,
+)
+
+if TYPE_CHECKING:
+    import pytest
+    from pytest_mock import MockerFixture
+
+
+def test_watcher_poll_returns_modified_and_deleted_paths(tmp_path: Path) -> None:
+    # Arrange.
+    path_a = tmp_path / "a.py"
+    path_a.write_text("")
+    path_b = tmp_path / "b.py"
+    path_b.write_text("")
+    path_c = tmp_path / "c.py"
+    path_c.write_text("")
+
+    watcher = Watcher([path_a, path_b, path_c])
+
+    # Act.
+    unchanged = watcher.poll()
+    os.utime(path_a, ns=(0, 0))
+    path_b.unlink()
+    changed = watcher.poll()
+
+    # Assert.
+    assert unchanged == set()
+    assert changed == {path_a, path_b}
+
+
+def test_get_watched_paths_includes_command_module_and_settings_module() -> None:
+    # Act.
+    paths = get_watched_paths(MapCommand)
+
+    # Assert.
+    assert Path(sys.modules[MapCommand.__module__].__file__ or "").resolve() in paths
+    assert get_restart_paths() <= paths
+    assert Path(sys.modules["tests.settings"].__file__ or "").resolve() in paths
+
+
+def test_get_command_paths_returns_only_command_modules() -> None:
+    # Act.
+    paths = get_command_paths([MapCommand])
+
+    # Assert.
+    assert paths == {Path(sys.modules[MapCommand.__module__].__file__ or "").resolve()}
+
+
+def test_reload_modules_reloads_modules_of_changed_paths(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange.
+    path = tmp_path / "watched_module.py"
+    path.write_text("VALUE = 1\n")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "watched_module", raising=False)
+    module = importlib.import_module("watched_module")
+
+    # Act.
+    path.write_text("VALUE = 2\n")
+    os.utime(path, ns=(0, 0))
+    module_names = get_modules_by_paths([path.resolve()])
+    reloaded = reload_modules(module_names, stderr=StringIO())
+
+    # Assert.
+    assert reloaded
+    assert module_names == ["watched_module"]
+    assert module.VALUE == 2
+
+
+def test_reload_modules_reports_broken_module_and_reloads_it_once_fixed(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange.
+    path = tmp_path / "watched_module.py"
+    path.write_text("VALUE = 1\n")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "watched_module", raising=False)
+    module = importlib.import_module("watched_module")
+    stderr = StringIO()
+
+    # Act.
+    path.write_text("VALUE = (\n")
+    os.utime(path, ns=(0, 0))
+    broken_reloaded = reload_modules(["watched_module"], stderr=stderr)
+
+    path.write_text("VALUE = 3\n")
+    os.utime(path, ns=(1, 1))
+    fixed_reloaded = reload_modules(["watched_module"], stderr=StringIO())
+
+    # Assert.
+    assert not broken_reloaded
+    assert "SyntaxError" in stderr.getvalue()
+    assert fixed_reloaded
+    assert module.VALUE == 3
+
+
+def test_restart_reruns_process_started_as_module(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange.
+    main_module = SimpleNamespace(
+        __spec__=ModuleSpec("management_commands.__main__", None),
+    )
+
+    monkeypatch.setitem(sys.modules, "__main__", main_module)
+    monkeypatch.setattr(sys, "argv", ["__main__.py", "watch", "command"])
+
+    # Mock.
+    execv_mock = mocker.patch("management_commands.watching.os.execv")
+
+    # Act.
+    restart()
+
+    # Assert.
+    executable, argv = execv_mock.call_args.args
+    assert executable == sys.executable
+    assert argv[0] == sys.executable
+    assert argv[-4:] == ["-m", "management_commands", "watch", "command"]